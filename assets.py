@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Paket aset teks cerita untuk The Mystery Adventure Bot.
+
+Seluruh cerita disimpan di satu file: header, indeks offset berukuran
+tetap, struktur graf scene, lalu semua teks cerita (op say, print dan
+printf) dalam UTF-8 berurutan:
+
+    magic "MAP", versi, jumlah teks, CRC32 indeks dan graf, lebar format,
+    jumlah entri, panjang graf, panjang teks
+    (offset, panjang, nomor versi terformat) x jumlah entri    struct "<III"
+    nama item, quest dan lokasi, lalu graf scene (marshal); teks cerita
+    di dalamnya diganti nomor teksnya
+    teks UTF-8 ...
+
+Teks say juga disimpan dalam bentuk siap tulis (format_block) untuk lebar
+format dan locale "C", yaitu tampilan sesi server. Jika sama dengan teks
+aslinya, entri itu menunjuk ke dirinya sendiri.
+
+File dibuka dengan mmap. Graf dari paket (AssetPack.load_graph()) dibuat
+tanpa memuat scenes.py dan hanya menyimpan PackedText, yaitu nomor teks di
+paket. Di lebar format, RenderCache tidak menyimpan salinan teks: teks
+di-decode langsung dari mmap saat ditulis ke sink, jadi semua worker
+server memakai page cache yang sama dan tidak ada salinan teks di heap
+masing-masing. Membuka paket hanya memeriksa header, indeks dan graf dengan
+CRC32 di header; teks cerita tidak dibaca sama sekali.
+
+    python assets.py story.pack [LEBAR]
+"""
+
+import marshal
+import mmap
+import os
+import struct
+import zlib
+from typing import Dict, List, Optional
+
+from scenegraph import IF, PRINT, PRINTF, SAY, Choice, Scene, SceneGraph, default_graph
+from state import ITEMS, LOCATIONS, QUESTS
+from textcache import format_block
+
+MAGIC = b"MAP"
+VERSION = 2
+
+# magic, versi, jumlah teks asli, CRC32 indeks dan graf, lebar format,
+# jumlah entri, panjang graf, panjang teks
+_HEADER = struct.Struct("<3sBIIHIII")
+# offset dari awal data teks, panjang dalam byte, nomor entri terformat
+_ENTRY = struct.Struct("<III")
+
+# Op yang argumen pertamanya teks cerita
+TEXT_OPS = (SAY, PRINT, PRINTF)
+
+
+class AssetError(ValueError):
+    """File paket rusak, versinya tidak dikenal, atau dari cerita yang berbeda"""
+
+
+def story_texts(graph: Optional[SceneGraph] = None) -> List[str]:
+    """Teks cerita unik di graf, urut sesuai kemunculannya"""
+    return list(_story_texts(graph or default_graph()))
+
+
+def _story_texts(graph: SceneGraph) -> Dict[str, bool]:
+    """Teks cerita unik -> apakah dipakai oleh op say"""
+    texts: Dict[str, bool] = {}
+    for scene in graph.scenes:
+        stack = list(scene.enter)
+        if scene.revisit is not scene.enter:
+            stack.extend(scene.revisit)
+        for choice in scene.choices:
+            stack.extend(choice.ops)
+        stack.reverse()
+        while stack:
+            code, args = stack.pop()
+            if code in TEXT_OPS:
+                texts[args[0]] = texts.get(args[0], False) or code == SAY
+            elif code == IF:
+                stack.extend(reversed(args[2]))
+                stack.extend(reversed(args[1]))
+    return texts
+
+
+def _map_ops(ops, text) -> tuple:
+    """`ops` dengan argumen teks setiap op teks diganti text(argumen)"""
+    mapped = []
+    for code, args in ops:
+        if code in TEXT_OPS:
+            args = (text(args[0]),) + args[1:]
+        elif code == IF:
+            args = (args[0], _map_ops(args[1], text), _map_ops(args[2], text))
+        mapped.append((code, args))
+    return tuple(mapped)
+
+
+def _encode_graph(graph: SceneGraph, numbers: Dict[str, int]) -> bytes:
+    scenes = tuple(
+        (scene.id, _map_ops(scene.enter, numbers.__getitem__),
+         # None: revisit sama dengan enter
+         None if scene.revisit is scene.enter else _map_ops(scene.revisit, numbers.__getitem__),
+         tuple((choice.label, _map_ops(choice.ops, numbers.__getitem__), choice.next)
+               for choice in scene.choices),
+         scene.next, scene.prompt, scene.default)
+        for scene in graph.scenes)
+    registries = tuple(tuple(registry.names) for registry in (ITEMS, QUESTS, LOCATIONS))
+    return marshal.dumps((registries, scenes))
+
+
+def build(path: str, graph: Optional[SceneGraph] = None, width: int = 80) -> int:
+    """Menulis paket aset untuk `graph` secara atomik; mengembalikan jumlah teks"""
+    graph = graph or default_graph()
+    texts = _story_texts(graph)
+    blobs = [text.encode("utf-8") for text in texts]
+    formatted = []
+    for i, (text, said) in enumerate(texts.items()):
+        block = format_block(text, width) if said else text
+        if block == text:
+            formatted.append(i)
+        else:
+            formatted.append(len(blobs))
+            blobs.append(block.encode("utf-8"))
+    index = bytearray()
+    offset = 0
+    for i, blob in enumerate(blobs):
+        index += _ENTRY.pack(offset, len(blob), formatted[i] if i < len(texts) else i)
+        offset += len(blob)
+    structure = _encode_graph(graph, {text: i for i, text in enumerate(texts)})
+    checksum = zlib.crc32(structure, zlib.crc32(index))
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "wb") as out:
+        out.write(_HEADER.pack(MAGIC, VERSION, len(texts), checksum, width, len(blobs),
+                               len(structure), offset))
+        out.write(index)
+        out.write(structure)
+        out.writelines(blobs)
+    os.replace(temp, path)
+    return len(texts)
+
+
+class PackedText:
+    """Teks cerita di dalam paket aset; str() men-decode-nya"""
+    __slots__ = ("pack", "index", "formatted_index")
+
+    def __init__(self, pack: "AssetPack", index: int):
+        self.pack = pack
+        self.index = index
+        self.formatted_index = pack.formatted_index(index)
+
+    def view(self) -> memoryview:
+        """Byte UTF-8 teks ini, langsung dari mmap tanpa disalin"""
+        return self.pack.view(self.index)
+
+    def formatted(self, width: int, locale: str) -> Optional[str]:
+        """Teks siap tulis dari paket, None jika paket tidak dibuat untuk lebar ini"""
+        if width != self.pack.width or locale != "C":
+            return None
+        return str(self.pack.view(self.formatted_index), "utf-8")
+
+    def __str__(self) -> str:
+        return str(self.pack.view(self.index), "utf-8")
+
+    def format(self, *args, **kwargs) -> str:
+        return str(self).format(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"PackedText({self.index})"
+
+
+class AssetPack:
+    """Paket aset yang dibuka dengan mmap (read-only)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as source:
+            try:
+                self._map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise AssetError(f"{path}: file kosong") from None
+        self._data = memoryview(self._map)
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise AssetError(f"{path}: header terpotong")
+        magic, version, count, self.checksum, self.width, entries, structure, size = \
+            _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise AssetError(f"{path}: bukan paket aset versi {VERSION}")
+        self.count = count
+        self._entries = entries
+        self._structure = _HEADER.size + entries * _ENTRY.size
+        self._base = self._structure + structure
+        if (len(self._map) != self._base + size or count > entries
+                or zlib.crc32(self._data[_HEADER.size:self._base]) != self.checksum):
+            self.close()
+            raise AssetError(f"{path}: paket rusak")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _entry(self, index: int):
+        if not 0 <= index < self._entries:
+            raise IndexError(index)
+        return _ENTRY.unpack_from(self._data, _HEADER.size + index * _ENTRY.size)
+
+    def view(self, index: int) -> memoryview:
+        """Byte UTF-8 entri nomor `index`, tanpa disalin"""
+        offset, length, _ = self._entry(index)
+        start = self._base + offset
+        return self._data[start:start + length]
+
+    def text(self, index: int) -> str:
+        return str(self.view(index), "utf-8")
+
+    def formatted_index(self, index: int) -> int:
+        """Nomor entri teks `index` dalam bentuk siap tulis di lebar paket"""
+        return self._entry(index)[2]
+
+    def load_graph(self) -> SceneGraph:
+        """Graf scene dari paket, dengan teks cerita berupa PackedText.
+
+        Id item, quest dan lokasi di paket didaftarkan ke registry state.py
+        dan harus sama dengan id yang sudah ada di sana.
+        """
+        try:
+            registries, scenes = marshal.loads(self._data[self._structure:self._base])
+        except (EOFError, ValueError, TypeError):
+            raise AssetError(f"{self.path}: graf di paket rusak") from None
+        for registry, names in zip((ITEMS, QUESTS, LOCATIONS), registries):
+            for ident, name in enumerate(names):
+                if registry.id(name) != ident:
+                    raise AssetError(f"{self.path}: id {name!r} berbeda dengan state.py")
+        refs = [PackedText(self, i) for i in range(self.count)]
+        built = []
+        for i, (scene_id, enter, revisit, choices, target, prompt, default) in enumerate(scenes):
+            enter = _map_ops(enter, refs.__getitem__)
+            choices = tuple(Choice(label, _map_ops(ops, refs.__getitem__), choice_target)
+                            for label, ops, choice_target in choices)
+            built.append(Scene(
+                index=i,
+                id=scene_id,
+                enter=enter,
+                # Tanpa teks ringkas revisit tetap objek yang sama dengan enter
+                revisit=enter if revisit is None else _map_ops(revisit, refs.__getitem__),
+                choices=choices,
+                labels=tuple(choice.label for choice in choices),
+                next=target,
+                prompt=prompt,
+                default=default,
+            ))
+        return SceneGraph(tuple(built))
+
+    def close(self):
+        """Menutup mmap; view dari view() tidak boleh dipakai lagi"""
+        if self._map is not None:
+            self._data.release()
+            self._map.close()
+            self._map = self._data = None
+
+
+if __name__ == "__main__":
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "story.pack"
+    count = build(path, width=int(sys.argv[2]) if len(sys.argv) > 2 else 80)
+    print(f"{path}: {count} teks, {os.path.getsize(path):,} byte")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark paket aset: waktu buka, lookup teks dan cerita di heap worker.
+
+Untuk melihat pengaruh ukuran cerita, semua teks say/print dilipatgandakan
+`--scale` kali sebelum dikompilasi. Dicatat waktu membuka paket (mmap),
+memuat graf dari paket dan mengompilasi tabel scene, biaya view() (tanpa
+salin) dan str(), lalu heap yang dipakai cerita di sebuah proses worker
+baru setelah memainkan rute ENDING TERBAIK: sekali dengan graf dari tabel
+scene dan sekali dengan graf dari paket. Heap diukur sejak sebelum cerita
+dimuat, jadi tabel scene, graf dan teks di RenderCache ikut terhitung.
+Dengan paket, scenes.py tidak dimuat dan teks hanya ada di page cache yang
+dipakai bersama oleh semua worker.
+
+    python benchmarks/bench_assets.py [--scale N ...] [--players N]
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Modul permainan diimpor di dalam fungsi: proses worker (spawn) mengimpor
+# ulang modul ini, dan heap-nya harus diukur sebelum cerita dimuat.
+
+ROUTE = [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1]
+
+
+def scale_ops(ops, scale: int) -> list:
+    scaled = []
+    for op in ops:
+        if op[0] in ("say", "print"):
+            op = (op[0], op[1] * scale) + tuple(op[2:])
+        elif op[0] == "if":
+            op = ("if", op[1], scale_ops(op[2], scale), scale_ops(op[3], scale))
+        scaled.append(op)
+    return scaled
+
+
+def scaled_table(scale: int) -> dict:
+    from scenes import SCENES
+    table = {}
+    for scene_id, spec in SCENES.items():
+        spec = dict(spec)
+        spec["enter"] = scale_ops(spec.get("enter", ()), scale)
+        if "revisit" in spec:
+            spec["revisit"] = scale_ops(spec["revisit"], scale)
+        spec["choices"] = [choice if len(choice) == 2
+                           else (choice[0], scale_ops(choice[1], scale), choice[2])
+                           for choice in spec.get("choices", ())]
+        table[scene_id] = spec
+    return table
+
+
+def worker_heap(scale: int, pack_path: str, players: int) -> float:
+    """Heap (KB) di proses ini untuk cerita skala `scale` setelah `players`
+    pemain selesai; dengan `pack_path` graf dimuat dari paket"""
+    from main import MysteryAdventureBot
+    from sessions import SessionManager
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    if pack_path:
+        from assets import AssetPack
+        graph = AssetPack(pack_path).load_graph()
+    else:
+        from scenegraph import SceneGraph
+        from scenes import START_SCENE
+        # Seperti worker yang scenes.py-nya berisi cerita skala ini: tabel
+        # yang dilipatgandakan tetap hidup, tabel aslinya tidak
+        table = scaled_table(scale)
+        del sys.modules["scenes"]
+        graph = SceneGraph.compile(table, START_SCENE)
+    manager = SessionManager(bot_factory=lambda key, renderer, terminal:
+                             MysteryAdventureBot(renderer, terminal, graph=graph))
+    for key in range(players):
+        manager.start(key)
+        for choice in ROUTE:
+            manager.send(key, str(choice))
+    del manager
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    if pack_path and "scenes" in sys.modules:
+        raise RuntimeError("graf dari paket memuat scenes.py")
+    return retained / 1024
+
+
+def spawned_heap(scale: int, pack_path: str, players: int) -> float:
+    """worker_heap() di proses worker baru"""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(worker_heap, (scale, pack_path, players))
+
+
+def timed(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    from assets import AssetPack, build
+    from scenegraph import SceneGraph
+    from scenes import START_SCENE
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--players", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'skala':>5} {'paket':>9} {'buka':>8} {'graf':>8} {'kompilasi':>10} "
+          f"{'view()':>8} {'str()':>8} {'heap tabel':>11} {'heap paket':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in args.scale:
+            table = scaled_table(scale)
+            compile_time = timed(lambda: SceneGraph.compile(table, START_SCENE), 3)
+            path = os.path.join(directory, f"story{scale}.pack")
+            build(path, SceneGraph.compile(table, START_SCENE))
+
+            open_time = timed(lambda: AssetPack(path).close(), 1000)
+            pack = AssetPack(path)
+            load_time = timed(pack.load_graph, 3)
+            longest = max(range(len(pack)), key=lambda i: len(pack.view(i)))
+            view_time = timed(lambda: pack.view(longest), 100000)
+            str_time = timed(lambda: pack.text(longest), 10000)
+            pack.close()
+
+            heap = spawned_heap(scale, None, args.players)
+            packed = spawned_heap(scale, path, args.players)
+            print(f"{scale:>5} {os.path.getsize(path) / 1024:>7.0f}KB "
+                  f"{open_time * 1e6:>6.1f}µs {load_time * 1e3:>6.1f}ms "
+                  f"{compile_time * 1e3:>8.1f}ms {view_time * 1e9:>6.0f}ns "
+                  f"{str_time * 1e6:>6.1f}µs {heap:>9.1f}KB {packed:>9.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
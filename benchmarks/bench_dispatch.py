@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark dispatcher scene: 100.000 perpindahan scene dalam satu sesi.
+
+Rute Desa -> Pasar -> Desa -> Makam Tua -> Desa dimainkan berulang-ulang
+tanpa efek mengetik dan tanpa clear screen. Selama sesi berjalan, kedalaman
+stack dan pemakaian memori dicatat secara berkala untuk memastikan keduanya
+tetap datar (sisa pertumbuhan kecil berasal dari daftar sampel itu sendiri).
+
+    python benchmarks/bench_dispatch.py [--transitions N]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import NullStream, ScriptedInput
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from terminal import AnsiTerminal
+
+# Pilihan yang membentuk satu putaran rute di atas. Rute ini sengaja tidak
+# mengambil item apa pun agar pertumbuhan memori hanya berasal dari engine.
+ROUTE = [2, 5, 3, 2]
+
+
+def _stack_depth() -> int:
+    depth, frame = 0, sys._getframe(1)
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+class BenchBot(MysteryAdventureBot):
+    """Bot tanpa output yang berhenti setelah sejumlah perpindahan scene"""
+
+    def __init__(self, transitions: int, sample_every: int = 10000):
+        terminal = AnsiTerminal(NullStream(), enabled=False,
+                                read_line=ScriptedInput(itertools.cycle(ROUTE)))
+        super().__init__(TypewriterRenderer(stream=terminal, instant=True), terminal)
+        self.limit = transitions
+        # Sesi yang lebih pendek dari interval tetap mendapat sampel di akhir
+        self.sample_every = max(1, min(sample_every, transitions))
+        self.transitions = 0
+        self.samples = []
+
+    def clear_screen(self):
+        pass
+
+    def slow_print(self, text: str, delay: float = 0.03):
+        pass
+
+    def play_scene(self, index):
+        self.transitions += 1
+        if self.transitions % self.sample_every == 0:
+            memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+            self.samples.append((self.transitions, _stack_depth(), memory))
+        if self.transitions >= self.limit:
+            self.game_over = True
+        return (yield from super().play_scene(index))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transitions", type=int, default=100000)
+    args = parser.parse_args()
+    if args.transitions < 1:
+        parser.error("--transitions minimal 1")
+
+    bot = BenchBot(args.transitions)
+    start = time.perf_counter()
+    bot.play()
+    elapsed = time.perf_counter() - start
+    print(f"{bot.transitions} perpindahan scene dalam {elapsed:.3f} s "
+          f"({bot.transitions / elapsed:,.0f} scene/s)")
+
+    tracemalloc.start()
+    bot = BenchBot(args.transitions)
+    bot.play()
+    tracemalloc.stop()
+
+    print(f"\n{'scene':>10} {'stack':>6} {'memori (B)':>12}")
+    for transitions, depth, memory in bot.samples:
+        print(f"{transitions:>10} {depth:>6} {memory:>12}")
+    depths = {depth for _, depth, _ in bot.samples}
+    if not depths:
+        sys.exit("tidak ada sampel kedalaman stack")
+    print(f"\nKedalaman stack: {'konstan' if len(depths) == 1 else 'BERUBAH'} ({sorted(depths)})")
+
+
+if __name__ == "__main__":
+    main()
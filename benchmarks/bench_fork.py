@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark percabangan state: fork() vs deepcopy di setiap titik pilihan.
+
+Di setiap titik pilihan rute ENDING TERBAIK, state dicabangkan ke semua
+pilihannya lalu dimajukan sampai titik pilihan berikutnya (advance()).
+Salinan dibuat dengan GameState.fork() dan dengan deepcopy. Biaya
+menyalin state saja juga dibandingkan dengan deepcopy state lama (list
+inventory dan set quest/lokasi, lihat bench_state.py).
+
+    python benchmarks/bench_fork.py [--repeat N]
+"""
+
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_state import make_legacy
+from headless import SilentBot, advance
+from state import GameState
+
+ROUTE = [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1]
+
+
+def choice_points(bot: SilentBot):
+    """State di setiap titik pilihan rute, beserta jumlah pilihannya"""
+    session = bot.session()
+    next(session)
+    points = []
+    for choice in ROUTE:
+        points.append((bot.state.fork(), len(bot.graph[bot.state.scene].choices)))
+        try:
+            session.send(str(choice))
+        except StopIteration:
+            break
+    return points
+
+
+def fork_state(bot, state: GameState, choice: int):
+    return advance(bot, state, choice)
+
+
+def deepcopy_state(bot, state: GameState, choice: int):
+    # advance() memanggil fork() pada salinan; biayanya ikut dihitung di baris fork
+    return advance(bot, copy.deepcopy(state), choice)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    bot = SilentBot()
+    points = choice_points(bot)
+    branches = sum(count for _, count in points)
+
+    n = 100000
+    state = points[len(points) // 2][0]
+    legacy = make_legacy(7)
+    for name, make_copy in (("fork()", state.fork),
+                            ("deepcopy(state)", lambda: copy.deepcopy(state)),
+                            ("deepcopy(lama)", lambda: copy.deepcopy(legacy))):
+        start = time.perf_counter()
+        for _ in range(n):
+            make_copy()
+        print(f"salin {name:<16} {(time.perf_counter() - start) / n * 1e9:>8,.0f} ns")
+
+    print(f"\n{len(points)} titik pilihan, {branches} cabang per putaran")
+    print(f"{'cara':<18} {'cabang/s':>10} {'µs/cabang':>10}")
+    for name, branch in (("fork()", fork_state), ("deepcopy(state)", deepcopy_state)):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for state, count in points:
+                for choice in range(1, count + 1):
+                    branch(bot, state, choice)
+        elapsed = time.perf_counter() - start
+        rate = args.repeat * branches / elapsed
+        print(f"{name:<18} {rate:>10,.0f} {1e6 / rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
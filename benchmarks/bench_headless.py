@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark mode headless: jumlah playthrough lengkap per detik (satu core).
+
+    python benchmarks/bench_headless.py [--runs N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import run_headless
+
+# Skrip pilihan untuk setiap ending
+ROUTES = {
+    "ENDING TERBAIK": [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1],
+    "ENDING NETRAL": [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 2],
+    "ENDING BURUK": [3, 1, 2, 4, 2, 4, 5, 2, 2, 1],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5000)
+    args = parser.parse_args()
+
+    for name, route in ROUTES.items():
+        assert run_headless(route)["ending_type"].startswith(name)
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            run_headless(route)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16} {args.runs / elapsed:>10,.0f} playthrough/s "
+              f"({elapsed / args.runs * 1e6:.0f} µs per playthrough)")
+
+
+if __name__ == "__main__":
+    main()
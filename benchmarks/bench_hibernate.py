@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark hibernasi sesi: hit rate, latensi pemulihan dan sesi per GB.
+
+Memori per sesi diukur dengan tracemalloc untuk sesi di memori dan untuk
+sesi yang dihibernasi (hanya indeks slot yang tersisa di memori). Lalu
+`--sessions` pemain dilayani dengan batas `--resident` sesi di memori;
+pemain dipilih dengan distribusi miring (sebagian kecil pemain sangat
+aktif, sisanya jarang menjawab) dan masing-masing memainkan rute ending
+berulang-ulang.
+
+    python benchmarks/bench_hibernate.py [--sessions N] [--resident N] [--turns N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sessions import HibernationStore, SessionManager
+
+ROUTES = [
+    [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1],
+    [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 2],
+    [3, 1, 2, 4, 2, 4, 5, 2, 2, 1],
+]
+
+
+def bytes_per_session(manager: SessionManager, sessions: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for key in range(sessions):
+        manager.start(key)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / sessions
+
+
+def percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=100000)
+    parser.add_argument("--resident", type=int, default=10000)
+    parser.add_argument("--turns", type=int, default=300000)
+    parser.add_argument("--skew", type=float, default=3.0,
+                        help="semakin besar, semakin sedikit pemain yang aktif")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        sample = 5000
+        resident = bytes_per_session(SessionManager(), sample)
+        store = HibernationStore(os.path.join(directory, "ukur.slots"))
+        hibernated = bytes_per_session(SessionManager(store, 0), sample)
+        store.close()
+        print(f"memori per sesi : {resident / 1024:.1f} KB di memori, "
+              f"{hibernated:.0f} B dihibernasi (+{store.slot_size} B di disk)")
+        print(f"sesi per GB RAM : {2**30 / resident:,.0f} di memori, "
+              f"{2**30 / hibernated:,.0f} dihibernasi")
+
+        store = HibernationStore(os.path.join(directory, "sesi.slots"))
+        manager = SessionManager(store, args.resident)
+        rng = random.Random(0)
+        position = [0] * args.sessions
+        for key in range(args.sessions):
+            manager.start(key)
+        manager.hits = manager.restores = 0
+        manager.restore_times.clear()
+
+        start = time.perf_counter()
+        for _ in range(args.turns):
+            key = int(args.sessions * rng.random() ** args.skew)
+            route = ROUTES[key % len(ROUTES)]
+            _, finished = manager.send(key, str(route[position[key]]))
+            position[key] += 1
+            if finished:
+                position[key] = 0
+                manager.start(key)
+        elapsed = time.perf_counter() - start
+        store.close()
+
+    times = manager.restore_times
+    print(f"\n{args.sessions:,} sesi, {args.resident:,} di memori, {args.turns:,} giliran "
+          f"({args.turns / elapsed:,.0f} giliran/s)")
+    print(f"hit rate        : {manager.hits / (manager.hits + manager.restores):.1%} "
+          f"({manager.restores:,} dipulihkan dari disk)")
+    if times:
+        print(f"latensi pulih   : p50 {percentile(times, 0.50) * 1e6:.0f} µs  "
+              f"p99 {percentile(times, 0.99) * 1e6:.0f} µs  "
+              f"p99.9 {percentile(times, 0.999) * 1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark petunjuk rute (hints.py): membangun tabel untuk seluruh ruang state dan waktu per hint().
+
+Tabel rute ke ENDING TERBAIK dibangun dari awal permainan, sekali untuk
+mengukur waktu CPU dan sekali dengan tracemalloc untuk mengukur memori
+yang tetap dipakai cache. Lalu hint() dipanggil untuk state dari sesi
+acak (titik pilihan setelah sejumlah pilihan acak), dalam giliran dan
+dalam energi; tanpa cache setiap petunjuk harus membangun tabel lagi.
+
+    python benchmarks/bench_hints.py [--states N] [--repeat N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import SilentBot
+from hints import COSTS, RouteSolver
+
+
+def sample(count: int, seed: int):
+    """State di titik pilihan dari `count` sesi acak yang belum selesai"""
+    rng = random.Random(seed)
+    states = []
+    while len(states) < count:
+        bot = SilentBot()
+        session = bot.session()
+        next(session)
+        try:
+            for _ in range(rng.randrange(40)):
+                choices = bot.graph[bot.state.scene].choices
+                session.send(str(rng.randrange(len(choices)) + 1))
+        except StopIteration:
+            continue
+        states.append(bot.state)
+    return states
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--states", type=int, default=1000, help="jumlah state yang diberi petunjuk")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.process_time()
+    solver = RouteSolver()
+    build = time.process_time() - start
+    print(f"{len(solver):,} state, {solver.transitions:,} transisi, "
+          f"dibangun dalam {build:.2f}s CPU")
+
+    tracemalloc.start()
+    traced = RouteSolver()
+    cache = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"memori cache {cache[0] / 2**20:.1f} MiB ({cache[0] / len(traced):.0f} byte/state), "
+          f"puncak saat membangun {cache[1] / 2**20:.1f} MiB")
+    del traced
+
+    states = sample(args.states, args.seed)
+    for state in states:
+        # State di luar tabel dijelajahi sekali saat pertama diminta
+        solver.hint(state)
+    print(f"{len(states):,} state dari sesi acak")
+    print(f"{'biaya':<8} {'per hint':>10} {'tanpa cache':>12} {'rata-rata rute':>15}")
+    for cost in COSTS:
+        hints = [solver.hint(state, cost) for state in states]
+        start = time.process_time()
+        for _ in range(args.repeat):
+            for state in states:
+                solver.hint(state, cost)
+        per_hint = (time.process_time() - start) / (args.repeat * len(states))
+        route = sum(len(hint.route) for hint in hints if hint) / sum(1 for hint in hints if hint)
+        print(f"{cost:<8} {per_hint * 1e6:>8.1f}µs {build:>11.2f}s {route:>12.1f} giliran")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uji beban sesi menganggur: 10.000 koneksi yang sebagian besar tidak menjawab.
+
+Server berjalan di proses terpisah dengan IdlePolicy tertentu. Sebagian
+kecil klien memainkan rute ENDING TERBAIK dengan jeda seperti pemain
+sungguhan; sisanya tersambung lalu diam selamanya. Dicatat RSS server
+(puncak dan akhir), berapa sesi diam yang dilepas, dan apakah semua
+pemain aktif tetap selesai.
+
+Benchmark gagal (exit code 1) jika RSS puncak server melewati --max-rss,
+jika policy timeout tidak melepas semua sesi diam atau policy maks diam
+menyisakan lebih dari batasnya, atau jika ada pemain aktif yang tidak
+sampai ending.
+
+    python benchmarks/bench_idle.py [--sessions N] [--active N] [--timeout DETIK]
+                                    [--max-rss MB]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_server import ROUTE, read_prompt, rss_kb
+from server import GameServer, IdlePolicy
+
+
+def run_server(port_pipe, turn_timeout, max_idle):
+    async def main():
+        server = GameServer(port=0, idle=IdlePolicy(turn_timeout, max_idle), tick=0.25)
+        await server.start()
+        port_pipe.send(server.port)
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+async def idle_client(port, connected, evicted):
+    """Tersambung lalu tidak pernah menjawab"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    await read_prompt(reader)
+    connected.append(1)
+    while await reader.read(65536):
+        pass
+    evicted.append(1)
+    writer.close()
+
+
+async def active_client(port, think, latencies, finished):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    await read_prompt(reader)
+    for turn, choice in enumerate(ROUTE, 1):
+        await asyncio.sleep(think)
+        start = time.perf_counter()
+        writer.write(f"{choice}\n".encode())
+        if not await read_prompt(reader):
+            # Setelah pilihan terakhir server mengirim layar akhir lalu menutup koneksi
+            if turn == len(ROUTE):
+                finished.append(1)
+            break
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def bench(port, pid, sessions, active, think, duration):
+    connected, evicted, latencies, finished = [], [], [], []
+    base = peak = rss_kb(pid)
+    tasks = []
+    for _ in range(sessions - active):
+        tasks.append(asyncio.create_task(idle_client(port, connected, evicted)))
+        if len(tasks) % 500 == 0:
+            await asyncio.sleep(0)  # jangan membanjiri backlog listen
+    # Pemain aktif datang setelah sesi diam menumpuk (atau mulai dilepas)
+    while len(connected) + len(evicted) < len(tasks) * 0.9:
+        peak = max(peak, rss_kb(pid))
+        await asyncio.sleep(0.1)
+    for _ in range(active):
+        tasks.append(asyncio.create_task(active_client(port, think, latencies, finished)))
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        peak = max(peak, rss_kb(pid))
+        await asyncio.sleep(0.1)
+    final = rss_kb(pid)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    latencies.sort()
+    return {
+        "peak_mb": (peak - base) / 1024,
+        "final_mb": (final - base) / 1024,
+        "evicted": len(evicted),
+        "finished": len(finished),
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000 if latencies else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--active", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=3.0, help="turn timeout server (detik)")
+    parser.add_argument("--think", type=float, default=0.3, help="jeda pemain aktif per giliran")
+    parser.add_argument("--max-rss", type=float, default=128.0, metavar="MB",
+                        help="batas kenaikan RSS puncak server untuk setiap policy")
+    args = parser.parse_args()
+
+    duration = max(args.timeout * 2, args.think * len(ROUTE)) + 1
+    idle = args.sessions - args.active
+    max_idle = args.sessions // 5
+    # (nama, turn timeout, maks sesi diam, sesi diam yang minimal harus dilepas)
+    policies = [
+        ("tanpa batas", None, None, 0),
+        (f"timeout {args.timeout:g}s", args.timeout, None, idle),
+        (f"maks {max_idle} diam", None, max_idle, idle - max_idle),
+    ]
+    print(f"{args.sessions} sesi, {args.active} aktif, diamati {duration:.0f}s "
+          f"setelah sesi diam tersambung")
+    print(f"{'policy':<16} {'RSS puncak':>11} {'RSS akhir':>10} {'dilepas':>8} "
+          f"{'aktif selesai':>14} {'p99 ms':>7}")
+    failures = []
+    for name, turn_timeout, max_idle, must_evict in policies:
+        # spawn: server tidak mewarisi heap klien dari run sebelumnya
+        context = multiprocessing.get_context("spawn")
+        parent, child = context.Pipe()
+        process = context.Process(target=run_server, daemon=True,
+                                  args=(child, turn_timeout, max_idle))
+        process.start()
+        port = parent.recv()
+        try:
+            result = asyncio.run(bench(port, process.pid, args.sessions, args.active,
+                                       args.think, duration))
+        finally:
+            process.terminate()
+            process.join()
+        print(f"{name:<16} {result['peak_mb']:>9.1f}MB {result['final_mb']:>8.1f}MB "
+              f"{result['evicted']:>8,} {result['finished']:>9}/{args.active:<4} "
+              f"{result['p99_ms']:>7.1f}")
+        if result["peak_mb"] > args.max_rss:
+            failures.append(f"{name}: RSS puncak {result['peak_mb']:.1f}MB "
+                            f"melewati batas {args.max_rss:g}MB")
+        if result["evicted"] < must_evict:
+            failures.append(f"{name}: hanya {result['evicted']:,} sesi diam dilepas, "
+                            f"seharusnya minimal {must_evict:,}")
+        if result["finished"] != args.active:
+            failures.append(f"{name}: {args.active - result['finished']} pemain aktif "
+                            f"tidak sampai ending")
+
+    if failures:
+        print("\nGAGAL:", *failures, sep="\n  ")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
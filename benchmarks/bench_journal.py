@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark jurnal pilihan: fsync per pilihan vs group commit, ukuran dan replay.
+
+Menulis pilihan dari banyak sesi yang berjalan bergantian (seperti di
+server) ke jurnal sementara, sekali dengan commit di setiap pilihan dan
+sekali dengan group commit, lalu membangun ulang semua sesi dengan replay().
+
+    python benchmarks/bench_journal.py [--sessions N] [--dir DIR]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from journal import Journal, load, replay
+
+ROUTES = [
+    [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1],
+    [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 2],
+    [3, 1, 2, 4, 2, 4, 5, 2, 2, 1],
+]
+
+
+def write(path: str, sessions: int, max_records: int) -> float:
+    """Detik untuk mencatat semua pilihan `sessions` sesi yang berjalan bergantian"""
+    start = time.perf_counter()
+    with Journal(path, max_records=max_records, max_delay=float("inf")) as journal:
+        ids = [journal.start_session() for _ in range(sessions)]
+        for turn in range(max(map(len, ROUTES))):
+            for session in ids:
+                route = ROUTES[session % len(ROUTES)]
+                if turn < len(route):
+                    journal.append(session, route[turn])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--dir", help="direktori file jurnal (default: direktori sementara)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        path = os.path.join(directory, "game.journal")
+        choices = args.sessions + sum(len(ROUTES[i % len(ROUTES)]) for i in range(args.sessions))
+        print(f"{args.sessions} sesi, {choices} record")
+        for name, max_records in (("fsync per pilihan", 1), ("group commit", 512)):
+            if os.path.exists(path):
+                os.remove(path)
+            elapsed = write(path, args.sessions, max_records)
+            print(f"{name:<18} {elapsed * 1e3:9.1f} ms {choices / elapsed:>12,.0f} record/s")
+
+        size = os.path.getsize(path)
+        print(f"\nukuran jurnal: {size:,} B ({size / args.sessions:.1f} B/sesi)")
+
+        start = time.perf_counter()
+        journal = load(path)
+        bots = [replay(route) for route in journal.values()]
+        elapsed = time.perf_counter() - start
+        finished = sum(bot.game_over for bot in bots)
+        print(f"replay: {len(bots)} sesi dalam {elapsed * 1e3:.0f} ms "
+              f"({len(bots) / elapsed:,.0f} sesi/s, {finished} selesai)")
+
+
+if __name__ == "__main__":
+    main()
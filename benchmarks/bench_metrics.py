@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark instrumentasi: playthrough dengan dan tanpa InstrumentedBot.
+
+Memainkan rute ENDING TERBAIK secara headless dengan MysteryAdventureBot
+biasa (instrumentasi mati) dan dengan InstrumentedBot, bergantian, lalu
+mencetak giliran per detik keduanya berdampingan.
+
+    python benchmarks/bench_metrics.py [--runs N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import NullStream, ScriptedInput
+from main import MysteryAdventureBot
+from metrics import InstrumentedBot, MetricsRegistry
+from renderer import TypewriterRenderer
+from terminal import AnsiTerminal
+
+ROUTE = [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1]
+
+
+def turns_per_s(make_bot, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        terminal = AnsiTerminal(NullStream(), enabled=False, read_line=ScriptedInput(ROUTE))
+        make_bot(TypewriterRenderer(stream=terminal, instant=True), terminal).play()
+    return runs * len(ROUTE) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    bots = {
+        "tanpa metrik": MysteryAdventureBot,
+        "dengan metrik": lambda renderer, terminal: InstrumentedBot(
+            renderer, terminal, metrics=registry),
+    }
+    best = dict.fromkeys(bots, 0.0)
+    for _ in range(args.repeat):
+        for name, make_bot in bots.items():
+            best[name] = max(best[name], turns_per_s(make_bot, args.runs))
+
+    base = best["tanpa metrik"]
+    for name, rate in best.items():
+        print(f"{name:<14} {rate:>10,.0f} giliran/s {1e6 / rate:>6.1f} µs/giliran "
+              f"{rate / base:>7.1%}")
+    print(f"\n{len(registry.render().splitlines())} baris metrik, "
+          f"{registry.counter('scene_entries_total', scene='location_desa_panjatan'):,.0f} "
+          f"kunjungan location_desa_panjatan")
+
+
+if __name__ == "__main__":
+    main()
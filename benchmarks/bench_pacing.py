@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark efek mengetik di sisi server: CPU untuk 10.000 sesi yang mengetik bersamaan.
+
+Setiap sesi mengirim layar pembuka permainan per potongan `--chunk` byte
+dengan jeda `--chunk` x `--pace` detik (default 64 x 0,5 ms = 32 ms).
+Dibandingkan satu asyncio.sleep per potongan per sesi (cara lama) dengan
+GameServer.send yang memakai satu timer wheel untuk semua sesi. Writer
+hanya menghitung byte, jadi yang terukur adalah biaya penjadwalan dan
+event loop, bukan socket.
+
+    python benchmarks/bench_pacing.py [--sessions N] [--pace DETIK] [--chunk BYTE]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import GameServer
+from sessions import SessionManager
+
+
+class CountingWriter:
+    """Pengganti StreamWriter yang hanya menghitung byte"""
+
+    def __init__(self):
+        self.written = 0
+
+    def write(self, data: bytes):
+        self.written += len(data)
+
+    def is_closing(self) -> bool:
+        return False
+
+    async def drain(self):
+        pass
+
+
+async def send_sleep(server: GameServer, writer, text: str):
+    """Cara lama: satu asyncio.sleep per potongan"""
+    data = text.encode("utf-8")
+    for i in range(0, len(data), server.chunk):
+        writer.write(data[i:i + server.chunk])
+        await asyncio.sleep(server.chunk * server.pace)
+    await writer.drain()
+
+
+async def bench(send, server: GameServer, sessions: int, text: str):
+    writers = [CountingWriter() for _ in range(sessions)]
+    cpu, start = time.process_time(), time.perf_counter()
+    await asyncio.gather(*(send(server, writer, text) for writer in writers))
+    return time.process_time() - cpu, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--pace", type=float, default=0.0005)
+    parser.add_argument("--chunk", type=int, default=64)
+    args = parser.parse_args()
+
+    text = SessionManager().start(0)
+    data = len(text.encode("utf-8"))
+    chunks = -(-data // args.chunk)
+    ideal = chunks * args.chunk * args.pace
+    print(f"{args.sessions:,} sesi x {data:,} byte = {chunks} potongan, "
+          f"jeda {args.chunk * args.pace * 1e3:.0f} ms, ideal {ideal:.2f}s per sesi")
+    print(f"{'cara':<20} {'CPU':>8} {'waktu':>8} {'CPU/potongan':>13} {'beban CPU':>10}")
+    for name, send in (("asyncio.sleep", send_sleep), ("timer wheel", GameServer.send)):
+        server = GameServer(pace=args.pace, chunk=args.chunk)
+        cpu, elapsed = asyncio.run(bench(send, server, args.sessions, text))
+        print(f"{name:<20} {cpu:>7.2f}s {elapsed:>7.2f}s "
+              f"{cpu / (args.sessions * chunks) * 1e6:>11.1f}µs {cpu / elapsed:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark renderer efek mengetik: jumlah penulisan per scene.
+
+Setiap scene dimainkan dua kali, dengan slow_print lama (print + flush +
+sleep per huruf) dan dengan TypewriterRenderer. Waktu dijalankan dengan jam
+virtual sehingga benchmark selesai seketika, sedangkan jumlah flush ke
+stream dihitung sebagai perkiraan jumlah syscall write ke terminal.
+
+    python benchmarks/bench_render.py
+"""
+
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from terminal import AnsiTerminal
+
+# Scene yang diukur beserta pilihan yang dipakai untuk keluar darinya
+SCENES = [
+    ("location_desa_panjatan", 2),
+    ("location_pasar_desa", 5),
+    ("location_makam_tua", 2),
+    ("location_danau_panjatan", 4),
+    ("handle_ending_baik", None),
+    ("handle_ending_tengah", None),
+]
+
+
+class VirtualClock:
+    """Jam palsu: sleep hanya memajukan waktu"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class CountingStream(io.StringIO):
+    """Stream yang menghitung jumlah flush"""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
+class ScriptedBot(MysteryAdventureBot):
+    def __init__(self, renderer, legacy=False):
+        super().__init__(renderer, AnsiTerminal(enabled=False))
+        self.legacy = legacy
+
+    def clear_screen(self):
+        pass
+
+    def slow_print(self, text: str, delay: float = 0.03):
+        if not self.legacy:
+            return super().slow_print(text, delay)
+        # Implementasi lama: satu print + flush + sleep untuk setiap huruf
+        for char in text:
+            print(char, end='', flush=True)
+            self.renderer.sleep(delay)
+        print()
+
+
+def measure(scene_id, choice, legacy):
+    clock = VirtualClock()
+    stream = CountingStream()
+    renderer = TypewriterRenderer(stream=stream, clock=clock, sleep=clock.sleep)
+    bot = ScriptedBot(renderer, legacy)
+    with redirect_stdout(stream):
+        # Scene dimainkan sampai prompt pertama, lalu dijawab dengan `choice`
+        scene = bot.play_scene(bot.graph.index(scene_id))
+        try:
+            next(scene)
+            scene.send(str(choice))
+        except StopIteration:
+            pass
+    return stream.flushes, clock.now
+
+
+def main():
+    print(f"{'scene':<26} {'write lama':>10} {'write baru':>10} {'rasio':>7} "
+          f"{'waktu lama':>10} {'waktu baru':>10}")
+    for scene_id, choice in SCENES:
+        old_writes, old_time = measure(scene_id, choice, legacy=True)
+        new_writes, new_time = measure(scene_id, choice, legacy=False)
+        print(f"{scene_id:<26} {old_writes:>10} {new_writes:>10} "
+              f"{old_writes / new_writes:>6.1f}x {old_time:>9.1f}s {new_time:>9.1f}s")
+
+
+if __name__ == "__main__":
+    main()
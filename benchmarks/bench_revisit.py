@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark teks ringkas untuk scene yang sudah dilihat: byte dan waktu render per sesi.
+
+Sejumlah sesi acak dimainkan sekali dan pilihannya dicatat ke jurnal
+(journal.py). Jejak dari jurnal itu lalu dimainkan ulang dengan graf
+lengkap tanpa "revisit" (setiap kunjungan menampilkan teks penuh) dan
+dengan graf biasa. Dicatat rata-rata per sesi: byte output, waktu efek
+mengetik yang ditunggu pemain (jam virtual, lihat bench_typeahead.py)
+dan waktu CPU render tanpa efek mengetik.
+
+    python benchmarks/bench_revisit.py [--sessions N] [--turns N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_typeahead import VirtualClock
+from headless import NullStream
+from journal import Journal, JournaledBot, load
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from scenegraph import GRAPH, SceneGraph
+from scenes import SCENES, START_SCENE
+from sinks import BufferSink
+from terminal import AnsiTerminal
+
+
+def record(path: str, sessions: int, turns: int, seed: int):
+    """Memainkan `sessions` sesi acak (paling banyak `turns` pilihan) ke jurnal"""
+    rng = random.Random(seed)
+    with Journal(path) as journal:
+        for _ in range(sessions):
+            terminal = AnsiTerminal(NullStream(), enabled=False)
+            bot = JournaledBot(journal, TypewriterRenderer(stream=terminal, instant=True),
+                               terminal)
+            session = bot.session()
+            next(session)
+            try:
+                for _ in range(turns):
+                    choices = bot.graph[bot.state.scene].choices
+                    session.send(str(rng.randrange(len(choices)) + 1))
+            except StopIteration:
+                pass
+
+
+def play(graph: SceneGraph, choices, instant: bool):
+    """Memainkan satu jejak; mengembalikan (byte output, detik jam virtual)"""
+    clock = VirtualClock()
+    sink = BufferSink()
+    terminal = AnsiTerminal(sink, enabled=False)
+    renderer = TypewriterRenderer(stream=terminal, instant=instant,
+                                  clock=clock, sleep=clock.sleep)
+    bot = MysteryAdventureBot(renderer, terminal, graph=graph)
+    session = bot.session()
+    output = len(next(session).encode("utf-8"))
+    try:
+        for choice in choices:
+            output += len(session.send(str(choice)).encode("utf-8"))
+            output += len(sink.take().encode("utf-8"))
+    except StopIteration:
+        pass
+    return output + len(sink.take().encode("utf-8")), clock.now
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=60, help="pilihan maksimum per sesi")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    full = SceneGraph.compile({scene_id: {key: value for key, value in spec.items()
+                                          if key != "revisit"}
+                               for scene_id, spec in SCENES.items()}, START_SCENE)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "traces.journal")
+        record(path, args.sessions, args.turns, args.seed)
+        traces = list(load(path).values())
+
+    turns = sum(len(trace) for trace in traces) / len(traces)
+    print(f"{len(traces)} jejak, rata-rata {turns:.0f} pilihan per sesi")
+    print(f"{'graf':<14} {'byte/sesi':>10} {'menunggu/sesi':>14} {'CPU/sesi':>9}")
+    results = []
+    for name, graph in (("teks penuh", full), ("teks ringkas", GRAPH)):
+        output = waited = 0.0
+        for trace in traces:
+            size, seconds = play(graph, trace, instant=False)
+            output += size
+            waited += seconds
+        start = time.process_time()
+        for trace in traces:
+            play(graph, trace, instant=True)
+        cpu = (time.process_time() - start) / len(traces)
+        output /= len(traces)
+        waited /= len(traces)
+        results.append((output, waited, cpu))
+        print(f"{name:<14} {output:>10,.0f} {waited:>13.1f}s {cpu * 1e3:>7.2f}ms")
+    (output, waited, cpu), (short_output, short_waited, short_cpu) = results
+    print(f"{'turun':<14} {1 - short_output / output:>10.0%} {1 - short_waited / waited:>14.0%} "
+          f"{1 - short_cpu / cpu:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark format simpan: snapshot biner vs JSON vs pickle.
+
+Membuat 100.000 sesi di tengah permainan (seperti bench_state.py), lalu
+mengukur waktu menyimpan semuanya, waktu memulihkan satu sesi dan ukuran
+snapshot per sesi untuk setiap format.
+
+    python benchmarks/bench_savegame.py [--sessions N]
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import savegame
+from bench_state import make_compact
+from state import ITEMS, QUESTS, GameState, bit_ids
+
+
+def json_dumps(state: GameState) -> bytes:
+    """State sebagai dict JSON dengan nama item dan quest"""
+    return json.dumps({
+        "scene": state.scene,
+        "health": state.health,
+        "energy": state.energy,
+        "money": state.money,
+        "current_location": state.current_location,
+        "inventory": [ITEMS.name(item_id) for item_id in state.item_ids()],
+        "quests": [QUESTS.name(quest_id) for quest_id in bit_ids(state.quests)],
+        "visited": state.visited,
+        "game_over": state.game_over,
+        "ending_type": state.ending_type,
+    }).encode("utf-8")
+
+
+def json_loads(data: bytes) -> GameState:
+    fields = json.loads(data)
+    state = GameState(fields["scene"])
+    state.health = fields["health"]
+    state.energy = fields["energy"]
+    state.money = fields["money"]
+    state.current_location = fields["current_location"]
+    for item in fields["inventory"]:
+        state.add_item(ITEMS.id(item))
+    for quest in fields["quests"]:
+        state.complete_quest(QUESTS.id(quest))
+    state.visited = fields["visited"]
+    state.game_over = fields["game_over"]
+    state.ending_type = fields["ending_type"]
+    return state
+
+
+FORMATS = {
+    "biner": (savegame.dumps, savegame.loads),
+    "json": (json_dumps, json_loads),
+    "pickle": (pickle.dumps, pickle.loads),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=100000)
+    args = parser.parse_args()
+
+    states = [make_compact(i) for i in range(args.sessions)]
+    print(f"{args.sessions} sesi")
+    print(f"{'format':<8} {'simpan semua':>13} {'pulihkan satu':>14} {'B/sesi':>8}")
+    for name, (dumps, loads) in FORMATS.items():
+        start = time.perf_counter()
+        snapshots = [dumps(state) for state in states]
+        dump_s = time.perf_counter() - start
+        size = sum(map(len, snapshots)) / len(snapshots)
+        sample = snapshots[len(snapshots) // 2]
+        n = 100000
+        load_s = min(timeit.repeat(lambda: loads(sample), number=n, repeat=3)) / n
+        print(f"{name:<8} {dump_s * 1e3:>11.0f}ms {load_s * 1e6:>12.2f}µs {size:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark graf scene: waktu kompilasi, waktu startup dan giliran per detik.
+
+Waktu startup diukur sebagai `import main` sampai graf bawaan siap dipakai,
+di proses Python baru. Giliran
+per detik diukur dengan memainkan rute ENDING TERBAIK secara headless.
+Dengan --against REV, pengukuran yang sama dijalankan juga pada pohon
+kode revisi git REV (misalnya HEAD~1) untuk perbandingan.
+
+    python benchmarks/bench_scenegraph.py [--runs N] [--against REV]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+ROUTE = [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1]
+
+# Dijalankan di proses baru dengan cwd = pohon kode yang diukur
+PROBE = """
+import json, sys, time
+sys.path.insert(0, ".")
+start = time.perf_counter()
+import main
+try:
+    import scenegraph
+    scenegraph.GRAPH  # graf bawaan dikompilasi saat pertama kali dipakai
+except ImportError:
+    pass
+import_s = time.perf_counter() - start
+from headless import headless_bot
+route, runs = json.loads(sys.argv[1])
+turns = 0
+start = time.perf_counter()
+for _ in range(runs):
+    bot = headless_bot(route)
+    session = bot.session()
+    prompt = next(session)
+    try:
+        while True:
+            prompt = session.send(bot.terminal.input(prompt))
+            turns += 1
+    except StopIteration:
+        turns += 1
+print(json.dumps({"import_s": import_s, "turns_per_s": turns / (time.perf_counter() - start)}))
+"""
+
+
+def probe(trees: list, runs: int, repeat: int = 5) -> list:
+    """Startup (minimum dari beberapa proses) dan giliran/s untuk setiap pohon kode.
+
+    Pohon kode diukur bergantian supaya gangguan dari mesin terbagi rata.
+    """
+    results = [[] for _ in trees]
+    for _ in range(repeat):
+        for tree, samples in zip(trees, results):
+            output = subprocess.run(
+                [sys.executable, "-c", PROBE, json.dumps([ROUTE, runs])],
+                cwd=tree, check=True, capture_output=True, text=True).stdout
+            samples.append(json.loads(output))
+    return [{
+        "import_s": min(sample["import_s"] for sample in samples),
+        "turns_per_s": max(sample["turns_per_s"] for sample in samples),
+    } for samples in results]
+
+
+def export_tree(rev: str, directory: str) -> str:
+    """Mengekstrak revisi `rev` ke `directory` lewat git archive"""
+    archive = os.path.join(directory, "tree.tar")
+    with open(archive, "wb") as out:
+        subprocess.run(["git", "archive", rev], cwd=ROOT, check=True, stdout=out)
+    with tarfile.open(archive) as tar:
+        tar.extractall(directory)
+    return directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--against", metavar="REV", help="revisi git pembanding")
+    args = parser.parse_args()
+
+    from scenegraph import SceneGraph
+    from scenes import SCENES, START_SCENE
+
+    n = 200
+    start = time.perf_counter()
+    for _ in range(n):
+        graph = SceneGraph.compile(SCENES, START_SCENE)
+    compile_s = (time.perf_counter() - start) / n
+    print(f"kompilasi graf: {compile_s * 1e3:.2f} ms ({len(graph)} scene)")
+
+    names, trees = ["pohon kerja"], [ROOT]
+    with tempfile.TemporaryDirectory() as directory:
+        if args.against:
+            names.append(args.against)
+            trees.append(export_tree(args.against, directory))
+        rows = list(zip(names, probe(trees, args.runs)))
+
+    print(f"\n{'kode':<12} {'import main':>12} {'giliran/s':>10}")
+    for name, result in rows:
+        print(f"{name:<12} {result['import_s'] * 1e3:>10.1f}ms {result['turns_per_s']:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
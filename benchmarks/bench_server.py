@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark server asyncio dengan ribuan sesi simultan.
+
+Server berjalan di proses terpisah. Klien membuka N koneksi lokal, menunggu
+sampai semuanya tersambung (sesi diam menunggu jawaban pertama), lalu
+memainkan rute ENDING TERBAIK secara bersamaan. Memori server diukur dari
+RSS proses server sebelum koneksi dan saat semua sesi diam.
+
+    python benchmarks/bench_server.py [--sessions 1000 5000 10000]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import GameServer
+
+ROUTE = [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1]
+PROMPT_END = b": "
+
+
+def rss_kb(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def run_server(port_pipe):
+    async def main():
+        server = GameServer(port=0)
+        await server.start()
+        port_pipe.send(server.port)
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+async def read_prompt(reader: asyncio.StreamReader) -> bool:
+    data = b""
+    while not data.endswith(PROMPT_END):
+        chunk = await reader.read(65536)
+        if not chunk:
+            return False
+        data += chunk
+    return True
+
+
+async def client(port, connected, go, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    await read_prompt(reader)
+    connected()
+    await go.wait()
+    for choice in ROUTE:
+        start = time.perf_counter()
+        writer.write(f"{choice}\n".encode())
+        if not await read_prompt(reader):
+            break
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def bench(port, server_pid, sessions):
+    go = asyncio.Event()
+    latencies = []
+    count = 0
+    all_connected = asyncio.Event()
+
+    def connected():
+        nonlocal count
+        count += 1
+        if count == sessions:
+            all_connected.set()
+
+    base_rss = rss_kb(server_pid)
+    start = time.perf_counter()
+    tasks = []
+    for _ in range(sessions):
+        tasks.append(asyncio.create_task(client(port, connected, go, latencies)))
+        if len(tasks) % 500 == 0:
+            await asyncio.sleep(0)  # jangan membanjiri backlog listen
+    await all_connected.wait()
+    connect_time = time.perf_counter() - start
+    idle_rss = rss_kb(server_pid)
+
+    start = time.perf_counter()
+    go.set()
+    await asyncio.gather(*tasks)
+    play_time = time.perf_counter() - start
+
+    latencies.sort()
+    turns = sessions * len(ROUTE)
+    return {
+        "sessions": sessions,
+        "connect_s": connect_time,
+        "idle_kb_per_session": (idle_rss - base_rss) / sessions,
+        "play_s": play_time,
+        "turns_per_s": turns / play_time,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 5000, 10000])
+    args = parser.parse_args()
+
+    print(f"{'sesi':>6} {'connect':>8} {'KB/sesi diam':>13} {'main':>8} "
+          f"{'giliran/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for sessions in args.sessions:
+        parent, child = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=run_server, args=(child,), daemon=True)
+        process.start()
+        port = parent.recv()
+        try:
+            result = asyncio.run(bench(port, process.pid, sessions))
+        finally:
+            process.terminate()
+            process.join()
+        print(f"{result['sessions']:>6} {result['connect_s']:>7.2f}s "
+              f"{result['idle_kb_per_session']:>13.1f} {result['play_s']:>7.2f}s "
+              f"{result['turns_per_s']:>10,.0f} {result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark server multi-proses: giliran/s untuk 1 sampai 8 worker.
+
+ShardFront berjalan di proses benchmark, klien di beberapa proses
+terpisah. Setiap klien mengirim id pemainnya, menunggu prompt pertama,
+lalu semua pemain memainkan rute ENDING TERBAIK bersamaan. Dicatat juga
+bagian id pemain yang pindah worker saat satu worker ditambah (ideal
+1/(N+1)) dan beban worker terbesar dibanding rata-rata.
+
+Dengan hanya satu core, worker tambahan tidak bisa menambah throughput.
+
+    python benchmarks/bench_shards.py [--workers 1 2 4 8] [--players N] [--clients N]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_server import ROUTE, read_prompt
+from shards import HashRing, ShardFront
+
+
+def run_clients(port, players, ready, go, results):
+    async def player(name, connected):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"{name}\n".encode())
+        await read_prompt(reader)
+        connected.append(name)
+        return reader, writer
+
+    async def play(reader, writer):
+        turns = 0
+        for choice in ROUTE:
+            writer.write(f"{choice}\n".encode())
+            if not await read_prompt(reader):
+                break
+            turns += 1
+        writer.close()
+        return turns
+
+    async def main():
+        connected = []
+        streams = []
+        for name in players:
+            streams.append(asyncio.create_task(player(name, connected)))
+            if len(streams) % 200 == 0:
+                await asyncio.sleep(0)  # jangan membanjiri backlog listen
+        streams = await asyncio.gather(*streams)
+        ready.put(len(connected))
+        await asyncio.get_running_loop().run_in_executor(None, go.wait)
+        turns = await asyncio.gather(*(play(reader, writer) for reader, writer in streams))
+        results.put((sum(turns), time.time()))
+
+    asyncio.run(main())
+
+
+async def bench(workers, players, clients):
+    context = multiprocessing.get_context("spawn")
+    front = ShardFront(port=0, workers=workers, turn_timeout=None)
+    await front.start()
+    loop = asyncio.get_running_loop()
+    ready, results, go = context.Queue(), context.Queue(), context.Event()
+    processes = []
+    try:
+        for i in range(clients):
+            names = [f"pemain{n}" for n in range(i, players, clients)]
+            process = context.Process(target=run_clients, daemon=True,
+                                      args=(front.port, names, ready, go, results))
+            process.start()
+            processes.append(process)
+        for _ in processes:
+            await loop.run_in_executor(None, ready.get)
+        start = time.time()
+        go.set()
+        turns, end = 0, start
+        for _ in processes:
+            count, finished = await loop.run_in_executor(None, results.get)
+            turns += count
+            end = max(end, finished)
+        for process in processes:
+            await loop.run_in_executor(None, process.join)
+    finally:
+        front.close()
+    return turns, end - start
+
+
+def moved_fraction(workers: int, keys: int) -> float:
+    """Bagian kunci yang pindah worker saat worker ke-(N+1) ditambah"""
+    before = HashRing(range(workers))
+    after = HashRing(range(workers + 1))
+    names = [f"pemain{n}" for n in range(keys)]
+    return sum(before.node(name) != after.node(name) for name in names) / keys
+
+
+def imbalance(workers: int, keys: int) -> float:
+    """Beban worker terbesar dibagi rata-rata"""
+    ring = HashRing(range(workers))
+    load = Counter(ring.node(f"pemain{n}") for n in range(keys))
+    return max(load.values()) / (keys / workers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--players", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=4, help="jumlah proses klien")
+    parser.add_argument("--keys", type=int, default=100000,
+                        help="jumlah id untuk mengukur perpindahan kunci")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} core, {args.players} pemain, {args.clients} proses klien")
+    print(f"{'worker':>6} {'giliran/s':>10} {'pindah +1':>10} {'ideal':>7} {'maks/rata':>10}")
+    for workers in args.workers:
+        turns, elapsed = asyncio.run(bench(workers, args.players, args.clients))
+        moved = moved_fraction(workers, args.keys)
+        print(f"{workers:>6} {turns / elapsed:>10,.0f} {moved:>9.1%} "
+              f"{1 / (workers + 1):>6.1%} {imbalance(workers, args.keys):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark sink output: jumlah penulisan (syscall) per giliran.
+
+Rute ENDING TERBAIK dimainkan dengan escape ANSI aktif. Untuk terminal,
+output ditulis ke stream teks line-buffered seperti stdout di TTY, dan
+penulisan ke file descriptor di bawahnya dihitung. Cara lama (setiap
+write diteruskan langsung dan renderer flush di setiap blok teks)
+dibandingkan dengan StreamSink. NetworkSink diukur di atas socketpair
+dengan menghitung panggilan sendall, BufferSink tanpa syscall sama sekali.
+
+    python benchmarks/bench_sink.py [--runs N]
+"""
+
+import argparse
+import io
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import ScriptedInput
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from sinks import BufferSink, NetworkSink, Sink, StreamSink
+from terminal import AnsiTerminal
+
+ROUTE = [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1]
+
+
+class CountingRaw(io.RawIOBase):
+    """File descriptor tiruan yang menghitung penulisan"""
+
+    def __init__(self):
+        self.writes = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.writes += 1
+        return len(data)
+
+
+class PassthroughSink(Sink):
+    """Cara lama: setiap write langsung diteruskan ke stream"""
+
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+class LegacyRenderer(TypewriterRenderer):
+    """Cara lama: flush setelah setiap blok teks, juga tanpa efek mengetik"""
+
+    def _write(self, text: str):
+        self.stream.write(text)
+        self.stream.flush()
+
+
+def play(sink: Sink, renderer_class=TypewriterRenderer) -> int:
+    """Memainkan rute sekali; mengembalikan jumlah giliran"""
+    script = ScriptedInput(ROUTE)
+    turns = []
+
+    def read_line() -> str:
+        turns.append(1)
+        return script()
+
+    terminal = AnsiTerminal(sink, enabled=True, read_line=read_line)
+    bot = MysteryAdventureBot(renderer_class(stream=terminal, instant=True), terminal)
+    bot.play()
+    bot.show_end_screen()
+    terminal.flush()
+    return len(turns)
+
+
+def tty_stream(raw: CountingRaw) -> io.TextIOWrapper:
+    return io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8", line_buffering=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=300)
+    args = parser.parse_args()
+
+    left, right = socket.socketpair()
+    right.setblocking(False)
+    sends = []
+
+    def sendall(data: bytes):
+        sends.append(len(data))
+        left.sendall(data)
+        try:
+            while right.recv(1 << 20):
+                pass
+        except BlockingIOError:
+            pass
+
+    cases = [
+        ("terminal lama", lambda raw: (PassthroughSink(tty_stream(raw)), LegacyRenderer)),
+        ("StreamSink", lambda raw: (StreamSink(tty_stream(raw)), TypewriterRenderer)),
+        ("NetworkSink", lambda raw: (NetworkSink(sendall), TypewriterRenderer)),
+        ("BufferSink", lambda raw: (BufferSink(), TypewriterRenderer)),
+    ]
+    print(f"{'sink':<14} {'write/giliran':>14} {'µs/giliran':>11}")
+    for name, make in cases:
+        raw = CountingRaw()
+        sink, renderer_class = make(raw)
+        sends.clear()
+        turns = 0
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            turns += play(sink, renderer_class)
+            if isinstance(sink, BufferSink):
+                sink.take()
+        elapsed = time.perf_counter() - start
+        writes = raw.writes + len(sends)
+        print(f"{name:<14} {writes / turns:>14.2f} {elapsed / turns * 1e6:>11.1f}")
+    left.close()
+    right.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark state sesi: memori per sesi dan kecepatan lookup inventory.
+
+Membuat 100.000 sesi hidup dengan state lama (list dan set berisi nama
+panjang) dan dengan GameState, lalu mengukur memori keduanya dengan
+tracemalloc. Setiap sesi mendapat inventory, quest dan uang yang berbeda
+seperti sesi di tengah permainan.
+
+Hasilnya sekitar 5x lebih kecil. Target 10x tidak tercapai dengan satu
+objek GameState per sesi: objek dengan __slots__ saja sudah sekitar 130 B,
+dan urutan ambil item ikut disimpan agar inventory tampil seperti semula.
+
+    python benchmarks/bench_state.py [--sessions N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from state import ITEMS, QUESTS, GameState
+
+# Inventory yang dipakai bergiliran oleh sesi-sesi benchmark
+INVENTORIES = [ITEMS.names[:n] for n in range(2, 12)]
+
+
+class LegacyState:
+    """Atribut state seperti MysteryAdventureBot sebelum GameState"""
+
+    def __init__(self):
+        self.name = "Titi"
+        self.health = 100
+        self.energy = 100
+        self.inventory = []
+        self.visited_locations = set()
+        self.completed_quests = set()
+        self.money = 0
+        self.current_location = "Desa Panjatan"
+        self.current_scene = "location_desa_panjatan"
+        self.game_over = False
+        self.ending_type = None
+
+
+def make_legacy(i):
+    state = LegacyState()
+    for item in INVENTORIES[i % len(INVENTORIES)]:
+        state.inventory.append(item)
+    for quest in QUESTS.names[:i % 4]:
+        state.completed_quests.add(quest)
+    state.money = 100 + i % 1000
+    return state
+
+
+def make_compact(i):
+    state = GameState()
+    for item in INVENTORIES[i % len(INVENTORIES)]:
+        state.add_item(ITEMS.id(item))
+    for quest in QUESTS.names[:i % 4]:
+        state.complete_quest(QUESTS.id(quest))
+    state.money = 100 + i % 1000
+    return state
+
+
+def measure(factory, sessions):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    states = [factory(i) for i in range(sessions)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Daftar penampung sesi tidak dihitung sebagai memori sesi
+    return (after - before - sys.getsizeof(states)) / sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=100000)
+    args = parser.parse_args()
+
+    legacy = measure(make_legacy, args.sessions)
+    compact = measure(make_compact, args.sessions)
+    print(f"{args.sessions} sesi hidup")
+    print(f"state lama : {legacy:8.1f} B/sesi")
+    print(f"GameState  : {compact:8.1f} B/sesi ({legacy / compact:.1f}x lebih kecil)")
+
+    # Lookup item terakhir di inventory penuh: list lama vs multiset
+    full = ITEMS.names
+    old, new = LegacyState(), GameState()
+    old.inventory = list(full)
+    for item in full:
+        new.add_item(ITEMS.id(item))
+    target = full[-1]
+    target_id = ITEMS.get(target)
+    n = 1000000
+    old_time = timeit.timeit(lambda: target in old.inventory, number=n) / n
+    new_time = timeit.timeit(lambda: new.item_count(target_id) > 0, number=n) / n
+    print(f"\nhas_item lama : {old_time * 1e9:6.0f} ns (O(n), {len(full)} item)")
+    print(f"has_item baru : {new_time * 1e9:6.0f} ns (O(1))")
+
+
+if __name__ == "__main__":
+    main()
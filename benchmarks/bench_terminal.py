@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark perpindahan scene: clear lewat subprocess vs escape sequence ANSI.
+
+Rute Desa -> Pasar -> Desa dimainkan tanpa efek mengetik dengan output ke
+/dev/null. Versi lama membersihkan layar dengan os.system('clear'), versi
+baru memakai AnsiTerminal.
+
+    python benchmarks/bench_terminal.py [--transitions N]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import ScriptedInput
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from terminal import AnsiTerminal
+
+ROUTE = [2, 5]
+
+
+class BenchBot(MysteryAdventureBot):
+    def __init__(self, stream, transitions, legacy=False):
+        terminal = AnsiTerminal(stream, enabled=True,
+                                read_line=ScriptedInput(itertools.cycle(ROUTE)))
+        super().__init__(TypewriterRenderer(stream=terminal, instant=True), terminal)
+        self.legacy = legacy
+        self.limit = transitions
+        self.transitions = 0
+
+    def clear_screen(self):
+        if self.legacy:
+            # Implementasi lama: fork shell + subprocess di setiap scene
+            os.system('clear >/dev/null 2>&1')
+        else:
+            super().clear_screen()
+
+    def play_scene(self, index):
+        self.transitions += 1
+        if self.transitions >= self.limit:
+            self.game_over = True
+        return (yield from super().play_scene(index))
+
+
+def measure(transitions, legacy):
+    with open(os.devnull, "w") as devnull:
+        bot = BenchBot(devnull, transitions, legacy)
+        start = time.perf_counter()
+        bot.play()
+        return (time.perf_counter() - start) / bot.transitions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transitions", type=int, default=500)
+    args = parser.parse_args()
+
+    legacy = measure(args.transitions, legacy=True)
+    ansi = measure(args.transitions, legacy=False)
+    print(f"os.system('clear') : {legacy * 1e6:10.1f} µs/scene")
+    print(f"ANSI               : {ansi * 1e6:10.1f} µs/scene")
+    print(f"percepatan         : {legacy / ansi:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
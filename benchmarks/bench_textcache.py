@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark cache teks: kunjungan ulang scene hub dengan dan tanpa RenderCache.
+
+Tanpa cache (maxsize 0) setiap teks cerita diformat ulang di setiap
+kunjungan; dengan cache, kunjungan kedua dan seterusnya hanya mengambil
+teks yang sudah jadi.
+
+    python benchmarks/bench_textcache.py [--visits N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import NullStream
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from scenegraph import GRAPH, SAY
+from terminal import AnsiTerminal
+from textcache import RenderCache, format_block
+
+HUBS = ["location_desa_panjatan", "location_pasar_desa"]
+
+
+def visit_us(cache: RenderCache, scene_id: str, visits: int) -> float:
+    """Mikrodetik per kunjungan scene (op masuk dan menu pilihan)"""
+    terminal = AnsiTerminal(NullStream(), enabled=False)
+    bot = MysteryAdventureBot(TypewriterRenderer(stream=terminal, instant=True), terminal)
+    bot.render_cache = cache
+    index = GRAPH.index(scene_id)
+    start = time.perf_counter()
+    for _ in range(visits):
+        # Selalu kunjungan pertama: kunjungan ulang memakai teks ringkas revisit
+        bot.state.seen = 0
+        scene = bot.play_scene(index)
+        next(scene)
+        scene.close()
+    return (time.perf_counter() - start) / visits * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--visits", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'scene':<26} {'tanpa cache':>12} {'dengan cache':>13} {'format teks':>12}")
+    for scene_id in HUBS:
+        texts = [args[0] for code, args in GRAPH[GRAPH.index(scene_id)].enter if code == SAY]
+        start = time.perf_counter()
+        for _ in range(1000):
+            for text in texts:
+                format_block(text, 80)
+        format_us = (time.perf_counter() - start) / 1000 * 1e6
+        cold = visit_us(RenderCache(maxsize=0), scene_id, args.visits)
+        warm = visit_us(RenderCache(), scene_id, args.visits)
+        print(f"{scene_id:<26} {cold:>10.1f}µs {warm:>11.1f}µs {format_us:>10.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
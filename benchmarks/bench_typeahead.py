@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark type-ahead: waktu sampai scene akhir rute dan byte output.
+
+Rute ENDING TERBAIK sampai pemain masuk Gua Rahasia dimainkan dua kali:
+satu pilihan per giliran, dan semua pilihan diketik sekaligus ("3 1 2 ...").
+Sejak jawaban pertama dicatat byte output, waktu efek mengetik yang harus
+ditunggu pemain (jam virtual: renderer dengan jeda dan batas waktu seperti
+di terminal, tanpa benar-benar tidur) dan waktu CPU engine tanpa efek
+mengetik.
+
+    python benchmarks/bench_typeahead.py [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from sinks import BufferSink
+from terminal import AnsiTerminal
+
+# Rute ENDING TERBAIK sampai scene pertama di Gua Rahasia
+ROUTE = [3, 1, 2, 4, 2, 4, 5]
+
+
+class VirtualClock:
+    """Jam untuk renderer: sleep() hanya memajukan waktu"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def play(answers, instant: bool):
+    """Memainkan `answers` dari prompt pertama; mengembalikan (byte output,
+    detik jam virtual, scene akhir) sejak jawaban pertama dikirim"""
+    clock = VirtualClock()
+    sink = BufferSink()
+    terminal = AnsiTerminal(sink, enabled=False)
+    renderer = TypewriterRenderer(stream=terminal, instant=instant,
+                                  clock=clock, sleep=clock.sleep)
+    bot = MysteryAdventureBot(renderer, terminal)
+    session = bot.session()
+    next(session)
+    sink.take()
+    clock.now = 0.0
+    output = 0
+    for answer in answers:
+        output += len(session.send(answer).encode("utf-8"))
+        output += len(sink.take().encode("utf-8"))
+    return output, clock.now, bot.current_scene
+
+
+def cpu(answers, repeat: int) -> float:
+    start = time.process_time()
+    for _ in range(repeat):
+        play(answers, instant=True)
+    return (time.process_time() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    modes = (("per giliran", [str(choice) for choice in ROUTE]),
+             ("type-ahead", [" ".join(map(str, ROUTE))]))
+    print(f"rute {' '.join(map(str, ROUTE))}")
+    print(f"{'mode':<12} {'giliran':>7} {'byte':>7} {'menunggu':>9} {'CPU':>8}  scene akhir")
+    for name, answers in modes:
+        output, waited, scene = play(answers, instant=False)
+        print(f"{name:<12} {len(answers):>7} {output:>7,} {waited:>8.1f}s "
+              f"{cpu(answers, args.repeat) * 1e6:>6.0f}µs  {scene}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uji beban webhook: latensi p50/p99 pada laju request tetap (default 2.000/s).
+
+Server webhook berjalan di proses terpisah dengan database SQLite baru.
+Klien pengganti platform chat mengirim request dengan jadwal tetap (open
+loop) lewat sekumpulan koneksi keep-alive. Setiap pemain memainkan rute
+ending berulang-ulang, satu pesan pada satu waktu. Latensi dihitung dari
+waktu request dijadwalkan, jadi antrean di sisi klien ikut terhitung.
+
+    python benchmarks/bench_webhook.py [--rate N] [--duration DETIK] [--players N]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_server import rss_kb
+from webhook import PlayerStore, WebhookClient, WebhookServer
+
+ROUTES = [
+    [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1],
+    [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 2],
+    [3, 1, 2, 4, 2, 4, 5, 2, 2, 1],
+]
+
+
+def run_server(port_pipe, path):
+    async def main():
+        server = WebhookServer(PlayerStore(path), port=0)
+        await server.start()
+        port_pipe.send(server.port)
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+def cpu_seconds(pid: int) -> float:
+    """Waktu CPU (user + system) sebuah proses"""
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def percentile(values, q: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def bench(port, rate, duration, players, connections):
+    queue: asyncio.Queue = asyncio.Queue()
+    latencies, errors = [], []
+    # Posisi setiap pemain di rutenya; None = belum mulai
+    position = [None] * players
+
+    async def worker():
+        client = WebhookClient(port=port)
+        await client.connect()
+        while True:
+            scheduled, player = await queue.get()
+            route = ROUTES[player % len(ROUTES)]
+            step = position[player]
+            choice = None if step is None else str(route[step])
+            try:
+                reply = await client.send(str(player), choice)
+            except Exception as error:  # dicatat, uji beban berjalan terus
+                errors.append(error)
+                await client.close()
+                await client.connect()
+                continue
+            latencies.append(time.perf_counter() - scheduled)
+            position[player] = None if reply["finished"] else (0 if step is None else step + 1)
+            queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(connections)]
+    total = int(rate * duration)
+    start = time.perf_counter()
+    for i in range(total):
+        scheduled = start + i / rate
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        queue.put_nowait((scheduled, i % players))
+    await queue.join()
+    elapsed = time.perf_counter() - start
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    return sorted(latencies), errors, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rate", type=float, default=2000)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--players", type=int, default=5000)
+    parser.add_argument("--connections", type=int, default=32,
+                        help="jumlah koneksi keep-alive klien")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "players.db")
+        context = multiprocessing.get_context("spawn")
+        parent, child = context.Pipe()
+        process = context.Process(target=run_server, args=(child, path), daemon=True)
+        process.start()
+        port = parent.recv()
+        try:
+            cpu, client_cpu = cpu_seconds(process.pid), time.process_time()
+            latencies, errors, elapsed = asyncio.run(
+                bench(port, args.rate, args.duration, args.players, args.connections))
+            cpu = cpu_seconds(process.pid) - cpu
+            client_cpu = time.process_time() - client_cpu
+            rss = rss_kb(process.pid)
+        finally:
+            process.terminate()
+            process.join()
+        players = len(PlayerStore(path))
+
+    print(f"{len(latencies):,} request dalam {elapsed:.1f}s ({len(latencies) / elapsed:,.0f}/s, "
+          f"target {args.rate:,.0f}/s), {args.connections} koneksi, {len(errors)} gagal")
+    print(f"latensi: p50 {percentile(latencies, 0.50) * 1e3:.2f} ms  "
+          f"p99 {percentile(latencies, 0.99) * 1e3:.2f} ms  "
+          f"p99.9 {percentile(latencies, 0.999) * 1e3:.2f} ms  "
+          f"maks {latencies[-1] * 1e3:.2f} ms")
+    print(f"CPU per request: server {cpu / len(latencies) * 1e6:.0f} µs, "
+          f"klien {client_cpu / len(latencies) * 1e6:.0f} µs ({os.cpu_count()} core)")
+    print(f"server: RSS {rss / 1024:.1f} MB, {players:,} pemain tersimpan di SQLite")
+
+
+if __name__ == "__main__":
+    main()
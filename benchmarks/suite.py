@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kumpulan benchmark: rendering, dispatch dan sesi penuh.
+
+Setiap benchmark diukur sendiri-sendiri dengan timeit: median dari
+beberapa ulangan beserta pita noise-nya (jarak kuartil dibagi median), dan
+hasilnya ditulis sebagai JSON. Dengan --baseline, hasil dibandingkan dengan
+file JSON sebelumnya. Benchmark yang lebih lambat dari toleransi ditambah
+noise kedua pengukuran diukur ulang dulu, dan baru dilaporkan sebagai
+regresi (exit code 1) jika tetap lebih lambat di setiap pengukuran, sehingga
+tree yang tidak berubah tidak gagal hanya karena mesin sedang sibuk.
+
+    python benchmarks/suite.py --json hasil.json
+    python benchmarks/suite.py --baseline hasil.json [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import NullStream, run_headless
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from scenegraph import GRAPH, SAY
+from state import ITEMS
+from terminal import AnsiTerminal
+
+# Skrip pilihan untuk setiap jalur ending
+ROUTES = {
+    "ENDING TERBAIK": [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 1],
+    "ENDING NETRAL": [3, 1, 2, 4, 2, 4, 5, 2, 2, 3, 2],
+    "ENDING BURUK": [3, 1, 2, 4, 2, 4, 5, 2, 2, 1],
+}
+
+# Paragraf cerita terpanjang di scene awal
+PARAGRAPH = max((args[0] for code, args in GRAPH[0].enter if code == SAY), key=len)
+
+
+def make_bot(tty: bool = False) -> MysteryAdventureBot:
+    """Bot yang menulis ke NullStream dengan efek mengetik dimatikan"""
+    terminal = AnsiTerminal(NullStream(), enabled=tty)
+    return MysteryAdventureBot(TypewriterRenderer(stream=terminal, instant=True), terminal)
+
+
+def bench_slow_print() -> Callable[[], None]:
+    bot = make_bot()
+    return lambda: bot.slow_print(PARAGRAPH)
+
+
+def bench_clear_screen() -> Callable[[], None]:
+    bot = make_bot(tty=True)
+    return bot.clear_screen
+
+
+def bench_get_player_choice() -> Callable[[], None]:
+    bot = make_bot()
+    labels = list(GRAPH[GRAPH.index("location_desa_panjatan")].labels)
+
+    def run():
+        choice = bot.get_player_choice(labels)
+        next(choice)
+        try:
+            choice.send(" 3 ")
+        except StopIteration:
+            pass
+    return run
+
+
+def bench_display_stats_redraw() -> Callable[[], None]:
+    # Seperti di permainan: layar dibersihkan lalu kotak status digambar penuh.
+    # Terminal sama dengan display_stats.update agar keduanya bisa dibandingkan
+    bot = make_bot(tty=True)
+
+    def run():
+        bot.clear_screen()
+        bot.display_stats()
+    return run
+
+
+def bench_display_stats_update() -> Callable[[], None]:
+    # Kotak status yang masih terlihat diperbarui di tempat
+    bot = make_bot(tty=True)
+    bot.display_stats()
+
+    def run():
+        bot.money += 1
+        bot.display_stats()
+    return run
+
+
+def bench_show_inventory() -> Callable[[], None]:
+    bot = make_bot()
+    for item_id in range(len(ITEMS)):
+        bot.state.add_item(item_id)
+    return bot.show_inventory
+
+
+def bench_scene_transition() -> Callable[[], None]:
+    bot = make_bot()
+    index = GRAPH.index("location_desa_panjatan")
+
+    def run():
+        # Selalu kunjungan pertama, sama seperti sebelum ada teks ringkas revisit
+        bot.state.seen = 0
+        scene = bot.play_scene(index)
+        next(scene)
+        try:
+            scene.send("2")
+        except StopIteration:
+            pass
+    return run
+
+
+def bench_playthrough(route) -> Callable[[], None]:
+    return lambda: run_headless(route)
+
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], None]]] = {
+    "slow_print": bench_slow_print,
+    "clear_screen": bench_clear_screen,
+    "get_player_choice": bench_get_player_choice,
+    "display_stats.redraw": bench_display_stats_redraw,
+    "display_stats.update": bench_display_stats_update,
+    "show_inventory": bench_show_inventory,
+    "scene_transition": bench_scene_transition,
+}
+for _name, _route in ROUTES.items():
+    BENCHMARKS[f"playthrough.{_name}"] = lambda route=_route: bench_playthrough(route)
+
+
+def measure(setup: Callable[[], Callable[[], None]], repeat: int) -> Dict[str, float]:
+    """Waktu per operasi: median dari `repeat` ulangan, nilai terbaik dan noise"""
+    timer = timeit.Timer(setup())
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    median = statistics.median(times)
+    quartiles = statistics.quantiles(times, n=4) if len(times) > 1 else [median] * 3
+    return {"ns_per_op": median * 1e9, "ops_per_s": 1 / median,
+            "best_ns_per_op": min(times) * 1e9,
+            "noise": (quartiles[2] - quartiles[0]) / median}
+
+
+def metadata() -> Dict[str, str]:
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                  capture_output=True, text=True, check=True,
+                                  cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "revision": revision,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def _limit(result: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> float:
+    # Baseline lama tanpa noise dianggap noise 0
+    return 1 + tolerance + baseline.get("noise", 0.0) + result.get("noise", 0.0)
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float, repeat: int, confirm: int) -> bool:
+    """Mencetak perbandingan dengan baseline; False jika ada regresi.
+
+    Batas regresi setiap benchmark adalah `tolerance` ditambah noise baseline
+    dan noise pengukuran sekarang. Benchmark yang melewati batas diukur ulang
+    sampai `confirm` kali; hasil tercepat yang dipakai.
+    """
+    ok = True
+    print(f"\n{'benchmark':<30} {'baseline ns':>12} {'sekarang ns':>12} {'rasio':>7} {'batas':>7}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<30} {'-':>12} {result['ns_per_op']:>12,.0f}")
+            continue
+        old = baseline[name]["ns_per_op"]
+        for _ in range(confirm):
+            if result["ns_per_op"] / old <= _limit(result, baseline[name], tolerance):
+                break
+            again = measure(BENCHMARKS[name], repeat)
+            if again["ns_per_op"] < result["ns_per_op"]:
+                result = results[name] = again
+        ratio = result["ns_per_op"] / old
+        limit = _limit(result, baseline[name], tolerance)
+        mark = ""
+        if ratio > limit:
+            mark = "  ⚠️ REGRESI"
+            ok = False
+        print(f"{name:<30} {old:>12,.0f} {result['ns_per_op']:>12,.0f} {ratio:>6.2f}x "
+              f"{limit:>6.2f}x{mark}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--json", metavar="FILE", help="tulis hasil ke file JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="bandingkan dengan hasil sebelumnya")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="batas perlambatan di luar noise sebelum dianggap regresi "
+                             "(0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=15,
+                        help="jumlah ulangan per benchmark; median yang dibandingkan")
+    parser.add_argument("--confirm", type=int, default=2,
+                        help="berapa kali benchmark yang melewati batas diukur ulang")
+    parser.add_argument("--only", nargs="+", metavar="NAMA", help="hanya benchmark ini")
+    args = parser.parse_args()
+
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if args.only and name not in args.only:
+            continue
+        results[name] = measure(setup, args.repeat)
+        print(f"{name:<30} {results[name]['ns_per_op']:>12,.0f} ns/op "
+              f"{results[name]['ops_per_s']:>12,.0f} op/s "
+              f"±{results[name]['noise'] * 100:>4.0f}%")
+
+    if args.json:
+        with open(args.json, "w") as out:
+            json.dump({"meta": metadata(), "results": results}, out, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as source:
+            baseline = json.load(source)["results"]
+        if not compare(results, baseline, args.tolerance, args.repeat, args.confirm):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
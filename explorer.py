@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""
+Penjelajah ruang state The Mystery Adventure Bot.
+
+Mulai dari scene awal, setiap pilihan di setiap state dicoba dengan mesin
+permainan yang sebenarnya (tanpa output). State yang sudah pernah dicapai
+disimpan di tabel transposisi sehingga setiap state hanya dijelajahi
+sekali, bukan setiap urutan pilihan dimainkan ulang.
+
+Kunci tabel transposisi adalah scene, lokasi, kesehatan, energi, quest dan
+item yang dibaca oleh suatu syarat (guard). Item lain hanya ditampilkan dan
+tidak bisa mengubah jalan cerita, jadi tidak ikut dibedakan; tanpa ini
+setiap kombinasi belanjaan di toko menjadi state tersendiri. Untuk kunci
+yang sama hanya state dengan uang terbanyak yang dijelajahi.
+
+Jika sebuah state kembali ke kunci salah satu leluhurnya dengan uang atau
+item yang lebih banyak, loop di antaranya bisa diulang tanpa batas (seperti
+pohon Karp-Miller). Loop dilaporkan jika satu putaran lagi memang kembali
+ke kunci yang sama dan menambah sumber daya lagi, dan uangnya dinaikkan ke
+omega supaya penjelajahan tetap selesai.
+
+    python explorer.py
+"""
+
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from headless import SilentBot
+from main import MysteryAdventureBot
+from scenegraph import (GRAPH, G_ENERGY_LE, G_HAS, G_MONEY_GE, G_NEVER, G_NOT, G_QUEST,
+                        G_VISITED, Guard, SceneGraph)
+from state import ITEMS, QUESTS, GameState
+
+# Uang yang bisa bertambah tanpa batas
+OMEGA = float("inf")
+_LARGE_MONEY = 10 ** 12
+
+# Isi GameState: (scene, kesehatan, energi, uang, lokasi, inventory, quest,
+# lokasi dikunjungi, game_over, ending_type). Scene yang sudah dilihat (seen)
+# tidak ikut: ia hanya memilih enter atau revisit, yang op state-nya sama.
+Snapshot = Tuple
+StateKey = Tuple
+
+
+class Loop(NamedTuple):
+    scenes: Tuple[str, ...]       # scene yang dilalui satu putaran loop
+    route: Tuple[int, ...]        # pilihan dari scene awal sampai awal loop
+    grows: Tuple[str, ...]        # sumber daya yang terus bertambah
+
+
+class ExplorationReport(NamedTuple):
+    states: int
+    transitions: int
+    endings: Dict[str, Tuple[int, ...]]      # ending -> rute pilihan
+    unreachable_endings: Tuple[str, ...]
+    unreachable_scenes: Tuple[str, ...]
+    dead_ends: Tuple[Tuple[str, Tuple[int, ...]], ...]
+    loops: Tuple[Loop, ...]
+    never_true: Tuple[Tuple[str, Guard], ...]  # (scene, guard)
+
+
+class _Entry:
+    __slots__ = ("state", "parent", "choice")
+
+    def __init__(self, state: Snapshot, parent: Optional[StateKey], choice: int):
+        self.state = state
+        self.parent = parent
+        self.choice = choice
+
+
+class ProbeBot(SilentBot):
+    """Bot tanpa output yang mencatat hasil setiap guard yang dievaluasi"""
+
+    def __init__(self, graph: SceneGraph = GRAPH):
+        super().__init__(graph)
+        # (indeks scene, guard) -> hasil evaluasi yang pernah terjadi
+        self.guard_results: Dict[Tuple[int, Guard], Set[bool]] = {}
+
+    def check(self, guard: Guard) -> bool:
+        result = super().check(guard)
+        self.guard_results.setdefault((self.state.scene, guard), set()).add(result)
+        return result
+
+
+def snapshot(state: GameState) -> Snapshot:
+    return (state.scene, state.health, state.energy, state.money, state.current_location,
+            state.items, state.quests, state.visited, state.game_over, state.ending_type)
+
+
+def restore(snap: Snapshot) -> GameState:
+    state = GameState(snap[0])
+    (state.health, state.energy, state.money, state.current_location, state.items,
+     state.quests, state.visited, state.game_over, state.ending_type) = snap[1:]
+    return state
+
+
+def step(bot: MysteryAdventureBot, snap: Snapshot, choice: int) -> Snapshot:
+    """State setelah memainkan scene `snap` dengan pilihan `choice` (0 = tanpa pilihan)"""
+    bot.state = restore(snap)
+    play = bot.play_scene(snap[0])
+    try:
+        next(play)
+        play.send(str(choice))
+    except StopIteration as stop:
+        bot.state.scene = stop.value
+    return snapshot(bot.state)
+
+
+def successors(bot: MysteryAdventureBot, snap: Snapshot) -> List[Tuple[int, Snapshot]]:
+    """State berikutnya untuk setiap pilihan di scene `snap`"""
+    scene = bot.graph[snap[0]]
+    return [(choice, step(bot, snap, choice))
+            for choice in (range(1, len(scene.choices) + 1) if scene.choices else (0,))]
+
+
+def _unwrap(guard: Guard) -> Guard:
+    while guard[0] == G_NOT:
+        guard = guard[1]
+    return guard
+
+
+class _Abstraction:
+    """Membuat kunci tabel transposisi dari bagian state yang dibaca guard"""
+
+    def __init__(self, graph: SceneGraph):
+        self.reads = graph.guard_reads()
+
+    def key(self, snap: Snapshot) -> StateKey:
+        reads = self.reads
+        return (snap[0], snap[1], snap[2], snap[4], reads.item_bits(snap[5]),
+                snap[6] & reads.quest_mask) + snap[7:]
+
+
+def _grown(old: Snapshot, new: Snapshot) -> List[str]:
+    """Sumber daya yang lebih banyak di `new` daripada di `old`"""
+    grows = ["uang"] if new[3] > old[3] else []
+    old_items = old[5]
+    for item_id, count in enumerate(new[5]):
+        if count > (old_items[item_id] if item_id < len(old_items) else 0):
+            grows.append(ITEMS.name(item_id))
+    return grows
+
+
+def explore(graph: SceneGraph = GRAPH) -> ExplorationReport:
+    """Menjelajahi semua state yang bisa dicapai dari scene awal (BFS)"""
+    bot = ProbeBot(graph)
+    abstraction = _Abstraction(graph)
+
+    start = snapshot(GameState())
+    start_key = abstraction.key(start)
+    table: Dict[StateKey, _Entry] = {start_key: _Entry(start, None, 0)}
+    edges: Dict[StateKey, Set[StateKey]] = {}
+    queue = deque([start_key])
+    queued = {start_key}
+    endings: Dict[str, Tuple[int, ...]] = {}
+    # Loop terpendek untuk setiap kumpulan sumber daya yang bisa bertambah tanpa batas
+    loops: Dict[frozenset, Loop] = {}
+    transitions = 0
+
+    def route(key: Optional[StateKey]) -> List[StateKey]:
+        keys = []
+        while key is not None:
+            keys.append(key)
+            key = table[key].parent
+        keys.reverse()
+        return keys
+
+    def choices(keys: List[StateKey]) -> Tuple[int, ...]:
+        return tuple(table[key].choice for key in keys[1:] if table[key].choice)
+
+    while queue:
+        key = queue.popleft()
+        queued.discard(key)
+        state = table[key].state
+        targets = edges.setdefault(key, set())
+        if state[8]:
+            endings.setdefault(state[9], choices(route(key)))
+            continue
+        for choice, child in successors(bot, state):
+            transitions += 1
+            child_key = abstraction.key(child)
+            targets.add(child_key)
+            entry = table.get(child_key)
+            if entry is None:
+                table[child_key] = _Entry(child, key, choice)
+            else:
+                grows = _grown(entry.state, child)
+                if not grows:
+                    continue
+                path = route(key)
+                if child_key in path:
+                    # Kembali ke leluhur dengan sumber daya lebih banyak. Loop
+                    # dilaporkan jika mengulangnya sekali lagi memang kembali
+                    # ke kunci yang sama dan menambah sumber daya lagi.
+                    start_at = path.index(child_key)
+                    cycle_choices = [table[k].choice for k in path[start_at + 1:]] + [choice]
+                    # Uang omega diganti angka besar agar pertambahannya terlihat
+                    again = child if child[3] != OMEGA else child[:3] + (_LARGE_MONEY,) + child[4:]
+                    before = again
+                    for cycle_choice in cycle_choices:
+                        again = step(bot, again, cycle_choice)
+                    grows = _grown(before, again)
+                    if abstraction.key(again) == child_key and grows:
+                        cycle = tuple(graph[k[0]].id for k in path[start_at:]) + (graph[child_key[0]].id,)
+                        signature = frozenset(grows)
+                        known = loops.get(signature)
+                        if known is None or len(cycle) < len(known.scenes):
+                            loops[signature] = Loop(cycle, choices(path[:start_at + 1]), tuple(grows))
+                    if child[3] <= entry.state[3]:
+                        continue
+                    entry.state = child[:3] + (OMEGA,) + child[4:]
+                elif child[3] > entry.state[3]:
+                    # Jalan lain ke kunci yang sama dengan uang lebih banyak
+                    table[child_key] = _Entry(child, key, choice)
+                else:
+                    continue
+            if child_key not in queued:
+                queued.add(child_key)
+                queue.append(child_key)
+
+    # Dead end: state yang tidak bisa lagi mencapai ending apa pun
+    reverse: Dict[StateKey, List[StateKey]] = {}
+    for key, targets in edges.items():
+        for target in targets:
+            reverse.setdefault(target, []).append(key)
+    alive = {key for key, entry in table.items() if entry.state[8]}
+    stack = list(alive)
+    while stack:
+        for source in reverse.get(stack.pop(), ()):
+            if source not in alive:
+                alive.add(source)
+                stack.append(source)
+    dead: Dict[str, Tuple[int, ...]] = {}
+    for key in table:
+        scene_id = graph[key[0]].id
+        if key not in alive and scene_id not in dead:
+            dead[scene_id] = choices(route(key))
+
+    # Guard yang pasti tidak pernah terpenuhi, ditambah guard yang selalu
+    # bernilai False di semua state yang dicapai
+    never_true = [(scene.id, _unwrap(guard)) for scene, _, guard in graph.walk()
+                  if guard is not None and _unwrap(guard)[0] == G_NEVER]
+    for (index, guard), results in bot.guard_results.items():
+        if results == {False} and _unwrap(guard)[0] != G_NEVER:
+            never_true.append((graph[index].id, guard))
+
+    reached_scenes = {key[0] for key in table}
+    return ExplorationReport(
+        states=len(table),
+        transitions=transitions,
+        endings=endings,
+        unreachable_endings=tuple(ending for ending in graph.endings() if ending not in endings),
+        unreachable_scenes=tuple(scene.id for scene in graph.scenes
+                                 if scene.index not in reached_scenes),
+        dead_ends=tuple(dead.items()),
+        # Loop yang hanya gabungan dari loop lain yang lebih kecil tidak dilaporkan
+        loops=tuple(loop for signature, loop in loops.items()
+                    if not any(other < signature for other in loops)),
+        never_true=tuple(never_true),
+    )
+
+
+def describe(guard: Guard) -> str:
+    """Guard hasil kompilasi dalam bentuk yang mudah dibaca"""
+    code = guard[0]
+    if code == G_NOT:
+        return f"not {describe(guard[1])}"
+    if code == G_HAS:
+        return f'has_item("{ITEMS.name(guard[1])}")'
+    if code == G_NEVER:
+        return f'has_item("{guard[1]}") (tidak ada item bernama ini)'
+    if code == G_QUEST:
+        return f'has_quest("{QUESTS.name(guard[1])}")'
+    if code == G_VISITED:
+        return "visited_locations"
+    if code == G_ENERGY_LE:
+        return f"energy <= {guard[1]}"
+    if code == G_MONEY_GE:
+        return f"money >= {guard[1]}"
+    return repr(guard)
+
+
+def _print_report(report: ExplorationReport):
+    print(f"State unik      : {report.states:,}")
+    print(f"Transisi        : {report.transitions:,}")
+
+    print("\n🏁 ENDING YANG BISA DICAPAI:")
+    for ending, route in sorted(report.endings.items()):
+        print(f"   {ending:<32} rute: {' '.join(map(str, route))}")
+    print("\n🚫 ENDING YANG TIDAK BISA DICAPAI:")
+    for ending in report.unreachable_endings or ("-",):
+        print(f"   {ending}")
+    print("\n🚫 SCENE YANG TIDAK BISA DICAPAI:")
+    for scene_id in report.unreachable_scenes or ("-",):
+        print(f"   {scene_id}")
+    print("\n🧱 DEAD END (tidak ada jalan menuju ending):")
+    for scene_id, route in report.dead_ends:
+        print(f"   {scene_id:<32} rute: {' '.join(map(str, route))}")
+    if not report.dead_ends:
+        print("   -")
+    print("\n🔁 LOOP TAK TERBATAS:")
+    for loop in report.loops:
+        print(f"   {', '.join(loop.grows)}")
+        print(f"      {' -> '.join(loop.scenes)}")
+        print(f"      rute ke awal loop: {' '.join(map(str, loop.route))}")
+    if not report.loops:
+        print("   -")
+    print("\n❓ SYARAT YANG TIDAK PERNAH TERPENUHI:")
+    for scene_id, guard in report.never_true:
+        print(f"   {scene_id:<32} {describe(guard)}")
+    if not report.never_true:
+        print("   -")
+
+
+if __name__ == "__main__":
+    import time
+
+    started = time.perf_counter()
+    result = explore()
+    _print_report(result)
+    print(f"\nSelesai dalam {time.perf_counter() - started:.2f} detik")
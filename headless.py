@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Mode headless untuk The Mystery Adventure Bot.
+
+Permainan dijalankan dari skrip pilihan (daftar nomor pilihan) tanpa
+keyboard, tanpa efek mengetik, tanpa jeda dan tanpa clear screen, sehingga
+satu playthrough selesai secepat CPU mengizinkan.
+"""
+
+from typing import Any, Dict, Iterable, Optional, TextIO
+
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from scenegraph import SceneGraph
+from sinks import Sink
+from state import GameState
+from terminal import AnsiTerminal
+
+
+class NullStream(Sink):
+    """Sink yang membuang semua output, tanpa menampungnya"""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+class ScriptedInput:
+    """Sumber jawaban pemain dari daftar nomor pilihan"""
+
+    def __init__(self, script: Iterable[int]):
+        self._script = iter(script)
+
+    def __call__(self) -> str:
+        try:
+            return str(next(self._script))
+        except StopIteration:
+            # Sama seperti input() saat stdin habis
+            raise EOFError("skrip pilihan habis") from None
+
+
+class SilentBot(MysteryAdventureBot):
+    """Bot tanpa output sama sekali, untuk alat analisis dan simulasi.
+
+    Pilihan dikirim langsung lewat session().send() atau play_scene().
+    """
+
+    def __init__(self, graph: Optional[SceneGraph] = None):
+        terminal = AnsiTerminal(NullStream(), enabled=False)
+        super().__init__(TypewriterRenderer(stream=terminal, instant=True), terminal,
+                         graph=graph)
+
+    def clear_screen(self):
+        pass
+
+    def slow_print(self, text: str, delay: float = 0.03):
+        pass
+
+    def pause(self, seconds: float):
+        pass
+
+    def display_stats(self):
+        pass
+
+    def show_inventory(self):
+        pass
+
+    def _op_say(self, text: str, delay: float):
+        pass
+
+    def _op_print(self, text: str):
+        pass
+
+    def _op_printf(self, template: str):
+        pass
+
+
+def advance(bot: SilentBot, state: GameState, choice: int) -> GameState:
+    """State di titik pilihan berikutnya setelah memilih `choice` di titik pilihan `state`.
+
+    `state` tidak berubah: bot memainkan salinan fork()-nya, sehingga satu
+    state bisa dicabangkan ke semua pilihannya (petunjuk, solver, pratinjau
+    "bagaimana jika"). Jika permainan berakhir, state akhir yang dikembalikan.
+    """
+    bot.state = state.fork()
+    session = bot.session(resume=True)
+    next(session)
+    try:
+        session.send(str(choice))
+    except StopIteration:
+        pass
+    session.close()
+    return bot.state
+
+
+def headless_bot(script: Iterable[int], stream: Optional[TextIO] = None) -> MysteryAdventureBot:
+    """Membuat bot yang membaca pilihan dari skrip dan menulis ke `stream`"""
+    terminal = AnsiTerminal(stream or NullStream(), enabled=False,
+                            read_line=ScriptedInput(script))
+    return MysteryAdventureBot(TypewriterRenderer(stream=terminal, instant=True), terminal)
+
+
+def final_state(bot: MysteryAdventureBot) -> Dict[str, Any]:
+    """Ringkasan keadaan akhir sebuah sesi"""
+    return {
+        "ending_type": bot.ending_type,
+        "money": bot.money,
+        "inventory": list(bot.inventory),
+        "completed_quests": set(bot.completed_quests),
+    }
+
+
+def run_headless(script: Iterable[int], stream: Optional[TextIO] = None) -> Dict[str, Any]:
+    """Memainkan satu playthrough dari skrip pilihan.
+
+    Output dibuang kecuali `stream` diberikan (misalnya io.StringIO atau
+    sinks.BufferSink); stdout tidak pernah disentuh. Jika
+    skrip habis sebelum permainan berakhir, keadaan saat itu dikembalikan
+    dengan ending_type None.
+    """
+    bot = headless_bot(script, stream)
+    try:
+        bot.play()
+    except EOFError:
+        pass
+    return final_state(bot)
+
+
+if __name__ == "__main__":
+    import sys
+
+    print(run_headless(int(arg) for arg in sys.argv[1:]))
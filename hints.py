@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+Petunjuk rute terpendek ke sebuah ending untuk The Mystery Adventure Bot.
+
+RouteSolver menjelajahi graf state permainan dari titik pilihan ke titik
+pilihan (headless.advance) lalu menghitung, untuk setiap state kanonik,
+biaya terpendek ke ending tujuan beserta pilihan pertamanya: dalam giliran
+(jumlah pilihan) atau energi yang dipakai lewat use_energy (Dijkstra
+mundur dari state ending). Setelah dihitung, hint() hanya satu lookup dict;
+state yang belum pernah dicapai dijelajahi sekali lalu ikut disimpan.
+
+State kanonik hanya berisi bagian state yang dibaca guard atau op: scene,
+energi, item dan quest yang dibaca guard, ambang money_ge yang terpenuhi,
+apakah sudah pernah mengunjungi lokasi, dan ending. Kesehatan, lokasi,
+scene yang sudah dilihat dan item lain tidak pernah mengubah jalan cerita.
+Uang hanya dibedakan per ambang, jadi untuk setiap kunci hanya state yang
+pertama dicapai yang dijelajahi; tanpa itu loop yang menambah uang membuat
+penjelajahan tidak pernah selesai. Rute yang harus belanja berkali-kali
+bisa berbeda sedikit dari kenyataan, tetapi petunjuk dihitung ulang dari
+state pemain yang sebenarnya setiap giliran.
+
+    python hints.py [--cost energy] [PILIHAN...]
+"""
+
+import bisect
+import heapq
+import weakref
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from headless import SilentBot, advance
+from scenegraph import SceneGraph, default_graph
+from state import GameState
+
+BEST_ENDING = "ENDING TERBAIK ⭐"
+
+# Ukuran biaya rute
+TURNS = "turns"
+ENERGY = "energy"
+COSTS = (TURNS, ENERGY)
+
+# (scene, energi, ambang uang, item guard, quest guard, pernah berkunjung,
+# game_over, ending_type)
+StateKey = Tuple
+
+# Biaya untuk state yang tidak bisa mencapai ending tujuan
+_UNREACHABLE = -1
+_NO_NEXT = -1
+
+
+class Hint(NamedTuple):
+    choice: int                 # nomor pilihan berikutnya
+    label: str                  # teks pilihan itu di menu
+    cost: int                   # giliran atau energi sampai ending
+    route: Tuple[int, ...]      # semua pilihan sampai ending, mulai dari `choice`
+
+
+class _CostBot(SilentBot):
+    """Bot tanpa output yang menjumlahkan energi yang dipakai lewat use_energy"""
+
+    def __init__(self, graph: Optional[SceneGraph] = None):
+        super().__init__(graph)
+        self.spent = 0
+
+    def use_energy(self, energy_loss: int):
+        self.spent += energy_loss
+        super().use_energy(energy_loss)
+
+
+class RouteSolver:
+    """Tabel rute terpendek ke `ending` untuk setiap state kanonik yang bisa dicapai"""
+
+    def __init__(self, graph: Optional[SceneGraph] = None, ending: str = BEST_ENDING):
+        graph = graph or default_graph()
+        if ending not in graph.endings():
+            raise ValueError(f"ending tidak dikenal: {ending}")
+        self.graph = graph
+        self.ending = ending
+        # Bagian state yang dibaca guard, sama dengan kunci explorer.py
+        self._reads = graph.guard_reads()
+        self._bot = _CostBot(graph)
+        # Kunci -> nomor state; biaya, pilihan dan state berikutnya per ukuran biaya
+        self._ids: Dict[StateKey, int] = {}
+        self._cost = {cost: array("l") for cost in COSTS}
+        self._choice = {cost: array("B") for cost in COSTS}
+        self._next = {cost: array("l") for cost in COSTS}
+        self.transitions = 0
+        start = SilentBot(graph)
+        next(start.session())
+        self._solve(start.state)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def key(self, state: GameState) -> StateKey:
+        """Kunci kanonik `state`"""
+        reads = self._reads
+        return (state.scene, state.energy,
+                bisect.bisect_right(reads.money_thresholds, state.money),
+                reads.item_bits(state.items), state.quests & reads.quest_mask,
+                state.visited != 0, state.game_over, state.ending_type)
+
+    def hint(self, state: GameState, cost: str = TURNS) -> Optional[Hint]:
+        """Pilihan pertama rute termurah dari `state` (titik pilihan atau state
+        akhir) ke ending tujuan; None jika ending itu tidak bisa dicapai lagi"""
+        ident = self._ids.get(self.key(state))
+        if ident is None:
+            ident = self._solve(state)
+        total = self._cost[cost][ident]
+        if total == _UNREACHABLE or state.game_over:
+            return None
+        choices, nexts = self._choice[cost], self._next[cost]
+        route = []
+        step = ident
+        while nexts[step] != _NO_NEXT:
+            route.append(choices[step])
+            step = nexts[step]
+        return Hint(route[0], self.graph[state.scene].labels[route[0] - 1], total, tuple(route))
+
+    def _solve(self, root: GameState) -> int:
+        """Menjelajahi semua state baru yang bisa dicapai dari `root` dan
+        menghitung biayanya; mengembalikan nomor state `root`"""
+        bot, ids = self._bot, self._ids
+        first = len(ids)
+        root_key = self.key(root)
+        ids[root_key] = first
+        states = [root]
+        edges: List[List[Tuple[int, int, int]]] = [[]]
+        # `states` sekaligus antrean BFS: state baru ditambahkan di belakang
+        position = 0
+        while position < len(states):
+            state = states[position]
+            targets = edges[position]
+            position += 1
+            if state.game_over:
+                continue
+            for choice in range(1, len(self.graph[state.scene].choices) + 1):
+                bot.spent = 0
+                child = advance(bot, state, choice)
+                self.transitions += 1
+                child_key = self.key(child)
+                child_id = ids.get(child_key)
+                if child_id is None:
+                    child_id = ids[child_key] = len(ids)
+                    states.append(child)
+                    edges.append([])
+                targets.append((choice, child_id, bot.spent))
+
+        # Biaya dihitung mundur dari ending tujuan dan dari state lama yang
+        # biayanya sudah diketahui
+        reverse: Dict[int, List[Tuple[int, int, int]]] = {}
+        for ident, targets in enumerate(edges, first):
+            for choice, child_id, spent in targets:
+                reverse.setdefault(child_id, []).append((ident, choice, spent))
+        for cost in COSTS:
+            known = self._cost[cost]
+            costs = [_UNREACHABLE] * len(states)
+            choices = bytearray(len(states))
+            nexts = [_NO_NEXT] * len(states)
+            heap = [(known[child_id], child_id) for child_id in reverse
+                    if child_id < first and known[child_id] != _UNREACHABLE]
+            for ident, state in enumerate(states, first):
+                if state.game_over and state.ending_type == self.ending:
+                    costs[ident - first] = 0
+                    heap.append((0, ident))
+            heapq.heapify(heap)
+            while heap:
+                total, child_id = heapq.heappop(heap)
+                if child_id >= first and total > costs[child_id - first]:
+                    continue
+                for ident, choice, spent in reverse.get(child_id, ()):
+                    new = total + (1 if cost == TURNS else spent)
+                    old = costs[ident - first]
+                    if old == _UNREACHABLE or new < old:
+                        costs[ident - first] = new
+                        choices[ident - first] = choice
+                        nexts[ident - first] = child_id
+                        heapq.heappush(heap, (new, ident))
+            known.extend(costs)
+            self._choice[cost].extend(choices)
+            self._next[cost].extend(nexts)
+        return ids[root_key]
+
+
+_SOLVERS: "weakref.WeakKeyDictionary[SceneGraph, Dict[str, RouteSolver]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def solver_for(graph: Optional[SceneGraph] = None, ending: str = BEST_ENDING) -> RouteSolver:
+    """RouteSolver untuk `graph` dan `ending`, dibuat sekali per graf"""
+    graph = graph or default_graph()
+    solvers = _SOLVERS.setdefault(graph, {})
+    solver = solvers.get(ending)
+    if solver is None:
+        solver = solvers[ending] = RouteSolver(graph, ending)
+    return solver
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Rute terpendek ke ENDING TERBAIK")
+    parser.add_argument("choices", nargs="*", type=int, help="pilihan yang sudah dimainkan")
+    parser.add_argument("--cost", choices=COSTS, default=TURNS)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    solver = solver_for()
+    print(f"{len(solver):,} state, {solver.transitions:,} transisi "
+          f"dalam {time.perf_counter() - started:.1f} detik")
+    bot = SilentBot()
+    session = bot.session()
+    next(session)
+    try:
+        for choice in args.choices:
+            session.send(str(choice))
+    except StopIteration:
+        pass
+    hint = solver.hint(bot.state, args.cost)
+    if hint is None:
+        print(f"{BEST_ENDING} tidak bisa dicapai lagi dari {bot.current_scene}")
+    else:
+        print(f"{bot.current_scene}: pilih {hint.choice} ({hint.label})")
+        print(f"rute: {' '.join(map(str, hint.route))}  "
+              f"({hint.cost} {'giliran' if args.cost == TURNS else 'energi'})")
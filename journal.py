@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Jurnal pilihan append-only untuk The Mystery Adventure Bot.
+
+Permainan tidak memakai angka acak: satu sesi ditentukan sepenuhnya oleh
+urutan nomor pilihan yang dikembalikan get_player_choice (termasuk nomor
+barang di toko). Jurnal menyimpan urutan itu saja, sebagai record varint
+
+    varint(id sesi) varint(nomor pilihan)
+
+dengan nomor 0 sebagai tanda awal sesi. Satu pilihan biasanya hanya dua
+byte. Record ditampung di memori dan ditulis bersama-sama lalu di-fsync
+(group commit), jadi disk tidak disentuh di setiap ketukan tombol.
+
+Setelah crash, record terakhir yang terpotong dibuang saat jurnal dibuka
+lagi dan setiap sesi bisa dibangun ulang dengan replay() tanpa output:
+
+    python journal.py game.journal [ID_SESI]
+"""
+
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from headless import SilentBot
+from main import MysteryAdventureBot
+from scenegraph import SceneGraph
+
+# Nomor pilihan yang menandai awal sebuah sesi
+SESSION_START = 0
+
+
+def encode_varint(value: int, out: bytearray):
+    """Menambahkan `value` (>= 0) ke `out` sebagai varint LEB128"""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varints(data: bytes) -> Iterator[Tuple[int, int]]:
+    """Pasangan (nilai, offset setelah nilai) untuk setiap varint lengkap di `data`"""
+    value = shift = 0
+    for offset, byte in enumerate(data, 1):
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value, offset
+            value = shift = 0
+
+
+def read_records(data: bytes) -> Tuple[List[Tuple[int, int]], int]:
+    """Record (sesi, pilihan) yang lengkap dan panjang byte yang terpakai"""
+    records, used, session = [], 0, None
+    for value, offset in decode_varints(data):
+        if session is None:
+            session = value
+        else:
+            records.append((session, value))
+            session, used = None, offset
+    return records, used
+
+
+def sessions(records: Iterable[Tuple[int, int]]) -> Dict[int, List[int]]:
+    """Nomor pilihan setiap sesi, urut sesuai jurnal"""
+    choices: Dict[int, List[int]] = {}
+    for session, choice in records:
+        if choice == SESSION_START:
+            choices[session] = []
+        else:
+            choices.setdefault(session, []).append(choice)
+    return choices
+
+
+def load(path: str) -> Dict[int, List[int]]:
+    """Membaca file jurnal menjadi nomor pilihan per sesi"""
+    with open(path, "rb") as source:
+        return sessions(read_records(source.read())[0])
+
+
+class Journal:
+    """File jurnal append-only dengan group commit.
+
+    Record yang ditambahkan lewat append() baru ditulis ke disk dan di-fsync
+    oleh commit(), yang dipanggil otomatis setelah `max_records` record atau
+    jika commit terakhir sudah lebih dari `max_delay` detik yang lalu. Pemilik
+    jurnal yang bisa diam lama (misalnya server) sebaiknya memanggil commit()
+    secara berkala juga.
+    """
+
+    def __init__(self, path: str, max_records: int = 512, max_delay: float = 0.05):
+        self.path = path
+        self.max_records = max_records
+        self.max_delay = max_delay
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._buffer = bytearray()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        self.next_session = self._recover()
+
+    def _recover(self) -> int:
+        """Membuang record terpotong di akhir file; mengembalikan id sesi berikutnya"""
+        with open(self.path, "rb") as source:
+            data = source.read()
+        records, used = read_records(data)
+        if used != len(data):
+            os.ftruncate(self._fd, used)
+            os.fsync(self._fd)
+        return max((session for session, _ in records), default=-1) + 1
+
+    def start_session(self) -> int:
+        """Mencatat awal sesi baru dan mengembalikan id-nya"""
+        session = self.next_session
+        self.next_session += 1
+        self.append(session, SESSION_START)
+        return session
+
+    def append(self, session: int, choice: int):
+        encode_varint(session, self._buffer)
+        encode_varint(choice, self._buffer)
+        self._pending += 1
+        if (self._pending >= self.max_records
+                or time.monotonic() - self._last_commit >= self.max_delay):
+            self.commit()
+
+    def commit(self):
+        """Menulis semua record yang tertunda dan menunggu sampai tersimpan di disk"""
+        self._last_commit = time.monotonic()
+        if not self._buffer:
+            return
+        data = memoryview(self._buffer)
+        while data:
+            data = data[os.write(self._fd, data):]
+        data.release()
+        _sync(self._fd)
+        self._buffer.clear()
+        self._pending = 0
+
+    def close(self):
+        if self._fd is not None:
+            self.commit()
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# fdatasync cukup untuk file append-only dan tidak ada di semua platform
+_sync = getattr(os, "fdatasync", os.fsync)
+
+
+class JournaledBot(MysteryAdventureBot):
+    """Bot yang mencatat setiap pilihan pemain ke jurnal.
+
+    Tanpa `session_id` sesi baru dimulai di jurnal; dengan `session_id`,
+    bot melanjutkan sesi yang sudah ada (misalnya setelah dipulihkan).
+    """
+
+    def __init__(self, journal: Journal, *args, session_id: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.journal = journal
+        self.session_id = journal.start_session() if session_id is None else session_id
+
+    def get_player_choice(self, choices: List[str], prompt: str = "\nPilihan Titi: ",
+                          default: Optional[int] = None):
+        choice = yield from super().get_player_choice(choices, prompt, default)
+        self.journal.append(self.session_id, choice)
+        return choice
+
+
+def replay(choices: Iterable[int], graph: Optional[SceneGraph] = None) -> MysteryAdventureBot:
+    """Membangun ulang state sebuah sesi dari nomor pilihannya, tanpa output.
+
+    Jika sesi belum selesai, bot berhenti di prompt pilihan berikutnya dan
+    permainan bisa dilanjutkan dengan session(resume=True).
+    """
+    bot = SilentBot(graph)
+    session = bot.session()
+    next(session)
+    try:
+        for choice in choices:
+            session.send(str(choice))
+    except StopIteration:
+        pass
+    session.close()
+    return bot
+
+
+if __name__ == "__main__":
+    import sys
+
+    journal = load(sys.argv[1])
+    wanted = [int(arg) for arg in sys.argv[2:]] or sorted(journal)
+    for session in wanted:
+        bot = replay(journal[session])
+        print(f"sesi {session}: {len(journal[session])} pilihan, "
+              f"scene {bot.current_scene}, uang {bot.money}, ending {bot.ending_type}")
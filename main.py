@@ -6,1103 +6,431 @@ Petualangan Interaktif Pencarian Harta Karun di Panjatan
 Karakter Utama: Titi
 """
 
-import time
-import os
-from typing import Dict, List, Tuple
+import argparse
+from collections import deque
+from operator import attrgetter
+from typing import Deque, List, Optional, Set, Tuple
+
+import savegame
+from renderer import TypewriterRenderer
+from scenegraph import (G_ENERGY_LE, G_HAS, G_MONEY_GE, G_NOT, G_QUEST, G_VISITED,
+                        RENDER_OPS, Guard, Op, SceneGraph, Target, default_graph)
+from state import ITEMS, LOCATIONS, QUESTS, GameState, bit_ids
+from terminal import AnsiTerminal
+from textcache import RENDER_CACHE, pad
+
+
+def parse_choice(answer: str, count: int) -> Optional[int]:
+    """Nomor pilihan 1..`count` dari jawaban pemain, None jika tidak valid"""
+    try:
+        choice = int(answer)
+    except (TypeError, ValueError):
+        return None
+    return choice if 1 <= choice <= count else None
+
+
+def _ends(target: Target) -> bool:
+    """Apakah tujuan ini mengakhiri permainan (tidak ada scene berikutnya)"""
+    return all(index is None for _, index in target)
+
+
+def _skip(self, *args):
+    pass
+
+
+def _state_field(name: str) -> property:
+    """Atribut bot yang disimpan di GameState.
+
+    Hanya untuk pemakai dari luar; op di engine membaca self.state sekali
+    dan memakai field-nya langsung.
+    """
+    def set_field(self, value):
+        setattr(self.state, name, value)
+    return property(attrgetter("state." + name), set_field)
+
 
 class MysteryAdventureBot:
-    def __init__(self):
+    health = _state_field("health")
+    energy = _state_field("energy")
+    money = _state_field("money")
+    current_location = _state_field("current_location")
+    game_over = _state_field("game_over")
+    ending_type = _state_field("ending_type")
+    
+    # Method untuk setiap kode op, diurutkan sesuai nilai kode op di scenegraph
+    _OP_METHODS = (
+        "clear_screen",     # CLEAR
+        "_op_say",          # SAY
+        "_op_print",        # PRINT
+        "_op_printf",       # PRINTF
+        "pause",            # PAUSE
+        "display_stats",    # STATS
+        "show_inventory",   # INVENTORY
+        "_op_location",     # LOCATION
+        "use_energy",       # USE_ENERGY
+        "_op_gain_energy",  # GAIN_ENERGY
+        "_op_set_energy",   # SET_ENERGY
+        "_op_set_health",   # SET_HEALTH
+        "_op_health",       # HEALTH
+        "_op_money",        # MONEY
+        "_op_set_money",    # SET_MONEY
+        "_op_item",         # ITEM
+        "_op_drop",         # DROP
+        "_op_quest",        # QUEST
+        "_op_end",          # END
+        "_op_if",           # IF
+    )
+    
+    # Op yang dilewati di scene yang dilewati type-ahead
+    _RENDER_OPS = RENDER_OPS
+    
+    # Teks cerita yang sudah diformat, dipakai bersama oleh semua sesi
+    render_cache = RENDER_CACHE
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclass yang meng-override method op tetap dipanggil oleh run_ops
+        cls._OP_HANDLERS = cls._op_handlers()
+        cls._QUIET_HANDLERS = cls._quiet_handlers()
+    
+    @classmethod
+    def _op_handlers(cls) -> tuple:
+        return tuple(getattr(cls, name) for name in cls._OP_METHODS)
+    
+    @classmethod
+    def _quiet_handlers(cls) -> tuple:
+        return tuple(_skip if code in cls._RENDER_OPS else handler
+                     for code, handler in enumerate(cls._op_handlers()))
+    
+    def __init__(self,
+                 renderer: Optional[TypewriterRenderer] = None,
+                 terminal: Optional[AnsiTerminal] = None,
+                 state: Optional[GameState] = None,
+                 graph: Optional[SceneGraph] = None):
         self.name = "Titi"
-        self.health = 100
-        self.energy = 100
-        self.inventory = []
-        self.visited_locations = set()
-        self.completed_quests = set()
-        self.money = 0
-        self.current_location = "Desa Panjatan"
-        self.game_over = False
-        self.ending_type = None
+        self.state = state or GameState()
+        self.graph = graph or default_graph()
+        self.terminal = terminal or AnsiTerminal()
+        self.renderer = renderer or TypewriterRenderer(stream=self.terminal)
+        # Pilihan yang sudah diketik pemain untuk titik pilihan berikutnya
+        self.typeahead: Deque[str] = deque()
         
     def clear_screen(self):
         """Membersihkan layar terminal"""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        self.terminal.clear()
     
     def slow_print(self, text: str, delay: float = 0.03):
         """Mencetak teks dengan efek mengetik"""
-        for char in text:
-            print(char, end='', flush=True)
-            time.sleep(delay)
-        print()
+        if not self.typeahead:
+            self.renderer.type(text + "\n", delay)
+    
+    def pause(self, seconds: float):
+        """Memberi jeda sebelum cerita berlanjut"""
+        self.renderer.pause(seconds)
     
     def display_stats(self):
         """Menampilkan status pemain"""
-        print(f"\n┌─────────────────────────────────────────┐")
-        print(f"│ Nama     : {self.name:<30} │")
-        print(f"│ Lokasi   : {self.current_location:<30} │")
-        print(f"│ Kesehatan: {self.health:<30} │")
-        print(f"│ Energi   : {self.energy:<30} │")
-        print(f"│ Uang     : Rp {self.money:<27} │")
-        print(f"│ Inventory: {len(self.inventory):<30} │")
-        print(f"└─────────────────────────────────────────┘\n")
+        locale = self.terminal.locale
+        state = self.state
+        # Lebar kolom nilai; garis atas dan bawah mengikuti lebar baris isi
+        width = 30
+        rule = "─" * (width + 13)
+        lines = [
+            f"┌{rule}┐",
+            f"│ Nama     : {pad(self.name, width, locale)} │",
+            f"│ Lokasi   : {pad(state.current_location, width, locale)} │",
+            f"│ Kesehatan: {state.health:<{width}} │",
+            f"│ Energi   : {state.energy:<{width}} │",
+            f"│ Uang     : Rp {state.money:<{width - 3}} │",
+            f"│ Inventory: {state.item_total():<{width}} │",
+            f"└{rule}┘",
+        ]
+        # Jika kotak status masih terlihat, cukup perbarui baris yang berubah
+        if not self.terminal.update_region("stats", lines):
+            print(file=self.terminal)
+            self.terminal.draw_region("stats", lines)
+            print(file=self.terminal)
     
     def show_inventory(self):
         """Menampilkan inventory pemain"""
-        print("\n📦 INVENTORY TITI:")
-        if not self.inventory:
-            print("   Inventory masih kosong")
+        print("\n📦 INVENTORY TITI:", file=self.terminal)
+        if not self.state.items:
+            print("   Inventory masih kosong", file=self.terminal)
         else:
             for i, item in enumerate(self.inventory, 1):
-                print(f"   {i}. {item}")
-        print()
+                print(f"   {i}. {item}", file=self.terminal)
+        print(file=self.terminal)
+    
+    @property
+    def current_scene(self) -> str:
+        """Id scene yang sedang dimainkan"""
+        return self.graph[self.state.scene].id
+    
+    @property
+    def inventory(self) -> List[str]:
+        """Nama item di inventory (item yang sama bisa muncul lebih dari sekali)"""
+        return [ITEMS.name(item_id) for item_id in self.state.item_ids()]
+    
+    @property
+    def completed_quests(self) -> Set[str]:
+        """Nama quest yang sudah selesai"""
+        return {QUESTS.name(quest_id) for quest_id in bit_ids(self.state.quests)}
+    
+    @property
+    def visited_locations(self) -> Set[str]:
+        """Nama lokasi yang sudah pernah dikunjungi"""
+        return {LOCATIONS.name(location_id) for location_id in bit_ids(self.state.visited)}
     
     def add_inventory(self, item: str):
         """Menambahkan item ke inventory"""
-        self.inventory.append(item)
+        self.state.add_item(ITEMS.id(item))
         self.slow_print(f"✓ Titi mengambil: {item}")
     
     def has_item(self, item: str) -> bool:
         """Mengecek apakah pemain memiliki item"""
-        return item in self.inventory
+        item_id = ITEMS.get(item)
+        return item_id is not None and self.state.item_count(item_id) > 0
     
     def remove_item(self, item: str):
         """Menghapus item dari inventory"""
-        if item in self.inventory:
-            self.inventory.remove(item)
-            return True
-        return False
+        item_id = ITEMS.get(item)
+        return item_id is not None and self.state.remove_item(item_id)
+    
+    def has_quest(self, quest: str) -> bool:
+        """Mengecek apakah quest sudah selesai"""
+        quest_id = QUESTS.get(quest)
+        return quest_id is not None and self.state.has_quest(quest_id)
+    
+    def complete_quest(self, quest: str):
+        """Menandai quest sebagai selesai"""
+        self.state.complete_quest(QUESTS.id(quest))
     
     def use_energy(self, energy_loss: int):
         """Menggunakan energi"""
-        self.energy = max(0, self.energy - energy_loss)
-        if self.energy <= 0:
+        state = self.state
+        state.energy = max(0, state.energy - energy_loss)
+        if state.energy <= 0:
             self.slow_print("\n⚠️ Titi sudah kelelahan! Harus istirahat...")
-            self.energy = 30
-    
-    def get_player_choice(self, choices: List[str]) -> int:
-        """Mendapatkan pilihan dari pemain"""
-        while True:
-            for i, choice in enumerate(choices, 1):
-                print(f"{i}. {choice}")
-            try:
-                choice = int(input("\nPilihan Titi: "))
-                if 1 <= choice <= len(choices):
-                    return choice
-            except ValueError:
-                pass
-            print("❌ Pilihan tidak valid! Coba lagi.\n")
+            state.energy = 30
     
-    # ==================== LOCATIONS ====================
-    
-    def location_desa_panjatan(self):
-        """Lokasi pertama - Desa Panjatan"""
-        self.clear_screen()
-        self.slow_print("=" * 50)
-        self.slow_print("🏘️  DESA PANJATAN - Awal Petualangan Titi 🏘️", delay=0.05)
-        self.slow_print("=" * 50)
-        
-        story = """
-Titi adalah seorang penjelajah muda yang pemberani. Dia baru tiba di Desa Panjatan,
-sebuah desa kecil yang dikelilingi hutan lebat dan pegunungan misteri.
-
-Konon kabarnya, harta karun legendaris tersembunyi di tempat ini. Harta karun itu
-dikumpulkan oleh seorang bandit zaman dulu dan diyakini masih terpendam hingga sekarang.
-
-Desa ini memiliki beberapa lokasi menarik:
-- Rumah Tua di tepi hutan (katanya pemiliknya tahu tentang harta karun)
-- Pasar Desa (tempat jual-beli)
-- Makam Tua (tempat yang dianggap angker)
-- Danau Panjatan (pemandangan indah tapi berbahaya)
-        """
-        self.slow_print(story)
-        
-        if self.visited_locations:
-            self.display_stats()
-            self.show_inventory()
-        
-        choices = [
-            "Pergi ke Rumah Tua",
-            "Kunjungi Pasar Desa",
-            "Jelajahi Makam Tua",
-            "Pergi ke Danau Panjatan",
-            "Istirahat di penginapan"
-        ]
+    def get_player_choice(self, choices: List[str], prompt: str = "\nPilihan Titi: ",
+                          default: Optional[int] = None):
+        """Mendapatkan pilihan dari pemain.
         
-        choice = self.get_player_choice(choices)
+        Berupa generator: prompt di-yield ke driver permainan dan jawaban
+        pemain dikirim kembali lewat send(), sehingga scene tidak perlu
+        menunggu input() secara langsung. Jawaban yang bukan nomor pilihan
+        tidak pernah melempar exception: pemain diminta mengulang, atau jika
+        `default` diberikan, pilihan `default` yang dipakai.
         
-        if choice == 1:
-            self.location_rumah_tua()
-        elif choice == 2:
-            self.location_pasar_desa()
-        elif choice == 3:
-            self.location_makam_tua()
-        elif choice == 4:
-            self.location_danau_panjatan()
-        elif choice == 5:
-            self.location_penginapan()
-    
-    def location_rumah_tua(self):
-        """Lokasi: Rumah Tua"""
-        self.clear_screen()
-        self.current_location = "Rumah Tua"
-        self.slow_print("=" * 50)
-        self.slow_print("🏚️  RUMAH TUA - Misteri Memanggilmu 🏚️", delay=0.05)
-        self.slow_print("=" * 50)
-        
-        story = """
-Rumah tua ini terlihat sangat tua dan ditinggalkan. Pintunya setengah terbuka
-dan terdengar angin berhembus lemah dari dalam.
-
-Saat Titi mendekat, seorang nenek tua keluar dari rumah!
-Wajahnya keriput namun matanya masih tajam.
-
-NENEK: "Halo nak! Kamu mencari apa di tempat ini?"
+        Jika pemain sudah mengetik pilihan lebih dulu (lihat queue_answers()),
+        pilihan dari antrean dipakai tanpa menggambar menu dan tanpa yield.
         """
-        self.slow_print(story)
-        self.use_energy(15)
-        
-        if not "Bertemu Nenek Penjaga" in self.completed_quests:
-            choices = [
-                "Bertanya tentang harta karun",
-                "Bertanya tentang desa ini",
-                "Mencuri barang di dalam rumah",
-                "Pergi dari sini"
-            ]
-            
-            choice = self.get_player_choice(choices)
-            
-            if choice == 1:
-                self.quest_harta_karun()
-            elif choice == 2:
-                self.talk_nenek_desa()
-            elif choice == 3:
-                self.steal_rumah_tua()
-            elif choice == 4:
-                self.location_desa_panjatan()
-        else:
-            print("\nNenek: 'Sudah ketemu jawabannya belum?'")
-            choices = [
-                "Tanya petunjuk lebih lanjut",
-                "Pergi dari sini"
-            ]
-            choice = self.get_player_choice(choices)
-            if choice == 1:
-                self.quest_harta_karun()
+        typeahead = self.typeahead
+        if typeahead:
+            choice = parse_choice(typeahead.popleft(), len(choices))
+            if choice is None:
+                choice = default
+            if choice is not None:
+                return choice
+            # Sisa antrean tidak berlaku lagi: pemain memilih sendiri di sini
+            typeahead.clear()
+            print("❌ Pilihan tidak valid! Coba lagi.\n", file=self.terminal)
+        menu = [f"{i}. {choice}" for i, choice in enumerate(choices, 1)]
+        self.terminal.draw_region("menu", menu)
+        while True:
+            choice = parse_choice(self.queue_answers((yield prompt)), len(choices))
+            if choice is not None:
+                return choice
+            if default is not None:
+                return default
+            typeahead.clear()
+            # Menu tidak berubah: hapus jawaban yang salah saja tanpa menggambar ulang menu
+            if self.terminal.truncate_after("menu"):
+                print("❌ Pilihan tidak valid! Coba lagi.", file=self.terminal)
             else:
-                self.location_desa_panjatan()
-    
-    def quest_harta_karun(self):
-        """Quest: Bertanya tentang harta karun"""
-        self.clear_screen()
-        story = """
-TITI: "Nenek, apakah kamu tahu tentang harta karun yang terpendam di sini?"
-
-NENEK: (tersenyum misterius)
-"Harta karun? Ah, cerita lama dari masa kejayaan desa ini.
-Benar, ada harta karun yang disembunyikan 40 tahun yang lalu.
-Tapi lokasi pastinya hanya diketahui oleh 3 orang:
-  1. Pembuat peta tersembunyi (sudah meninggal)
-  2. Penjaga harta yang tersisa (mungkin masih hidup)
-  3. Pemilik toko barang antik di pasar
-
-Jika kamu ingin menemukannya, kumpulkan petunjuk dari:
-- Makam Tua (tempat istirahat pembuat peta)
-- Danau Panjatan (tempat perjanjian rahasia)
-- Toko Barang Antik di pasar"
-
-NENEK: "Tunggu... ambil ini. Kunci ini bisa membuka sesuatu yang penting."
-        """
-        self.slow_print(story)
-        
-        if not self.has_item("Kunci Berkarat"):
-            self.add_inventory("Kunci Berkarat")
-            self.add_inventory("Catatan Nenek: 'Cari 3 bagian peta'")
-        
-        self.completed_quests.add("Bertemu Nenek Penjaga")
-        time.sleep(2)
-        self.location_rumah_tua()
-    
-    def talk_nenek_desa(self):
-        """Berbicara dengan Nenek tentang desa"""
-        story = """
-TITI: "Nenek, bisa ceritakan tentang sejarah desa ini?"
-
-NENEK: "Desa Panjatan dulu sangat ramai. Ada pedagang, petualang, dan penjelajah.
-Tapi suatu hari, seorang bandit terkenal menyembunyikan hartanya di sini.
-Sejak saat itu, desa jadi sepi. Orang takut ada kejadian buruk."
-
-TITI: "Apakah ada orang yang sempat menemukan harta karun itu?"
-
-NENEK: "Tidak ada. Peta aslinya dipecah menjadi 3 bagian dan disembunyikan.
-Setiap bagian dijaga oleh seseorang. Jika kamu bisa mengumpulkan semuanya,
-mungkin kamu bisa menemukan hartanya."
+                print("❌ Pilihan tidak valid! Coba lagi.\n", file=self.terminal)
+                self.terminal.draw_region("menu", menu)
+    
+    def queue_answers(self, answer: Optional[str]) -> Optional[str]:
+        """Jawaban pertama dari `answer`; jawaban berikutnya (dipisah spasi
+        atau koma, misalnya "3 1 4 2") diantrekan untuk titik pilihan berikutnya"""
+        answers = answer.replace(",", " ").split() if answer else ()
+        if len(answers) <= 1:
+            return answer
+        self.typeahead.extend(answers[1:])
+        return answers[0]
+    
+    def save(self) -> bytes:
+        """Snapshot biner seluruh state permainan (lihat savegame.py).
+        
+        Diambil saat permainan menunggu pilihan, snapshot bisa dilanjutkan
+        dengan restore() lalu session(resume=True).
         """
-        self.slow_print(story)
-        time.sleep(2)
-        self.location_rumah_tua()
-    
-    def steal_rumah_tua(self):
-        """Mencoba mencuri di rumah tua"""
-        self.clear_screen()
-        story = """
-Titi mencoba masuk ke rumah tua sambil nenek tidak memperhatikan.
-
-Di dalam rumah, Titi menemukan:
-- Sejadi barang antik yang berharga
-- Beberapa gambar tua di dinding
-
-Saat Titi hendak mengambil barang, nenek tiba-tiba muncul!
-
-NENEK: "HENTIKAN! Apa yang kamu lakukan?!"
-
-Titi tertangkap basah mencuri. Nenek marah dan mengusirnya keluar!
-
-❌ Kesempatan untuk mendapat petunjuk dari nenek hilang.
-        """
-        self.slow_print(story)
-        self.completed_quests.add("Usir dari Rumah Tua")
-        time.sleep(3)
-        self.location_desa_panjatan()
-    
-    def location_pasar_desa(self):
-        """Lokasi: Pasar Desa"""
-        self.clear_screen()
-        self.current_location = "Pasar Desa"
-        self.slow_print("=" * 50)
-        self.slow_print("🏪 PASAR DESA - Pusat Kehidupan Desa 🏪", delay=0.05)
-        self.slow_print("=" * 50)
-        
-        story = """
-Pasar desa ramai dengan pedagang dan pembeli. Aroma makanan tradisional
-menyeruak di udara. Titi melihat beberapa toko:
-
-1. Toko Barang Antik - Pemilik tua yang misterius
-2. Warung Makan - Tempat mendengarkan cerita lokal
-3. Toko Perlengkapan - Untuk membeli peralatan petualangan
-4. Rumah Dukun - Tempat mistis
-        """
-        self.slow_print(story)
-        self.use_energy(10)
-        
-        choices = [
-            "Masuk ke Toko Barang Antik",
-            "Mampir ke Warung Makan",
-            "Belanja di Toko Perlengkapan",
-            "Kunjungi Rumah Dukun",
-            "Kembali ke Desa Panjatan"
-        ]
-        
-        choice = self.get_player_choice(choices)
-        
-        if choice == 1:
-            self.location_toko_antik()
-        elif choice == 2:
-            self.location_warung_makan()
-        elif choice == 3:
-            self.location_toko_perlengkapan()
-        elif choice == 4:
-            self.location_rumah_dukun()
-        elif choice == 5:
-            self.location_desa_panjatan()
+        return self._save_format().dumps(self.state)
+    
+    def restore(self, data: bytes):
+        """Memulihkan state dari snapshot save()"""
+        self.state = self._save_format().loads(data)
+    
+    def _save_format(self) -> savegame.SaveFormat:
+        return savegame.for_graph(self.graph)
+    
+    def hint(self, cost: str = "turns"):
+        """Petunjuk menuju ENDING TERBAIK dari state sekarang (hints.Hint),
+        dengan rute terpendek dalam giliran ("turns") atau energi ("energy");
+        None jika ending itu tidak bisa dicapai lagi. Tabel rute dihitung
+        sekali per graf saat petunjuk pertama diminta."""
+        import hints
+        return hints.solver_for(self.graph).hint(self.state, cost)
+    
+    # ==================== SCENE ENGINE ====================
+    
+    def check(self, guard: Guard) -> bool:
+        """Mengevaluasi guard hasil kompilasi"""
+        code = guard[0]
+        if code == G_HAS:
+            return self.state.item_count(guard[1]) > 0
+        if code == G_QUEST:
+            return self.state.has_quest(guard[1])
+        if code == G_NOT:
+            return not self.check(guard[1])
+        if code == G_VISITED:
+            return bool(self.state.visited)
+        if code == G_ENERGY_LE:
+            return self.state.energy <= guard[1]
+        if code == G_MONEY_GE:
+            return self.state.money >= guard[1]
+        return False
     
-    def location_toko_antik(self):
-        """Lokasi: Toko Barang Antik"""
-        self.clear_screen()
-        story = """
-Toko ini penuh dengan barang-barang antik berdebu. Di balik meja,
-seorang pemilik toko tua sedang membaca buku.
-
-PEMILIK TOKO: "Selamat datang. Ada yang bisa saya bantu?"
-
-TITI: "Apakah kamu tahu tentang harta karun yang tersembunyi?"
-
-PEMILIK TOKO: (tersenyum)
-"Ah, peta! Iya, saya memiliki satu bagian peta asli.
-Bagian ini menunjukkan lokasi Danau Panjatan.
-
-Tapi... ini hanya akan kuberikan kepada yang bisa menjawab teka-teki.
-
-TEKA-TEKI: 'Aku memiliki kota, tapi tidak ada rumah. Aku memiliki gunung,
-tapi tidak ada pohon. Aku memiliki air, tapi tidak ada ikan. Apa aku?'
-        """
-        self.slow_print(story)
-        self.use_energy(10)
+    def run_ops(self, ops: Tuple[Op, ...]):
+        """Menjalankan op hasil kompilasi secara berurutan.
         
-        if not self.has_item("Bagian Peta 1"):
-            print("\n(Pikirkan jawaban Titi...)")
-            answers = [
-                "Peta",
-                "Dunia",
-                "Langit",
-                "Kapal"
-            ]
-            choice = self.get_player_choice(answers)
-            
-            if choice == 1:  # Peta adalah jawaban yang benar
-                self.clear_screen()
-                print("PEMILIK TOKO: 'BENAR! Kamu cerdas!'\n")
-                self.add_inventory("Bagian Peta 1 (Danau Panjatan)")
-                self.money += 50
-                self.completed_quests.add("Jawab Teka-teki Toko Antik")
-            else:
-                self.clear_screen()
-                print("PEMILIK TOKO: 'Salah. Coba lagi nanti.'\n")
-                self.money -= 10
-        
-        choices = ["Kembali ke Pasar"]
-        self.get_player_choice(choices)
-        self.location_pasar_desa()
-    
-    def location_warung_makan(self):
-        """Lokasi: Warung Makan"""
-        self.clear_screen()
-        story = """
-Warung makan ini menghangatkan dengan aroma gulai dan nasi kuning.
-Pemilik warung adalah ibu tua yang ramah.
-
-IBU WARUNG: "Halo nak! Mau pesan apa? Nasi goreng spesial kami terkenal!"
-
-TITI: "Biaya berapa? Aku sedang mencari harta karun..."
-
-IBU WARUNG: "Ah, banyak yang cari tapi tidak pernah ada yang berhasil!
-Tapi, saya tahu seseorang yang pernah mendapat bagian peta.
-Dia adalah penjaga Makam Tua. Nama dia Pak Tirto."
-
-IBU WARUNG: "Silakan makan dulu. Kuatkan diri mu. (Memberikan makanan gratis)
-
-Energi Titi pulih! Titi merasa lebih segar.
+        Selama masih ada pilihan di antrean type-ahead, scene hanya dilewati:
+        perubahan state dijalankan, teksnya tidak ditampilkan.
         """
-        self.slow_print(story)
-        self.energy = min(100, self.energy + 30)
-        self.add_inventory("Sepiring Nasi Kuning")
-        self.use_energy(5)
-        
-        choices = ["Kembali ke Pasar"]
-        self.get_player_choice(choices)
-        self.location_pasar_desa()
+        handlers = self._QUIET_HANDLERS if self.typeahead else self._OP_HANDLERS
+        for code, args in ops:
+            handlers[code](self, *args)
     
-    def location_toko_perlengkapan(self):
-        """Lokasi: Toko Perlengkapan"""
-        self.clear_screen()
-        story = """
-Toko perlengkapan ini menjual berbagai barang untuk petualangan:
-- Kompas (Rp 50)
-- Obat Penawar (Rp 60)
-- Tali Tebal (Rp 40)
-- Perlengkapan Menggali (Rp 80)
-- Lampu Tangan (Rp 30)
-
-PENJUAL: "Silakan lihat-lihat. Semua wajib untuk petualangan di hutan!"
-        """
-        self.slow_print(story)
-        print(f"\nUangmu saat ini: Rp {self.money}\n")
-        
-        items = [
-            ("Kompas", 50),
-            ("Obat Penawar", 60),
-            ("Tali Tebal", 40),
-            ("Perlengkapan Menggali", 80),
-            ("Lampu Tangan", 30),
-            ("Tidak membeli apa-apa")
-        ]
-        
-        for i, (item, price) in enumerate(items, 1):
-            if i < len(items):
-                print(f"{i}. {item} - Rp {price}")
-            else:
-                print(f"{i}. {item}")
-        
-        choice = int(input("\nPilihan: ")) - 1
-        
-        if 0 <= choice < len(items) - 1:
-            item_name, price = items[choice]
-            if self.money >= price:
-                self.money -= price
-                self.add_inventory(item_name)
-            else:
-                print("Uangmu tidak cukup!")
-                time.sleep(2)
-        
-        self.location_pasar_desa()
+    def _op_say(self, text: str, delay: float):
+        # Teks cerita yang sama diformat sekali per scene, lebar dan locale
+        terminal = self.terminal
+        text = self.render_cache.text(self.graph.scenes[self.state.scene].id,
+                                      terminal.columns, terminal.locale, text)
+        self.slow_print(text, delay)
     
-    def location_rumah_dukun(self):
-        """Lokasi: Rumah Dukun"""
-        self.clear_screen()
-        story = """
-Rumah ini penuh dengan tanaman aneh dan aroma dupa.
-Seorang dukun tua menyambut Titi dengan tatapan dalam.
-
-DUKUN: "Aku melihat aura petualangan di dirimu. Kamu mencari sesuatu?"
-
-TITI: "Aku mencari harta karun..."
-
-DUKUN: "Harta karun akan membawa ketiga-belas cobaan untukmu.
-Tapi, aku punya ramalan penting untuk dirimu.
-
-📜 RAMALAN DUKUN:
-'Ketiga bagian peta tersembunyi di tempat:
- 1. Hati sang penjaga (Makam Tua)
- 2. Pegangan tangan zaman dulu (Danau Panjatan)  
- 3. Ingatan pemilik barang lama (Pasar)
-
-Jika tiga terhimpun, pintu emas akan terbuka
-Tapi hati-hati, musuh penjaga mungkin mengikutimu.'"
-
-DUKUN memberi Titi sebotol ramuan untuk keberuntungan.
-        """
-        self.slow_print(story)
-        self.add_inventory("Ramuan Keberuntungan Dukun")
-        self.use_energy(5)
-        
-        choices = ["Kembali ke Pasar"]
-        self.get_player_choice(choices)
-        self.location_pasar_desa()
+    def _op_print(self, text: str):
+        print(text, file=self.terminal)
     
-    def location_makam_tua(self):
-        """Lokasi: Makam Tua"""
-        self.clear_screen()
-        self.current_location = "Makam Tua"
-        self.slow_print("=" * 50)
-        self.slow_print("⚰️  MAKAM TUA - Tempat Istirahat Pembuat Peta ⚰️", delay=0.05)
-        self.slow_print("=" * 50)
-        
-        story = """
-Makam tua ini terletak di tengah hutan yang sepi. Banyak makam tua
-dengan tulisan yang sudah tidak terbaca.
-
-Titi melihat seorang penjaga makam yang sedang membersihkan area.
-Nama penjaga ini adalah Pak Tirto, seperti yang disebut ibu warung.
-
-PAK TIRTO: "Siapa yang datang ke tempat ini? Aku jarang melihat pengunjung."
-
-TITI: "Pak, saya mencari harta karun. Apakah kamu punya informasi?"
-
-PAK TIRTO: (berhenti sejenak)
-"Harta karun... ya, aku tahu ceritanya. Pembuat peta dimakamkan di sini.
-Dia adalah sahabat saya dulu sebelum meninggal.
-
-Dia meninggalkan sesuatu yang berharga untuk orang yang bisa memahami pesan tersembunyi.
-
-Tapi sebelum itu, bisa tolong aku bersihkan makam? Aku sudah tua dan lelah."
-        """
-        self.slow_print(story)
-        self.use_energy(20)
-        
-        if not "Bersihkan Makam" in self.completed_quests:
-            choices = [
-                "Membantu Pak Tirto membersihkan makam",
-                "Menolak dan pergi",
-            ]
-            
-            choice = self.get_player_choice(choices)
-            
-            if choice == 1:
-                self.help_pak_tirto()
-            else:
-                self.location_desa_panjatan()
-        else:
-            print("\nPAK TIRTO: 'Terima kasih anak muda. Masih cari peta?'")
-            choices = [
-                "Tanya tentang peta",
-                "Pergi dari sini"
-            ]
-            choice = self.get_player_choice(choices)
-            if choice == 1:
-                self.help_pak_tirto()
-            else:
-                self.location_desa_panjatan()
+    def _op_printf(self, template: str):
+        print(template.format(money=self.state.money), file=self.terminal)
     
-    def help_pak_tirto(self):
-        """Membantu Pak Tirto"""
-        self.clear_screen()
-        story = """
-Titi membantu Pak Tirto membersihkan makam dengan baik.
-Pak Tirto terlihat sangat senang dan berterima kasih.
-
-PAK TIRTO: "Terima kasih banyak anak muda. Kamu berbeda dari lelaki muda lainnya.
-Kamu peduli pada orang tua.
-
-Untuk itu, aku akan memberikan bagian peta yang dipercayakan kepadaku.
-Ini adalah bagian ke dua, yang menunjukkan hutan rahasia!"
-
-Pak Tirto memberikan:
-✓ Bagian Peta 2 (Hutan Rahasia)
-✓ Kunci Tua yang mungkin membuka sesuatu
-✓ Perlengkapan Menggali berkualitas baik
-        """
-        self.slow_print(story)
-        
-        if not self.has_item("Bagian Peta 2"):
-            self.add_inventory("Bagian Peta 2 (Hutan Rahasia)")
-            self.add_inventory("Kunci Tua Pak Tirto")
-            self.add_inventory("Perlengkapan Menggali Profesional")
-            self.completed_quests.add("Bersihkan Makam")
-            self.money += 100
-        
-        time.sleep(2)
-        self.location_makam_tua()
+    def _op_location(self, name: str, location_id: int):
+        self.state.current_location = name
     
-    def location_danau_panjatan(self):
-        """Lokasi: Danau Panjatan"""
-        self.clear_screen()
-        self.current_location = "Danau Panjatan"
-        self.slow_print("=" * 50)
-        self.slow_print("💧 DANAU PANJATAN - Keindahan dan Misteri 💧", delay=0.05)
-        self.slow_print("=" * 50)
-        
-        story = """
-Danau Panjatan terletak di tengan lembah yang sunyi. Air danau jernih
-dan mencerminkan langit biru. Tapi ada yang aneh di sini...
-
-Titi melihat tulisan-tulisan aneh di batu besar di tepi danau.
-Seperti pesan rahasia dari zaman dulu.
-
-Terdapat juga sebuah patung setengah terendam yang mungkin kunci sesuatu.
-
-Tiba-tiba, seorang pemuda misterius muncul dari balik pohon!
-
-PEMUDA MISTERIUS: "Hei! Apa yang kamu cari di tempat ini?"
-        """
-        self.slow_print(story)
-        self.use_energy(15)
-        
-        if not "Bertemu Pemuda Misterius" in self.completed_quests:
-            choices = [
-                "Bertanya siapa dia",
-                "Langsung mencari peta",
-                "Mengajak jadi teman",
-                "Pergi dari sini"
-            ]
-            
-            choice = self.get_player_choice(choices)
-            
-            if choice == 1:
-                self.talk_pemuda_misterius()
-            elif choice == 2:
-                self.search_peta_danau()
-            elif choice == 3:
-                self.befriend_pemuda()
-            elif choice == 4:
-                self.location_desa_panjatan()
-        else:
-            choices = [
-                "Cari peta di danau",
-                "Berbincang lagi",
-                "Pergi dari sini"
-            ]
-            choice = self.get_player_choice(choices)
-            if choice == 1:
-                self.search_peta_danau()
-            elif choice == 2:
-                self.talk_pemuda_misterius()
-            else:
-                self.location_desa_panjatan()
+    def _op_gain_energy(self, amount: int):
+        state = self.state
+        state.energy = min(100, state.energy + amount)
     
-    def talk_pemuda_misterius(self):
-        """Berbicara dengan pemuda misterius"""
-        story = """
-TITI: "Siapa namamu? Apa yang kamu lakukan di sini?"
-
-PEMUDA: "Nama saya Reno. Aku adalah keturunan penjaga harta karun itu.
-Ayahku dulu menjaga harta, sebelum meninggal.
-
-Sebenarnya... aku juga mencari peta itu. Tapi tidak untuk mengambil harta.
-Aku ingin memastikan harta itu tidak disalahgunakan.
-
-PETA TERAKHIR mungkin sudah hilang diambil orang lain.
-Tapi, jika kamu butuh bantuan, aku siap membantu."
-
-TITI: "Apakah kamu tahu di mana peta itu?"
-
-RENO: "Patung di danau ini adalah kunci. Jika kamu bisa membukanya,
-peta ketiga ada di dalamnya."
-        """
-        self.slow_print(story)
-        self.completed_quests.add("Bertemu Pemuda Misterius")
-        time.sleep(2)
-        self.location_danau_panjatan()
+    def _op_set_energy(self, value: int):
+        self.state.energy = value
     
-    def befriend_pemuda(self):
-        """Mengajak pemuda jadi teman"""
-        story = """
-TITI: "Hei, sepertinya kita punya tujuan yang sama. Mau jadi teman?"
-
-RENO: (tersenyum)
-"Aku suka orangmu. Okay, kita jadi tim sekarang!
-
-Untuk membuka patung ini, kita butuh kunci khusus.
-Aku punya sebagian, tapi separuhnya hilang.
-
-Mungkin kunci itu satu set. Jika kamu punya kunci dari tempat lain,
-bisa kita cocokan."
-        """
-        self.slow_print(story)
-        self.add_inventory("Separuh Kunci Reno")
-        self.completed_quests.add("Berteman dengan Reno")
-        time.sleep(2)
-        self.location_danau_panjatan()
+    def _op_set_health(self, value: int):
+        self.state.health = value
     
-    def search_peta_danau(self):
-        """Mencari peta di danau"""
-        self.clear_screen()
-        
-        if self.has_item("Perlengkapan Menggali Profesional"):
-            story = """
-Titi menggunakan perlengkapan menggali profesional dari Pak Tirto.
-
-Dengan hati-hati, Titi menggali area di sekitar patung.
-Setelah beberapa menit, sesuatu terasa keras!
-
-KRRRRR... patung terbuka!
-
-Di dalamnya tersimpan:
-✓ Bagian Peta 3 (Gua Rahasia)
-✓ Peta Lengkap yang menunjukkan lokasi harta karun
-✓ Buku Harian Pembuat Peta
-
-Akhirnya! Ketiga bagian peta sudah terkumpul!
-            """
-            self.slow_print(story)
-            
-            if not self.has_item("Bagian Peta 3"):
-                self.add_inventory("Bagian Peta 3 (Gua Rahasia)")
-                self.add_inventory("PETA LENGKAP - Harta Karun!")
-                self.add_inventory("Buku Harian Pembuat Peta")
-                self.money += 150
-            
-            print("\n🎉 PENCAPAIAN: Semua 3 bagian peta berhasil dikumpulkan!")
-            time.sleep(3)
-        else:
-            story = """
-Titi mencoba menggali dengan tangan, tapi sangat sulit.
-Tanpa alat yang tepat, Titi tidak bisa membuka patung.
-
-Titi perlu perlengkapan menggali yang lebih baik.
-            """
-            self.slow_print(story)
-            time.sleep(2)
-        
-        self.location_danau_panjatan()
+    def _op_health(self, delta: int):
+        self.state.health += delta
     
-    def location_penginapan(self):
-        """Lokasi: Penginapan"""
-        self.clear_screen()
-        story = """
-Titi beristirahat di penginapan sederhana di desa.
-        
-Energi Titi pulih sepenuhnya setelah tidur.
-Kesehatan juga meningkat kembali.
-        """
-        self.slow_print(story)
-        self.energy = 100
-        self.health = 100
-        
-        if self.has_item("PETA LENGKAP - Harta Karun!"):
-            print("\nTiti bermimpi. Dalam mimpi, dia melihat lokasi harta karun...")
-            time.sleep(2)
-            print("Saatnya menemukan harta karun yang sesungguhnya!")
-            time.sleep(2)
-            self.show_final_location()
-        else:
-            print("\nSetelah istirahat, Titi siap melanjutkan petualangan.")
-            time.sleep(2)
-            self.location_desa_panjatan()
+    def _op_money(self, delta: int):
+        self.state.money += delta
     
-    def show_final_location(self):
-        """Menampilkan lokasi akhir - Gua Rahasia"""
-        self.clear_screen()
-        self.current_location = "Gua Rahasia"
-        self.slow_print("=" * 50)
-        self.slow_print("⛏️  GUA RAHASIA - TUJUAN AKHIR ⛏️", delay=0.05)
-        self.slow_print("=" * 50)
-        
-        story = """
-Dengan peta lengkap, Titi dapat menemukan lokasi gua rahasia.
-Gua ini tersembunyi di balik tebing yang curam.
-
-Setelah perjalanan panjang, Titi akhirnya sampai di mulut gua.
-
-Udara dingin menerpa. Di dalam gua, terlihat cahaya emas yang bersinar.
-
-TITI: "Ini dia... harta karun legendaris yang dicari-cari selama puluhan tahun!"
-
-Titi memasuki gua dengan perlahan...
-        """
-        self.slow_print(story)
-        time.sleep(2)
-        
-        self.navigate_gua_rahasia()
+    def _op_set_money(self, value: int):
+        self.state.money = value
     
-    def navigate_gua_rahasia(self):
-        """Navigasi di dalam gua rahasia"""
-        self.clear_screen()
-        
-        story = """
-Di dalam gua, Titi menemukan berbagai tantangan:
-
-1. LORONG PERTAMA: Lantai yang tidak stabil
-   Titi harus berjalan dengan hati-hati.
-
-2. LORONG KEDUA: Ruangan gelap yang misterius
-   Titi butuh cahaya untuk melihat.
-
-3. LORONG KETIGA: Ruangan dengan banyak harta emas
-   Tapi... ada yang aneh di sini...
-        """
-        self.slow_print(story)
-        
-        # Lorong pertama
-        self.handle_lorong_pertama()
+    def _op_item(self, item_id: int):
+        self.state.add_item(item_id)
+        self.slow_print(f"✓ Titi mengambil: {ITEMS.name(item_id)}")
     
-    def handle_lorong_pertama(self):
-        """Menghandle lorong pertama"""
-        self.clear_screen()
-        story = """
-LORONG PERTAMA: Lantai Tidak Stabil
-
-Titi berjalan dengan hati-hati. Lantai batu mulai bergetar!
-
-Pilihan Titi:
-        """
-        self.slow_print(story)
-        
-        choices = [
-            "Berlari cepat ke ujung lorong",
-            "Berjalan perlahan dan hati-hati",
-            "Menggunakan tali untuk menyeberang"
-        ]
-        
-        choice = self.get_player_choice(choices)
-        
-        if choice == 1:
-            story = """
-Titi berlari cepat, tapi lantai mulai runtuh!
-
-BRRRRAAAAKKKKKK!!!
-
-Titi terjatuh dan terluka.
-
-❌ Titi mengalami cedera. Kesehatan turun!
-            """
-            self.slow_print(story)
-            self.health -= 30
-        elif choice == 2:
-            story = """
-Titi berjalan dengan perlahan dan terukur.
-Lantai tetap stabil karena Titi tidak memberikan beban berat sekaligus.
-
-BERHASIL! Titi berhasil menyeberang dengan aman.
-            """
-            self.slow_print(story)
-        elif choice == 3:
-            story = """
-Titi menggunakan tali yang dibawanya untuk menyeberang.
-Sangat aman dan cepat!
-
-BERHASIL! Titi tiba di ujung lorong dengan selamat.
-            """
-            self.slow_print(story)
-            self.health += 10
-        
-        time.sleep(2)
-        self.handle_lorong_kedua()
+    def _op_drop(self, item_id: Optional[int]):
+        if item_id is not None:
+            self.state.remove_item(item_id)
     
-    def handle_lorong_kedua(self):
-        """Menghandle lorong kedua - ruangan gelap"""
-        self.clear_screen()
-        story = """
-LORONG KEDUA: Ruangan Gelap
-
-Titi memasuki ruangan yang sangat gelap.
-Tidak bisa melihat apapun.
-
-Tiba-tiba, terdengar suara berbisik aneh...
-
-"KIM KAMI TIDAK AKAN MEMBERIKAN HARTA INI KEPADA SIAPAPUN..."
-
-Pilihan Titi:
-        """
-        self.slow_print(story)
-        
-        choices = [
-            "Menggunakan Lampu Tangan jika punya",
-            "Menggunakan Ramuan Keberuntungan",
-            "Menunggu sampai mata terbiasa gelap"
-        ]
-        
-        # Filter pilihan berdasarkan inventory
-        if not self.has_item("Lampu Tangan"):
-            choices = ["Menggunakan Ramuan Keberuntungan", "Menunggu sampai mata terbiasa gelap"]
-        
-        choice = self.get_player_choice(choices)
-        
-        if "Lampu" in choices[0] if len(choices) > 0 else False and choice == 1:
-            story = """
-Titi menyalakan lampu tangan!
-
-Cahaya menerangi ruangan. Titi bisa melihat jalan terang.
-Bisikan gaib pun menghilang.
-
-BERHASIL! Titi melewati ruangan gelap dengan cepat.
-            """
-            self.slow_print(story)
-        elif "Ramuan" in str(choices) and choice == 1:
-            story = """
-Titi minum ramuan keberuntungan dari dukun.
-
-Tiba-tiba, cahaya ajaib membimbing langkahnya!
-Ramuan dukun bekerja sempurna!
-
-BERHASIL! Titi melewati ruangan gelap dengan percaya diri.
-            """
-            self.slow_print(story)
-            self.remove_item("Ramuan Keberuntungan Dukun")
-        else:
-            story = """
-Titi berdiri diam, menunggu matanya terbiasa dengan kegelapan.
-
-Setelah beberapa menit, mata Titi mulai membiasakan diri.
-Samar-samar Titi bisa melihat jalan di depan.
-
-Perlahan-lahan, Titi melangkah maju...
-
-(Lebih lambat, tapi berhasil!)
-            """
-            self.slow_print(story)
-            self.use_energy(20)
-        
-        time.sleep(2)
-        self.handle_lorong_ketiga()
+    def _op_quest(self, quest_id: int):
+        self.state.complete_quest(quest_id)
     
-    def handle_lorong_ketiga(self):
-        """Menghandle lorong ketiga - harta karun"""
-        self.clear_screen()
-        self.slow_print("=" * 50)
-        self.slow_print("🏆 LORONG KETIGA: KAMAR HARTA KARUN 🏆", delay=0.05)
-        self.slow_print("=" * 50)
-        
-        story = """
-Titi keluar dari kegelapan dan masuk ke ruangan yang bercahaya emas!
-
-WOOOOOWWWW!!!
-
-Di depan mata Titi, ada tumpukan emas, permata, dan harta berharga lainnya!
-Cahaya emas menerangi seluruh ruangan.
-
-Tapi... ada PATUNG BESAR dengan wajah misterius di tengah harta karun.
-
-Patung itu seperti penjaga harta karun.
-
-Tiba-tiba, patung itu mulai bergerak!!!
-
-PATUNG PENJAGA: "SIAPA YANG BERANI MENGAMBIL HARTA MILIKKU?!"
-
-Titi merasa takut, tapi... suara itu terdengar familiar.
-        """
-        self.slow_print(story)
-        self.use_energy(10)
-        time.sleep(3)
-        
-        self.handle_final_challenge()
+    def _op_end(self, ending_type: str):
+        state = self.state
+        state.ending_type = ending_type
+        state.game_over = True
     
-    def handle_final_challenge(self):
-        """Tantangan akhir"""
-        choices = [
-            "Lari dari gua",
-            "Berhadapan dengan penjaga",
-            "Berbicara baik-baik dengan penjaga"
-        ]
-        
-        choice = self.get_player_choice(choices)
-        
-        if choice == 1:
-            self.clear_screen()
-            story = """
-Titi berlari keluar dari gua secepat mungkin!
-
-BOOOM! Patung penjaga ambruk di belakangnya.
-Gua mulai runtuh!
-
-Titi berhasil keluar..., tapi TANGAN KOSONG!
-
-ENDING BURUK: Titi tidak mendapatkan harta karun.
-Harta karun tetap terkunci di bawah tanah.
-
-Titi kembali ke desa sebagai penjelajah yang gagal.
-            """
-            self.slow_print(story)
-            self.ending_type = "ENDING BURUK - Kabur"
-            self.game_over = True
-        
-        elif choice == 2:
-            self.clear_screen()
-            story = """
-TITI: "Aku tidak takut! Aku juga punya hak atas harta ini!"
-
-Titi melawan patung dengan perlengkapan.
-
-CRASH!!! BANG!!! POOOFFF!!!
-
-Patung runtuh menjadi debu...
-
-Tapi... biaya kerusakan akan sangat besar! Energi Titi habis!
-            """
-            self.slow_print(story)
-            self.use_energy(40)
-            
-            if self.energy <= 0:
-                self.clear_screen()
-                self.slow_print("Titi tersungkur... semuanya menjadi gelap...")
-                self.ending_type = "ENDING BURUK - Kelelahan"
-                self.game_over = True
-            else:
-                self.handle_harta_karun()
-        
-        else:
-            self.clear_screen()
-            story = """
-TITI: (Dengan tenang) "Halo... siapa sebenarnya kamu?"
-
-Patung itu berhenti bergerak. Cahaya emas berubah warna.
-
-SUARA GAIB: "Aku adalah roh penjaga harta ini selama 40 tahun.
-Menunggu seseorang yang cukup bijak untuk menemukannya.
-
-Tapi, harta ini memiliki tanggung jawab besar.
-Apakah kamu siap menanggungnya?"
-
-TITI: "Apa tanggung jawab itu?"
-
-SUARA GAIB: "Harta ini harus digunakan untuk kebaikan desa.
-Tidak boleh untuk kepentingan pribadi.
-Jika setuju, harta ini milikmu."
-            """
-            self.slow_print(story)
-            time.sleep(2)
-            
-            # Pilihan moral akhir
-            final_choices = [
-                "Setuju gunakan untuk kebaikan desa",
-                "Ingin harta untuk diri sendiri"
-            ]
-            
-            final_choice = self.get_player_choice(final_choices)
-            
-            if final_choice == 1:
-                self.handle_ending_baik()
-            else:
-                self.handle_ending_tengah()
+    def _op_if(self, guard: Guard, then_ops: Tuple[Op, ...], else_ops: Tuple[Op, ...]):
+        self.run_ops(then_ops if self.check(guard) else else_ops)
     
-    def handle_harta_karun(self):
-        """Menangani pengambilan harta karun setelah melawan"""
-        story = """
-Meskipun lelah, Titi berhasil mengumpulkan sebagian harta karun.
-
-Titi membawa:
-- Sepuluh tas emas
-- Beberapa permata berharga
-- Perhiasan antik
-
-Total: Rp 10,000,000 (hanya sebagian kecil dari total)
-
-ENDING NETRAL: Titi menjadi kaya, tapi tidak kaya raya.
-Harta karun sebagian besar masih tersembunyi.
-        """
-        self.slow_print(story)
-        self.money += 10000000
-        self.ending_type = "ENDING NETRAL - Setengah Harta"
-        self.game_over = True
+    def resolve(self, target: Target) -> int:
+        """Indeks scene tujuan; kembali ke scene awal (indeks 0) jika tidak ada tujuan"""
+        for guard, index in target:
+            if guard is None or self.check(guard):
+                return index if index is not None else 0
+        return 0
     
-    def handle_ending_baik(self):
-        """ENDING BAIK - Menggunakan untuk kebaikan"""
-        self.clear_screen()
-        self.slow_print("=" * 50)
-        self.slow_print("✨ ENDING TERBAIK - PAHLAWAN DESA ✨", delay=0.05)
-        self.slow_print("=" * 50)
+    def play_scene(self, index: int, resume: bool = False):
+        """Memainkan satu scene dan mengembalikan indeks scene berikutnya.
         
-        story = """
-Roh penjaga tersenyum (walau tidak terlihat).
-
-SUARA GAIB: "Kamu adalah orang yang tepat. Semua harta ini milikmu!"
-
-Cahaya emas memenuhi seluruh gua.
-
-Titi dapat mengumpulkan sepenuhnya:
-✓ 500 tas berisi emas murni
-✓ 1000 permata langka  
-✓ Perhiasan bersejarah
-✓ Naskah kuno bernilai tinggi
-
-Total: Rp 500,000,000 !!!
-
----
-
-MASA DEPAN DESA:
-
-Titi menggunakan harta untuk membangun:
-- Sekolah baru di desa
-- Rumah sakit untuk warga
-- Jalan yang lebih baik
-- Sistem irigasi untuk pertanian
-- Perpustakaan komunitas
-
-Desa Panjatan menjadi desa yang berkembang pesat!
-
-Pak Tirto, Nenek di Rumah Tua, dan semua penduduk desa sangat berterima kasih.
-Reno menjadi teman baik Titi dan mereka memulai sekolah petualangan.
-
-TITI MENJADI PAHLAWAN DESA!
-
-Cerita tentang Titi dan Harta Karun Panjatan tersebar ke seluruh daerah.
-Banyak orang yang datang untuk belajar tentang keberanian dan kebijaksanaan Titi.
-
-🎉 SELAMAT! TITI BERHASIL DENGAN SEMPURNA! 🎉
+        Dengan `resume`, op masuk scene tidak dijalankan lagi karena sudah
+        dijalankan sebelum state disimpan; permainan langsung lanjut ke pilihan.
         """
-        self.slow_print(story)
-        self.money = 500000000
-        self.ending_type = "ENDING TERBAIK ⭐"
-        self.game_over = True
-    
-    def handle_ending_tengah(self):
-        """ENDING NETRAL - Mengejar uang"""
-        self.clear_screen()
-        self.slow_print("=" * 50)
-        self.slow_print("💰 ENDING BIASA - PENJELAJAH KAYA 💰", delay=0.05)
-        self.slow_print("=" * 50)
-        
-        story = """
-Roh penjaga menghilang dalam kekecewaan.
-
-Tapi harta karun tetap terbuka untuk Titi!
-
-Titi dapat mengumpulkan:
-✓ 100 tas berisi emas murni
-✓ 200 permata berharga
-✓ Beberapa perhiasan
-
-Total: Rp 100,000,000
-
----
-
-Titi menjadi kaya raya, tapi...
-
-Desa Panjatan tidak berkembang banyak.
-Titi pindah ke kota besar untuk hidup mewah.
-
-Sesekali Titi mengingat desa dan orang-orang baik di sana,
-tapi sudah jarang berkunjung.
-
-📊 HASIL AKHIR:
-- Titi kaya
-- Tapi kesepian
-- Hubungan dengan desa menjadi dingin
-- Ketenangan sejati tidak ditemukan
-
-END (Biasa saja...)
+        scene = self.graph.scenes[index]
+        state = self.state
+        state.scene = index
+        self.renderer.begin_scene()
+        typeahead = self.typeahead
+        if typeahead and not scene.choices and _ends(scene.next):
+            # Scene akhir selalu ditampilkan; pilihan berlebih di antrean dibuang
+            typeahead.clear()
+        if not resume:
+            # Scene yang sudah pernah dilihat ditampilkan dengan teks ringkas
+            seen = 1 << index
+            self.run_ops(scene.revisit if state.seen & seen else scene.enter)
+            state.seen |= seen
+        if not scene.choices:
+            return self.resolve(scene.next)
+        choice = yield from self.get_player_choice(scene.labels, scene.prompt, scene.default)
+        chosen = scene.choices[choice - 1]
+        if typeahead and _ends(chosen.next):
+            typeahead.clear()
+        self.run_ops(chosen.ops)
+        return self.resolve(chosen.next)
+    
+    def session(self, scene_id: Optional[str] = None, resume: bool = False):
+        """Generator permainan: meng-yield prompt dan menerima jawaban pemain.
+        
+        Tanpa `scene_id` permainan dimulai dari scene di state. Dengan `resume`
+        scene pertama dilanjutkan dari pilihannya (lihat restore()).
         """
-        self.slow_print(story)
-        self.money = 100000000
-        self.ending_type = "ENDING NETRAL 😐"
-        self.game_over = True
+        # Scene di-dispatch lewat indeks graf, sehingga stack tidak bertambah
+        # walau permainan berlangsung lama
+        index = self.state.scene if scene_id is None else self.graph.index(scene_id)
+        if resume and not self.state.game_over:
+            index = yield from self.play_scene(index, resume=True)
+        while not self.state.game_over:
+            index = yield from self.play_scene(index)
+        self.typeahead.clear()
+    
+    def play(self, scene_id: Optional[str] = None, resume: bool = False):
+        """Menjalankan permainan sampai selesai dengan jawaban dari terminal"""
+        session = self.session(scene_id, resume)
+        try:
+            prompt = next(session)
+            while True:
+                prompt = session.send(self.terminal.input(prompt))
+        except StopIteration:
+            pass
+        finally:
+            # Jika input habis di tengah permainan, scene yang sedang berjalan
+            # tetap diselesaikan (misalnya observasi waktu scene di metrics)
+            session.close()
+            self.terminal.flush()
     
     def show_end_screen(self):
         """Tampilkan layar akhir"""
@@ -1113,24 +441,24 @@ END (Biasa saja...)
         
         self.display_stats()
         
-        print("\n📊 STATISTIK AKHIR PERMAINAN:")
-        print(f"Total Uang: Rp {self.money:,}")
-        print(f"Item Dikumpulkan: {len(self.inventory)}")
-        print(f"Quests Selesai: {len(self.completed_quests)}")
-        print(f"Ending: {self.ending_type}")
+        print("\n📊 STATISTIK AKHIR PERMAINAN:", file=self.terminal)
+        print(f"Total Uang: Rp {self.money:,}", file=self.terminal)
+        print(f"Item Dikumpulkan: {self.state.item_total()}", file=self.terminal)
+        print(f"Quests Selesai: {len(self.completed_quests)}", file=self.terminal)
+        print(f"Ending: {self.ending_type}", file=self.terminal)
         
         if self.ending_type == "ENDING TERBAIK ⭐":
-            print("\n🏆 TITI ADALAH PAHLAWAN SEJATI! 🏆")
+            print("\n🏆 TITI ADALAH PAHLAWAN SEJATI! 🏆", file=self.terminal)
         elif "TERBAIK" in self.ending_type:
-            print("\n⭐ PERJALANAN LEGENDARIS! ⭐")
+            print("\n⭐ PERJALANAN LEGENDARIS! ⭐", file=self.terminal)
         elif "NETRAL" in self.ending_type:
-            print("\n😐 PERJALANAN YANG BIASA SAJA 😐")
+            print("\n😐 PERJALANAN YANG BIASA SAJA 😐", file=self.terminal)
         else:
-            print("\n😞 PERJALANAN YANG MENYESAL 😞")
+            print("\n😞 PERJALANAN YANG MENYESAL 😞", file=self.terminal)
         
-        print("\n" + "=" * 50)
-        print("Terima kasih telah bermain The Mystery Adventure Bot!")
-        print("=" * 50 + "\n")
+        print("\n" + "=" * 50, file=self.terminal)
+        print("Terima kasih telah bermain The Mystery Adventure Bot!", file=self.terminal)
+        print("=" * 50 + "\n", file=self.terminal)
     
     def run(self):
         """Menjalankan game"""
@@ -1156,19 +484,40 @@ Mari kita mulai petualangan...
         """
         self.slow_print(intro, delay=0.02)
         
-        input("\n[Tekan ENTER untuk memulai petualangan Titi...]")
+        self.terminal.input("\n[Tekan ENTER untuk memulai petualangan Titi...]")
         
         # Game loop
-        while not self.game_over:
-            self.location_desa_panjatan()
+        self.play()
         
         # Menampilkan layar akhir
-        time.sleep(2)
+        self.pause(2)
         self.show_end_screen()
+        self.terminal.flush()
+
+
+MysteryAdventureBot._OP_HANDLERS = MysteryAdventureBot._op_handlers()
+MysteryAdventureBot._QUIET_HANDLERS = MysteryAdventureBot._quiet_handlers()
 
 # ============== MAIN ==============
 
 if __name__ == "__main__":
-    game = MysteryAdventureBot()
-    game.run()
+    parser = argparse.ArgumentParser(description="The Mystery Adventure Bot")
+    parser.add_argument("--instant", action="store_true",
+                        help="tampilkan teks langsung tanpa efek mengetik dan jeda")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="catat waktu per scene dan tulis metrik format Prometheus ke FILE")
+    args = parser.parse_args()
+    
+    terminal = AnsiTerminal()
+    renderer = TypewriterRenderer(stream=terminal, instant=args.instant)
+    if args.metrics:
+        from metrics import METRICS, InstrumentedBot
+        game = InstrumentedBot(renderer, terminal)
+        try:
+            game.run()
+        finally:
+            METRICS.dump(args.metrics)
+    else:
+        game = MysteryAdventureBot(renderer, terminal)
+        game.run()
  
\ No newline at end of file
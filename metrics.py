@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Metrik waktu dan counter untuk The Mystery Adventure Bot.
+
+InstrumentedBot mencatat ke sebuah MetricsRegistry (default: METRICS):
+
+    mab_scene_entries_total{scene}   berapa kali setiap scene dimasuki
+    mab_scene_seconds{scene}         waktu kerja scene, tanpa menunggu input
+    mab_input_wait_seconds           waktu menunggu jawaban pemain
+    mab_slow_print_seconds           waktu di slow_print, termasuk jedanya
+    mab_sleep_seconds                waktu di time.sleep (efek mengetik dan pause)
+    mab_energy_exhausted_total       berapa kali energi Titi habis
+
+Instrumentasi dimatikan dengan memakai MysteryAdventureBot biasa, jadi
+tanpa metrik tidak ada biaya sama sekali di jalur panas. Isi registry bisa
+ditulis dalam format teks Prometheus (misalnya untuk textfile collector
+node_exporter):
+
+    python main.py --metrics game.prom
+"""
+
+import os
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+from main import MysteryAdventureBot
+
+# (nama, label) -> [nilai] untuk counter, atau [jumlah, total] untuk summary
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class MetricsRegistry:
+    """Counter dan summary (jumlah + total) di dalam proses.
+
+    Nilai setiap metrik disimpan dalam list kecil (sel). Kode di jalur panas
+    mengambil selnya sekali lewat counter_cell()/summary_cell() lalu
+    menambahkannya langsung, tanpa menyusun kunci label di setiap panggilan.
+    """
+
+    def __init__(self, prefix: str = "mab_"):
+        self.prefix = prefix
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[_Key, List[float]] = {}
+        self._summaries: Dict[_Key, List[float]] = {}
+
+    def describe(self, name: str, kind: str, text: str):
+        """Mendaftarkan jenis ("counter" atau "summary") dan keterangan sebuah metrik"""
+        self._help[name] = (kind, text)
+
+    def counter_cell(self, name: str, **labels: str) -> List[float]:
+        """Sel [nilai] sebuah counter"""
+        key = (name, tuple(sorted(labels.items())))
+        cell = self._counters.get(key)
+        if cell is None:
+            cell = self._counters[key] = [0]
+        return cell
+
+    def summary_cell(self, name: str, **labels: str) -> List[float]:
+        """Sel [jumlah observasi, total detik] sebuah summary"""
+        key = (name, tuple(sorted(labels.items())))
+        cell = self._summaries.get(key)
+        if cell is None:
+            cell = self._summaries[key] = [0, 0.0]
+        return cell
+
+    def inc(self, name: str, value: float = 1, **labels: str):
+        self.counter_cell(name, **labels)[0] += value
+
+    def observe(self, name: str, seconds: float, **labels: str):
+        cell = self.summary_cell(name, **labels)
+        cell[0] += 1
+        cell[1] += seconds
+
+    def counter(self, name: str, **labels: str) -> float:
+        return self._counters.get((name, tuple(sorted(labels.items()))), [0])[0]
+
+    def summary(self, name: str, **labels: str) -> Tuple[int, float]:
+        """(jumlah observasi, total detik)"""
+        count, total = self._summaries.get((name, tuple(sorted(labels.items()))), (0, 0.0))
+        return int(count), total
+
+    def clear(self):
+        """Mengosongkan semua nilai (sel yang sudah diambil tetap berlaku)"""
+        for cell in self._counters.values():
+            cell[0] = 0
+        for cell in self._summaries.values():
+            cell[0], cell[1] = 0, 0.0
+
+    def render(self) -> str:
+        """Isi registry dalam format teks Prometheus"""
+        samples: Dict[str, List[str]] = {}
+        for (name, labels), (value,) in sorted(self._counters.items()):
+            samples.setdefault(name, []).append(
+                f"{self.prefix}{name}{_labels(labels)} {_number(value)}")
+        for (name, labels), (count, total) in sorted(self._summaries.items()):
+            lines = samples.setdefault(name, [])
+            lines.append(f"{self.prefix}{name}_count{_labels(labels)} {int(count)}")
+            lines.append(f"{self.prefix}{name}_sum{_labels(labels)} {_number(total)}")
+        out = []
+        for name, lines in samples.items():
+            kind, text = self._help.get(name, ("untyped", ""))
+            if text:
+                out.append(f"# HELP {self.prefix}{name} {text}")
+            out.append(f"# TYPE {self.prefix}{name} {kind}")
+            out.extend(lines)
+        return "\n".join(out) + "\n"
+
+    def dump(self, path: str):
+        """Menulis render() ke `path` secara atomik (file sementara lalu rename)"""
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, "w", encoding="utf-8") as out:
+            out.write(self.render())
+        os.replace(temp, path)
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    escaped = (f'{key}="{_escape(value)}"' for key, value in labels)
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+METRICS = MetricsRegistry()
+for _name, _kind, _text in (
+        ("scene_entries_total", "counter", "Berapa kali setiap scene dimasuki"),
+        ("scene_seconds", "summary", "Waktu kerja scene tanpa menunggu input"),
+        ("input_wait_seconds", "summary", "Waktu menunggu jawaban pemain"),
+        ("slow_print_seconds", "summary", "Waktu di slow_print termasuk jeda mengetik"),
+        ("sleep_seconds", "summary", "Waktu di time.sleep untuk efek mengetik dan pause"),
+        ("energy_exhausted_total", "counter", "Berapa kali energi Titi habis")):
+    METRICS.describe(_name, _kind, _text)
+
+
+class InstrumentedBot(MysteryAdventureBot):
+    """Bot yang mencatat waktu scene, input, rendering dan energi habis"""
+
+    def __init__(self, *args, metrics: Optional[MetricsRegistry] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        metrics = self.metrics = metrics or METRICS
+        self._scene_cells: Dict[int, Tuple[List[float], List[float]]] = {}
+        self._input_cell = metrics.summary_cell("input_wait_seconds")
+        self._print_cell = metrics.summary_cell("slow_print_seconds")
+        self._exhausted_cell = metrics.counter_cell("energy_exhausted_total")
+        self._input_wait = 0.0
+        # Semua jeda renderer (efek mengetik dan pause) lewat fungsi ini
+        sleep = self.renderer.sleep
+        sleep_cell = metrics.summary_cell("sleep_seconds")
+
+        def timed_sleep(seconds: float):
+            start = perf_counter()
+            sleep(seconds)
+            sleep_cell[0] += 1
+            sleep_cell[1] += perf_counter() - start
+        self.renderer.sleep = timed_sleep
+
+    def play_scene(self, index: int, resume: bool = False):
+        cells = self._scene_cells.get(index)
+        if cells is None:
+            scene = self.graph.scenes[index].id
+            cells = self._scene_cells[index] = (
+                self.metrics.counter_cell("scene_entries_total", scene=scene),
+                self.metrics.summary_cell("scene_seconds", scene=scene))
+        entries, seconds = cells
+        entries[0] += 1
+        self._input_wait = 0.0
+        start = perf_counter()
+        try:
+            return (yield from super().play_scene(index, resume))
+        finally:
+            seconds[0] += 1
+            seconds[1] += perf_counter() - start - self._input_wait
+
+    def get_player_choice(self, choices: List[str], prompt: str = "\nPilihan Titi: ",
+                          default: Optional[int] = None):
+        # Termasuk menggambar menu, yang jauh lebih singkat dari menunggu pemain
+        start = perf_counter()
+        try:
+            return (yield from super().get_player_choice(choices, prompt, default))
+        finally:
+            waited = perf_counter() - start
+            self._input_wait += waited
+            cell = self._input_cell
+            cell[0] += 1
+            cell[1] += waited
+
+    def slow_print(self, text: str, delay: float = 0.03):
+        start = perf_counter()
+        super().slow_print(text, delay)
+        cell = self._print_cell
+        cell[0] += 1
+        cell[1] += perf_counter() - start
+
+    def use_energy(self, energy_loss: int):
+        if self.energy - energy_loss <= 0:
+            self._exhausted_cell[0] += 1
+        super().use_energy(energy_loss)
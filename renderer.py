@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Renderer efek mengetik untuk The Mystery Adventure Bot.
+
+Teks ditulis per potongan (bukan per huruf), jeda dihitung terhadap jam
+monotonic sehingga keterlambatan tidak menumpuk, dan setiap blok maupun
+scene memiliki batas waktu gambar.
+"""
+
+import sys
+import time
+from typing import Callable, Optional, TextIO
+
+
+class TypewriterRenderer:
+    """Menulis teks dengan efek mengetik secara bertahap"""
+
+    def __init__(self,
+                 stream: Optional[TextIO] = None,
+                 frame_interval: float = 0.1,
+                 block_budget: Optional[float] = 2.0,
+                 scene_budget: Optional[float] = 3.0,
+                 instant: bool = False,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        # stream None berarti sys.stdout yang aktif saat menulis
+        self.stream = stream
+        # Jarak waktu minimum antar penulisan ke stream
+        self.frame_interval = frame_interval
+        # Batas waktu gambar satu blok teks dan satu scene (None = tanpa batas)
+        self.block_budget = block_budget
+        self.scene_budget = scene_budget
+        self.instant = instant
+        self.clock = clock
+        self.sleep = sleep
+        self._scene_start = clock()
+
+    def begin_scene(self):
+        """Memulai hitungan batas waktu untuk scene baru"""
+        self._scene_start = self.clock()
+
+    def _write(self, text: str):
+        stream = self.stream or sys.stdout
+        stream.write(text)
+        # Tanpa efek mengetik output cukup dikirim saat giliran selesai
+        if not self.instant:
+            stream.flush()
+
+    def type(self, text: str, delay: float = 0.03):
+        """Menulis teks dengan jeda `delay` detik per karakter"""
+        if self.instant or delay <= 0 or len(text) <= 1:
+            self._write(text)
+            return
+
+        start = self.clock()
+        budget = self.block_budget
+        if self.scene_budget is not None:
+            remaining = max(0.0, self.scene_budget - (start - self._scene_start))
+            budget = remaining if budget is None else min(budget, remaining)
+        if budget is not None:
+            delay = min(delay, budget / len(text))
+        if delay <= 0:
+            self._write(text)
+            return
+
+        # Satu penulisan untuk setiap frame_interval, bukan untuk setiap huruf
+        chunk = max(1, int(self.frame_interval / delay))
+        written = 0
+        for i in range(0, len(text), chunk):
+            piece = text[i:i + chunk]
+            self._write(piece)
+            written += len(piece)
+            # Jeda diukur dari awal blok agar keterlambatan tidak menumpuk
+            wait = start + written * delay - self.clock()
+            if wait > 0 and written < len(text):
+                self.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Jeda dramatis antar bagian cerita"""
+        if not self.instant:
+            (self.stream or sys.stdout).flush()
+            self.sleep(seconds)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Format simpan biner untuk GameState.
+
+Satu snapshot berisi header tetap yang dipack dengan struct, diikuti jumlah
+per item (urutan GameState.items), bitmask scene yang sudah dilihat (satu
+bit per scene di graf) dan id item urut saat diambil (GameState.order):
+
+    magic "MAB", versi, checksum layout, indeks scene, kesehatan, energi,
+    uang, id lokasi, bitmask quest, bitmask lokasi dikunjungi, flag,
+    indeks ending (255 = belum berakhir), banyak id item, jumlah per item,
+    scene dilihat, urutan item (satu byte per id, sampai akhir snapshot)
+
+Jumlah per item biasanya satu byte. Jika ada jumlah di atas 255 (misalnya
+item hasil farming), flag FLAG_WIDE_ITEMS dipasang dan setiap jumlah
+disimpan empat byte; jumlah yang tidak muat pun ditolak, tidak dipotong.
+
+Tidak ada objek pickle maupun teks tampilan di dalamnya. Indeks scene dan
+id item/quest/lokasi bergantung pada urutan di scenes.py dan state.py,
+jadi checksum layout disimpan juga: snapshot dari layout lain ditolak
+daripada dipulihkan ke scene yang salah. Snapshot versi 1 (tanpa bitmask
+scene dilihat) tetap bisa dimuat, dengan semua scene dianggap belum dilihat;
+snapshot versi 1 dan 2 (tanpa urutan item) menampilkan inventory sesuai
+urutan registry.
+"""
+
+import struct
+import weakref
+import zlib
+from typing import Optional
+
+from scenegraph import SceneGraph, default_graph
+from state import ITEMS, LOCATIONS, QUESTS, GameState
+
+MAGIC = b"MAB"
+VERSION = 3
+
+# magic, versi, checksum, scene, kesehatan, energi, uang, lokasi, quest,
+# lokasi dikunjungi, flag, ending, banyak id item
+_HEADER = struct.Struct("<3sBIHhhqBIIBBB")
+NO_ENDING = 255
+FLAG_GAME_OVER = 1
+# Jumlah item disimpan sebagai uint32, bukan satu byte
+FLAG_WIDE_ITEMS = 2
+
+
+class SaveError(ValueError):
+    """Snapshot rusak, versinya tidak dikenal, atau dari layout yang berbeda"""
+
+
+def layout_checksum(graph: Optional[SceneGraph] = None) -> int:
+    """CRC32 dari urutan scene, item, quest, lokasi dan ending"""
+    graph = graph or default_graph()
+    names = [scene.id for scene in graph.scenes]
+    for registry in (ITEMS, QUESTS, LOCATIONS):
+        names.append("")
+        names.extend(registry.names)
+    names.append("")
+    names.extend(graph.endings())
+    return zlib.crc32("\0".join(names).encode("utf-8"))
+
+
+class SaveFormat:
+    """Mengubah GameState menjadi bytes dan sebaliknya untuk satu graf scene"""
+
+    def __init__(self, graph: Optional[SceneGraph] = None):
+        graph = graph or default_graph()
+        # Graf tidak disimpan, supaya for_graph() tidak menahannya tetap hidup
+        self.scene_count = len(graph)
+        self.seen_size = (len(graph) + 7) // 8
+        self.checksum = layout_checksum(graph)
+        self.endings = graph.endings()
+        self._ending_ids = {ending: i for i, ending in enumerate(self.endings)}
+
+    def dumps(self, state: GameState) -> bytes:
+        ending = NO_ENDING if state.ending_type is None else self._ending_ids[state.ending_type]
+        items = state.items
+        flags = FLAG_GAME_OVER if state.game_over else 0
+        if max(items, default=0) <= 255:
+            counts = bytes(items)
+        else:
+            flags |= FLAG_WIDE_ITEMS
+            try:
+                counts = struct.pack(f"<{len(items)}I", *items)
+            except struct.error:
+                raise SaveError("jumlah item terlalu besar untuk disimpan") from None
+        return _HEADER.pack(
+            MAGIC, VERSION, self.checksum, state.scene, state.health, state.energy,
+            state.money, LOCATIONS.id(state.current_location), state.quests, state.visited,
+            flags, ending, len(items)) + counts \
+            + state.seen.to_bytes(self.seen_size, "little") + bytes(state.order)
+
+    def loads(self, data: bytes) -> GameState:
+        try:
+            (magic, version, checksum, scene, health, energy, money, location,
+             quests, visited, flags, ending, size) = _HEADER.unpack_from(data)
+        except struct.error:
+            raise SaveError("snapshot terlalu pendek") from None
+        if magic != MAGIC or not 1 <= version <= VERSION:
+            raise SaveError("bukan snapshot versi yang dikenal")
+        if checksum != self.checksum:
+            raise SaveError("snapshot dibuat dengan daftar scene/item yang berbeda")
+        seen_size = self.seen_size if version >= 2 else 0
+        end = _HEADER.size + (4 * size if flags & FLAG_WIDE_ITEMS else size)
+        order = data[end + seen_size:] if version >= 3 else b""
+        if (len(data) < end + seen_size or scene >= self.scene_count
+                or (version < 3 and len(data) != end + seen_size)
+                or len(set(order)) != len(order) or any(ident >= size for ident in order)):
+            raise SaveError("snapshot rusak")
+        state = GameState(scene)
+        state.health = health
+        state.energy = energy
+        state.money = money
+        state.current_location = LOCATIONS.name(location)
+        state.quests = quests
+        state.visited = visited
+        if flags & FLAG_WIDE_ITEMS:
+            state.set_items(struct.unpack_from(f"<{size}I", data, _HEADER.size), order)
+        else:
+            state.set_items(data[_HEADER.size:end], order)
+        state.seen = int.from_bytes(data[end:end + seen_size], "little")
+        state.game_over = bool(flags & FLAG_GAME_OVER)
+        state.ending_type = None if ending == NO_ENDING else self.endings[ending]
+        return state
+
+
+_FORMATS: "weakref.WeakKeyDictionary[SceneGraph, SaveFormat]" = weakref.WeakKeyDictionary()
+
+
+def for_graph(graph: SceneGraph) -> SaveFormat:
+    """SaveFormat untuk `graph`, dibuat sekali per graf"""
+    save_format = _FORMATS.get(graph)
+    if save_format is None:
+        save_format = _FORMATS[graph] = SaveFormat(graph)
+    return save_format
+
+
+def dumps(state: GameState) -> bytes:
+    """Snapshot `state` untuk graf scene bawaan"""
+    return for_graph(default_graph()).dumps(state)
+
+
+def loads(data: bytes) -> GameState:
+    """GameState dari snapshot dumps() untuk graf scene bawaan"""
+    return for_graph(default_graph()).loads(data)
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Kompiler tabel scene menjadi graf scene yang tidak bisa diubah.
+
+Tabel di scenes.py dikompilasi sekali, saat graf bawaan pertama kali
+diminta (default_graph() atau GRAPH). Nama scene diganti dengan indeks
+array, nama item dan quest dengan id registry, dan setiap op menjadi
+pasangan (kode op, (argumen...)). Graf hasilnya dipakai bersama oleh semua
+sesi. Proses yang memakai graf dari paket aset (assets.py) tidak pernah
+memuat scenes.py.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from state import ITEMS, LOCATIONS, QUESTS
+
+# Kode op hasil kompilasi
+(CLEAR, SAY, PRINT, PRINTF, PAUSE, STATS, INVENTORY, LOCATION, USE_ENERGY,
+ GAIN_ENERGY, SET_ENERGY, SET_HEALTH, HEALTH, MONEY, SET_MONEY, ITEM, DROP,
+ QUEST, END, IF) = range(20)
+
+# Op yang hanya menampilkan sesuatu dan tidak mengubah state
+RENDER_OPS = frozenset((CLEAR, SAY, PRINT, PRINTF, PAUSE, STATS, INVENTORY))
+
+OPCODES = {
+    "clear": CLEAR, "say": SAY, "print": PRINT, "printf": PRINTF, "pause": PAUSE,
+    "stats": STATS, "inventory": INVENTORY, "location": LOCATION,
+    "use_energy": USE_ENERGY, "gain_energy": GAIN_ENERGY, "set_energy": SET_ENERGY,
+    "set_health": SET_HEALTH, "health": HEALTH, "money": MONEY, "set_money": SET_MONEY,
+    "item": ITEM, "drop": DROP, "quest": QUEST, "end": END, "if": IF,
+}
+
+# Kode guard hasil kompilasi. NEVER dipakai untuk has_item dengan nama
+# yang tidak pernah bisa didapat, sehingga syaratnya tidak pernah terpenuhi.
+G_HAS, G_QUEST, G_VISITED, G_ENERGY_LE, G_MONEY_GE, G_NOT, G_NEVER = range(7)
+
+Op = Tuple[int, Tuple[Any, ...]]
+Guard = Tuple[Any, ...]
+# Tujuan: pasangan (guard, indeks scene) yang diperiksa berurutan. Guard
+# None selalu terpenuhi, indeks None berarti tidak ada scene berikutnya.
+Target = Tuple[Tuple[Optional[Guard], Optional[int]], ...]
+
+
+class Choice(NamedTuple):
+    label: str
+    ops: Tuple[Op, ...]
+    next: Target
+
+
+class Scene(NamedTuple):
+    index: int
+    id: str
+    enter: Tuple[Op, ...]
+    # Op masuk scene jika scene sudah pernah dilihat (sama dengan enter jika tidak ada)
+    revisit: Tuple[Op, ...]
+    choices: Tuple[Choice, ...]
+    labels: Tuple[str, ...]
+    next: Target
+    prompt: str
+    default: Optional[int]
+
+
+class GuardReads(NamedTuple):
+    """Bagian state yang dibaca guard sebuah graf.
+
+    Dipakai alat analisis (explorer, hints) untuk membuat kunci state
+    kanonik: bagian state lain tidak pernah mengubah jalan cerita.
+    """
+    items: Tuple[int, ...]              # id item guard has, urut kemunculan
+    quest_mask: int                     # bit quest yang dibaca guard quest
+    money_thresholds: Tuple[int, ...]   # ambang guard money_ge, terurut
+
+    def item_bits(self, counts: Tuple[int, ...]) -> int:
+        """Bit ke-i menyala jika item ke-i di `items` ada di `counts`"""
+        present = 0
+        for bit, item_id in enumerate(self.items):
+            if item_id < len(counts) and counts[item_id]:
+                present |= 1 << bit
+        return present
+
+
+class SceneGraph:
+    """Graf scene hasil kompilasi, dipakai bersama oleh semua sesi"""
+
+    def __init__(self, scenes: Tuple[Scene, ...]):
+        self.scenes = scenes
+        self._index = MappingProxyType({scene.id: scene.index for scene in scenes})
+
+    def index(self, scene_id: str) -> int:
+        return self._index[scene_id]
+
+    def __getitem__(self, index: int) -> Scene:
+        return self.scenes[index]
+
+    def __len__(self) -> int:
+        return len(self.scenes)
+
+    def walk(self):
+        """(scene, op, None) untuk setiap op dan (scene, None, guard) untuk
+        setiap guard di graf, termasuk yang ada di dalam cabang if"""
+        for scene in self.scenes:
+            stack = list(scene.enter)
+            if scene.revisit is not scene.enter:
+                stack.extend(scene.revisit)
+            for choice in scene.choices:
+                stack.extend(choice.ops)
+            for target in [scene.next] + [choice.next for choice in scene.choices]:
+                for guard, _ in target:
+                    if guard:
+                        yield scene, None, guard
+            while stack:
+                op = stack.pop()
+                yield scene, op, None
+                if op[0] == IF:
+                    yield scene, None, op[1][0]
+                    stack.extend(op[1][1])
+                    stack.extend(op[1][2])
+
+    def guard_reads(self) -> GuardReads:
+        """Item, quest dan ambang uang yang dibaca guard di graf ini"""
+        items: Dict[int, None] = {}
+        quest_mask = 0
+        thresholds = set()
+        for _, _, guard in self.walk():
+            if guard is None:
+                continue
+            while guard[0] == G_NOT:
+                guard = guard[1]
+            if guard[0] == G_HAS:
+                items.setdefault(guard[1])
+            elif guard[0] == G_QUEST:
+                quest_mask |= 1 << guard[1]
+            elif guard[0] == G_MONEY_GE:
+                thresholds.add(guard[1])
+        return GuardReads(tuple(items), quest_mask, tuple(sorted(thresholds)))
+
+    def endings(self) -> Tuple[str, ...]:
+        """Semua ending_type yang ada di graf, urut sesuai kemunculannya"""
+        endings = {}
+        for _, op, _ in self.walk():
+            if op is not None and op[0] == END:
+                endings.setdefault(op[1][0])
+        return tuple(endings)
+
+    @classmethod
+    def compile(cls, table: Dict[str, Dict[str, Any]], start: str) -> "SceneGraph":
+        """Mengompilasi tabel scene; scene `start` selalu mendapat indeks 0"""
+        if start not in table:
+            raise ValueError(f"scene awal tidak dikenal: {start}")
+        ids = [start] + [scene_id for scene_id in table if scene_id != start]
+        index = {scene_id: i for i, scene_id in enumerate(ids)}
+
+        # Semua item yang bisa didapat didaftarkan dulu, supaya guard "has"
+        # bisa membedakan item yang memang tidak pernah ada
+        for spec in table.values():
+            for op in _walk_ops(spec):
+                if op[0] == "item":
+                    ITEMS.id(op[1])
+
+        compiler = _Compiler(index)
+        scenes = []
+        for i, scene_id in enumerate(ids):
+            spec = table[scene_id]
+            try:
+                choices = tuple(compiler.choice(choice) for choice in spec.get("choices", ()))
+                enter = compiler.ops(spec.get("enter", ()))
+                revisit = enter
+                if "revisit" in spec:
+                    revisit = compiler.ops(spec["revisit"])
+                    if _state_ops(revisit) != _state_ops(enter):
+                        raise ValueError("op revisit selain tampilan berbeda dari enter")
+                scenes.append(Scene(
+                    index=i,
+                    id=scene_id,
+                    enter=enter,
+                    revisit=revisit,
+                    choices=choices,
+                    labels=tuple(choice.label for choice in choices),
+                    next=compiler.target(spec.get("next")),
+                    prompt=spec.get("prompt", "\nPilihan Titi: "),
+                    default=spec.get("default"),
+                ))
+            except (KeyError, ValueError) as error:
+                raise ValueError(f"scene {scene_id}: {error}") from None
+        return cls(tuple(scenes))
+
+
+def _state_ops(ops: Tuple[Op, ...]) -> Tuple[Op, ...]:
+    return tuple(op for op in ops if op[0] not in RENDER_OPS)
+
+
+def _walk_ops(spec: Dict[str, Any]):
+    """Semua op di sebuah scene, termasuk op di dalam cabang if"""
+    stack = list(spec.get("enter", ())) + list(spec.get("revisit", ()))
+    for choice in spec.get("choices", ()):
+        if len(choice) == 3:
+            stack.extend(choice[1])
+    while stack:
+        op = stack.pop()
+        yield op
+        if op[0] == "if":
+            stack.extend(op[2])
+            stack.extend(op[3])
+
+
+class _Compiler:
+    def __init__(self, index: Dict[str, int]):
+        self.index = index
+
+    def ops(self, ops) -> Tuple[Op, ...]:
+        return tuple(self.op(op) for op in ops)
+
+    def op(self, op) -> Op:
+        name, *args = op
+        if name not in OPCODES:
+            raise ValueError(f"op tidak dikenal: {name}")
+        code = OPCODES[name]
+        if code == SAY:
+            return (SAY, (args[0], args[1] if len(args) > 1 else 0.03))
+        if code == LOCATION:
+            return (LOCATION, (args[0], LOCATIONS.id(args[0])))
+        if code == ITEM:
+            return (ITEM, (ITEMS.id(args[0]),))
+        if code == DROP:
+            return (DROP, (ITEMS.get(args[0]),))
+        if code == QUEST:
+            return (QUEST, (QUESTS.id(args[0]),))
+        if code == IF:
+            return (IF, (self.guard(args[0]), self.ops(args[1]), self.ops(args[2])))
+        return (code, tuple(args))
+
+    def guard(self, guard) -> Guard:
+        name, *args = guard
+        if name == "has":
+            item_id = ITEMS.get(args[0])
+            return (G_NEVER, args[0]) if item_id is None else (G_HAS, item_id)
+        if name == "quest":
+            return (G_QUEST, QUESTS.id(args[0]))
+        if name == "visited":
+            return (G_VISITED,)
+        if name == "energy_le":
+            return (G_ENERGY_LE, args[0])
+        if name == "money_ge":
+            return (G_MONEY_GE, args[0])
+        if name == "not":
+            return (G_NOT, self.guard(args[0]))
+        raise ValueError(f"guard tidak dikenal: {name}")
+
+    def target(self, target) -> Target:
+        if target is None or isinstance(target, str):
+            target = [target]
+        *branches, default = target
+        return tuple((self.guard(guard), self.scene(scene_id)) for guard, scene_id in branches) \
+            + ((None, self.scene(default)),)
+
+    def scene(self, scene_id: Optional[str]) -> Optional[int]:
+        if scene_id is None:
+            return None
+        if scene_id not in self.index:
+            raise ValueError(f"tujuan tidak dikenal: {scene_id}")
+        return self.index[scene_id]
+
+    def choice(self, choice) -> Choice:
+        if len(choice) == 2:
+            label, target = choice
+            ops = ()
+        else:
+            label, ops, target = choice
+        return Choice(label, self.ops(ops), self.target(target))
+
+
+_DEFAULT: Optional[SceneGraph] = None
+
+
+def default_graph() -> SceneGraph:
+    """Graf cerita bawaan dari scenes.py, dikompilasi saat pertama kali diminta"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        from scenes import SCENES, START_SCENE
+        _DEFAULT = SceneGraph.compile(SCENES, START_SCENE)
+    return _DEFAULT
+
+
+def __getattr__(name: str):
+    # GRAPH tetap bisa diimpor, tetapi scenes.py baru dimuat saat itu
+    if name == "GRAPH":
+        return default_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,1091 @@
+# -*- coding: utf-8 -*-
+"""
+Tabel scene The Mystery Adventure Bot.
+
+Seluruh cerita, pilihan, efek item/quest dan syarat (guard) dideklarasikan
+di sini sebagai data. Tabel ini dikompilasi sekali oleh scenegraph menjadi
+graf yang tidak bisa diubah dan dipakai bersama oleh semua sesi.
+
+Op yang dikenal:
+    ("clear",)                          membersihkan layar
+    ("say", teks[, delay])              mencetak dengan efek mengetik
+    ("print", teks)                     mencetak langsung
+    ("printf", templat)                 seperti print, diisi {money}
+    ("pause", detik)                    jeda dramatis
+    ("stats",) / ("inventory",)         kotak status / isi inventory
+    ("location", nama)                  lokasi pemain saat ini
+    ("use_energy", n)                   memakai energi (lihat use_energy)
+    ("gain_energy", n)                  menambah energi, maksimal 100
+    ("set_energy", n) / ("set_health", n) / ("health", delta)
+    ("money", delta) / ("set_money", n)
+    ("item", nama) / ("drop", nama) / ("quest", nama)
+    ("end", ending_type)                permainan selesai
+    ("if", guard, [op...], [op...])
+
+Guard:
+    ("has", item) / ("quest", nama) / ("visited",)
+    ("energy_le", n) / ("money_ge", n) / ("not", guard)
+
+Scene:
+    "enter"    op yang dijalankan saat scene dimulai
+    "revisit"  pengganti "enter" jika scene sudah pernah dilihat, dengan teks
+               ringkas; selain op tampilan, op-nya harus sama dengan "enter"
+    "choices"  [(label, tujuan) atau (label, [op...], tujuan), ...]
+    "next"     tujuan jika scene tidak punya pilihan
+    "prompt"   prompt khusus untuk pilihan
+    "default"  pilihan yang dipakai untuk nomor di luar daftar
+
+Tujuan berupa id scene, None (tidak ada scene berikutnya: kembali ke
+scene awal jika permainan belum berakhir) atau daftar
+[(guard, id), ..., id] yang diperiksa berurutan.
+"""
+
+# Scene pertama yang dimainkan setiap kali permainan dimulai
+START_SCENE = "location_desa_panjatan"
+
+
+def banner(title: str) -> list:
+    """Judul scene di antara dua garis"""
+    return [("say", "=" * 50), ("say", title, 0.05), ("say", "=" * 50)]
+
+
+def buy(item: str, price: int) -> list:
+    """Membeli item di toko jika uangnya cukup"""
+    return [("if", ("money_ge", price),
+             [("money", -price), ("item", item)],
+             [("print", "Uangmu tidak cukup!"), ("pause", 2)])]
+
+
+SCENES = {
+    # ==================== DESA ====================
+
+    "location_desa_panjatan": {
+        "enter": [
+            ("clear",),
+            *banner("🏘️  DESA PANJATAN - Awal Petualangan Titi 🏘️"),
+            ("say", """
+Titi adalah seorang penjelajah muda yang pemberani. Dia baru tiba di Desa Panjatan,
+sebuah desa kecil yang dikelilingi hutan lebat dan pegunungan misteri.
+
+Konon kabarnya, harta karun legendaris tersembunyi di tempat ini. Harta karun itu
+dikumpulkan oleh seorang bandit zaman dulu dan diyakini masih terpendam hingga sekarang.
+
+Desa ini memiliki beberapa lokasi menarik:
+- Rumah Tua di tepi hutan (katanya pemiliknya tahu tentang harta karun)
+- Pasar Desa (tempat jual-beli)
+- Makam Tua (tempat yang dianggap angker)
+- Danau Panjatan (pemandangan indah tapi berbahaya)
+        """),
+            ("if", ("visited",), [("stats",), ("inventory",)], []),
+        ],
+        "revisit": [
+            ("clear",),
+            ("print", "🏘️  DESA PANJATAN"),
+            ("print", "Titi kembali ke tengah desa. Ke mana lagi sekarang?"),
+            ("if", ("visited",), [("stats",), ("inventory",)], []),
+        ],
+        "choices": [
+            ("Pergi ke Rumah Tua", "location_rumah_tua"),
+            ("Kunjungi Pasar Desa", "location_pasar_desa"),
+            ("Jelajahi Makam Tua", "location_makam_tua"),
+            ("Pergi ke Danau Panjatan", "location_danau_panjatan"),
+            ("Istirahat di penginapan", "location_penginapan"),
+        ],
+    },
+
+    "location_rumah_tua": {
+        "enter": [
+            ("clear",),
+            ("location", "Rumah Tua"),
+            *banner("🏚️  RUMAH TUA - Misteri Memanggilmu 🏚️"),
+            ("say", """
+Rumah tua ini terlihat sangat tua dan ditinggalkan. Pintunya setengah terbuka
+dan terdengar angin berhembus lemah dari dalam.
+
+Saat Titi mendekat, seorang nenek tua keluar dari rumah!
+Wajahnya keriput namun matanya masih tajam.
+
+NENEK: "Halo nak! Kamu mencari apa di tempat ini?"
+        """),
+            ("use_energy", 15),
+        ],
+        "revisit": [
+            ("clear",),
+            ("location", "Rumah Tua"),
+            ("print", "🏚️  RUMAH TUA"),
+            ("print", "Nenek tua itu keluar lagi dari balik pintu yang setengah terbuka."),
+            ("use_energy", 15),
+        ],
+        "next": [
+            (("not", ("quest", "Bertemu Nenek Penjaga")), "location_rumah_tua:pertama"),
+            "location_rumah_tua:lagi",
+        ],
+    },
+
+    "location_rumah_tua:pertama": {
+        "choices": [
+            ("Bertanya tentang harta karun", "quest_harta_karun"),
+            ("Bertanya tentang desa ini", "talk_nenek_desa"),
+            ("Mencuri barang di dalam rumah", "steal_rumah_tua"),
+            ("Pergi dari sini", "location_desa_panjatan"),
+        ],
+    },
+
+    "location_rumah_tua:lagi": {
+        "enter": [
+            ("print", "\nNenek: 'Sudah ketemu jawabannya belum?'"),
+        ],
+        "choices": [
+            ("Tanya petunjuk lebih lanjut", "quest_harta_karun"),
+            ("Pergi dari sini", "location_desa_panjatan"),
+        ],
+    },
+
+    "quest_harta_karun": {
+        "enter": [
+            ("clear",),
+            ("say", """
+TITI: "Nenek, apakah kamu tahu tentang harta karun yang terpendam di sini?"
+
+NENEK: (tersenyum misterius)
+"Harta karun? Ah, cerita lama dari masa kejayaan desa ini.
+Benar, ada harta karun yang disembunyikan 40 tahun yang lalu.
+Tapi lokasi pastinya hanya diketahui oleh 3 orang:
+  1. Pembuat peta tersembunyi (sudah meninggal)
+  2. Penjaga harta yang tersisa (mungkin masih hidup)
+  3. Pemilik toko barang antik di pasar
+
+Jika kamu ingin menemukannya, kumpulkan petunjuk dari:
+- Makam Tua (tempat istirahat pembuat peta)
+- Danau Panjatan (tempat perjanjian rahasia)
+- Toko Barang Antik di pasar"
+
+NENEK: "Tunggu... ambil ini. Kunci ini bisa membuka sesuatu yang penting."
+        """),
+            ("if", ("not", ("has", "Kunci Berkarat")),
+             [("item", "Kunci Berkarat"), ("item", "Catatan Nenek: 'Cari 3 bagian peta'")],
+             []),
+            ("quest", "Bertemu Nenek Penjaga"),
+            ("pause", 2),
+        ],
+        "next": "location_rumah_tua",
+    },
+
+    "talk_nenek_desa": {
+        "enter": [
+            ("say", """
+TITI: "Nenek, bisa ceritakan tentang sejarah desa ini?"
+
+NENEK: "Desa Panjatan dulu sangat ramai. Ada pedagang, petualang, dan penjelajah.
+Tapi suatu hari, seorang bandit terkenal menyembunyikan hartanya di sini.
+Sejak saat itu, desa jadi sepi. Orang takut ada kejadian buruk."
+
+TITI: "Apakah ada orang yang sempat menemukan harta karun itu?"
+
+NENEK: "Tidak ada. Peta aslinya dipecah menjadi 3 bagian dan disembunyikan.
+Setiap bagian dijaga oleh seseorang. Jika kamu bisa mengumpulkan semuanya,
+mungkin kamu bisa menemukan hartanya."
+        """),
+            ("pause", 2),
+        ],
+        "next": "location_rumah_tua",
+    },
+
+    "steal_rumah_tua": {
+        "enter": [
+            ("clear",),
+            ("say", """
+Titi mencoba masuk ke rumah tua sambil nenek tidak memperhatikan.
+
+Di dalam rumah, Titi menemukan:
+- Sejadi barang antik yang berharga
+- Beberapa gambar tua di dinding
+
+Saat Titi hendak mengambil barang, nenek tiba-tiba muncul!
+
+NENEK: "HENTIKAN! Apa yang kamu lakukan?!"
+
+Titi tertangkap basah mencuri. Nenek marah dan mengusirnya keluar!
+
+❌ Kesempatan untuk mendapat petunjuk dari nenek hilang.
+        """),
+            ("quest", "Usir dari Rumah Tua"),
+            ("pause", 3),
+        ],
+        "next": "location_desa_panjatan",
+    },
+
+    # ==================== PASAR ====================
+
+    "location_pasar_desa": {
+        "enter": [
+            ("clear",),
+            ("location", "Pasar Desa"),
+            *banner("🏪 PASAR DESA - Pusat Kehidupan Desa 🏪"),
+            ("say", """
+Pasar desa ramai dengan pedagang dan pembeli. Aroma makanan tradisional
+menyeruak di udara. Titi melihat beberapa toko:
+
+1. Toko Barang Antik - Pemilik tua yang misterius
+2. Warung Makan - Tempat mendengarkan cerita lokal
+3. Toko Perlengkapan - Untuk membeli peralatan petualangan
+4. Rumah Dukun - Tempat mistis
+        """),
+            ("use_energy", 10),
+        ],
+        "revisit": [
+            ("clear",),
+            ("location", "Pasar Desa"),
+            ("print", "🏪 PASAR DESA"),
+            ("print", "Pasar masih ramai. Toko antik, warung makan, toko perlengkapan dan rumah dukun."),
+            ("use_energy", 10),
+        ],
+        "choices": [
+            ("Masuk ke Toko Barang Antik", "location_toko_antik"),
+            ("Mampir ke Warung Makan", "location_warung_makan"),
+            ("Belanja di Toko Perlengkapan", "location_toko_perlengkapan"),
+            ("Kunjungi Rumah Dukun", "location_rumah_dukun"),
+            ("Kembali ke Desa Panjatan", "location_desa_panjatan"),
+        ],
+    },
+
+    "location_toko_antik": {
+        "enter": [
+            ("clear",),
+            ("say", """
+Toko ini penuh dengan barang-barang antik berdebu. Di balik meja,
+seorang pemilik toko tua sedang membaca buku.
+
+PEMILIK TOKO: "Selamat datang. Ada yang bisa saya bantu?"
+
+TITI: "Apakah kamu tahu tentang harta karun yang tersembunyi?"
+
+PEMILIK TOKO: (tersenyum)
+"Ah, peta! Iya, saya memiliki satu bagian peta asli.
+Bagian ini menunjukkan lokasi Danau Panjatan.
+
+Tapi... ini hanya akan kuberikan kepada yang bisa menjawab teka-teki.
+
+TEKA-TEKI: 'Aku memiliki kota, tapi tidak ada rumah. Aku memiliki gunung,
+tapi tidak ada pohon. Aku memiliki air, tapi tidak ada ikan. Apa aku?'
+        """),
+            ("use_energy", 10),
+        ],
+        "revisit": [
+            ("clear",),
+            ("print", """
+PEMILIK TOKO: "Kamu lagi. Teka-tekinya masih sama:
+'Aku memiliki kota, tapi tidak ada rumah. Aku memiliki gunung,
+tapi tidak ada pohon. Aku memiliki air, tapi tidak ada ikan. Apa aku?'"
+        """),
+            ("use_energy", 10),
+        ],
+        "next": [
+            (("not", ("has", "Bagian Peta 1")), "location_toko_antik:teka_teki"),
+            "location_toko_antik:kembali",
+        ],
+    },
+
+    "location_toko_antik:teka_teki": {
+        "enter": [
+            ("print", "\n(Pikirkan jawaban Titi...)"),
+        ],
+        "choices": [
+            # Peta adalah jawaban yang benar
+            ("Peta", [
+                ("clear",),
+                ("print", "PEMILIK TOKO: 'BENAR! Kamu cerdas!'\n"),
+                ("item", "Bagian Peta 1 (Danau Panjatan)"),
+                ("money", 50),
+                ("quest", "Jawab Teka-teki Toko Antik"),
+            ], "location_toko_antik:kembali"),
+            ("Dunia", [
+                ("clear",),
+                ("print", "PEMILIK TOKO: 'Salah. Coba lagi nanti.'\n"),
+                ("money", -10),
+            ], "location_toko_antik:kembali"),
+            ("Langit", [
+                ("clear",),
+                ("print", "PEMILIK TOKO: 'Salah. Coba lagi nanti.'\n"),
+                ("money", -10),
+            ], "location_toko_antik:kembali"),
+            ("Kapal", [
+                ("clear",),
+                ("print", "PEMILIK TOKO: 'Salah. Coba lagi nanti.'\n"),
+                ("money", -10),
+            ], "location_toko_antik:kembali"),
+        ],
+    },
+
+    "location_toko_antik:kembali": {
+        "choices": [
+            ("Kembali ke Pasar", "location_pasar_desa"),
+        ],
+    },
+
+    "location_warung_makan": {
+        "enter": [
+            ("clear",),
+            ("say", """
+Warung makan ini menghangatkan dengan aroma gulai dan nasi kuning.
+Pemilik warung adalah ibu tua yang ramah.
+
+IBU WARUNG: "Halo nak! Mau pesan apa? Nasi goreng spesial kami terkenal!"
+
+TITI: "Biaya berapa? Aku sedang mencari harta karun..."
+
+IBU WARUNG: "Ah, banyak yang cari tapi tidak pernah ada yang berhasil!
+Tapi, saya tahu seseorang yang pernah mendapat bagian peta.
+Dia adalah penjaga Makam Tua. Nama dia Pak Tirto."
+
+IBU WARUNG: "Silakan makan dulu. Kuatkan diri mu. (Memberikan makanan gratis)
+
+Energi Titi pulih! Titi merasa lebih segar.
+        """),
+            ("gain_energy", 30),
+            ("item", "Sepiring Nasi Kuning"),
+            ("use_energy", 5),
+        ],
+        "revisit": [
+            ("clear",),
+            ("print", "IBU WARUNG: \"Lapar lagi, nak?\" Sepiring nasi kuning hangat memulihkan energi Titi."),
+            ("gain_energy", 30),
+            ("item", "Sepiring Nasi Kuning"),
+            ("use_energy", 5),
+        ],
+        "choices": [
+            ("Kembali ke Pasar", "location_pasar_desa"),
+        ],
+    },
+
+    "location_toko_perlengkapan": {
+        "enter": [
+            ("clear",),
+            ("say", """
+Toko perlengkapan ini menjual berbagai barang untuk petualangan:
+- Kompas (Rp 50)
+- Obat Penawar (Rp 60)
+- Tali Tebal (Rp 40)
+- Perlengkapan Menggali (Rp 80)
+- Lampu Tangan (Rp 30)
+
+PENJUAL: "Silakan lihat-lihat. Semua wajib untuk petualangan di hutan!"
+        """),
+            ("printf", "\nUangmu saat ini: Rp {money}\n"),
+        ],
+        "revisit": [
+            ("clear",),
+            ("print", "PENJUAL: \"Mau tambah perlengkapan?\""),
+            ("printf", "\nUangmu saat ini: Rp {money}\n"),
+        ],
+        "choices": [
+            ("Kompas - Rp 50", buy("Kompas", 50), "location_pasar_desa"),
+            ("Obat Penawar - Rp 60", buy("Obat Penawar", 60), "location_pasar_desa"),
+            ("Tali Tebal - Rp 40", buy("Tali Tebal", 40), "location_pasar_desa"),
+            ("Perlengkapan Menggali - Rp 80", buy("Perlengkapan Menggali", 80), "location_pasar_desa"),
+            ("Lampu Tangan - Rp 30", buy("Lampu Tangan", 30), "location_pasar_desa"),
+            ("Tidak membeli apa-apa", "location_pasar_desa"),
+        ],
+        "prompt": "\nPilihan: ",
+        "default": 6,
+    },
+
+    "location_rumah_dukun": {
+        "enter": [
+            ("clear",),
+            ("say", """
+Rumah ini penuh dengan tanaman aneh dan aroma dupa.
+Seorang dukun tua menyambut Titi dengan tatapan dalam.
+
+DUKUN: "Aku melihat aura petualangan di dirimu. Kamu mencari sesuatu?"
+
+TITI: "Aku mencari harta karun..."
+
+DUKUN: "Harta karun akan membawa ketiga-belas cobaan untukmu.
+Tapi, aku punya ramalan penting untuk dirimu.
+
+📜 RAMALAN DUKUN:
+'Ketiga bagian peta tersembunyi di tempat:
+ 1. Hati sang penjaga (Makam Tua)
+ 2. Pegangan tangan zaman dulu (Danau Panjatan)  
+ 3. Ingatan pemilik barang lama (Pasar)
+
+Jika tiga terhimpun, pintu emas akan terbuka
+Tapi hati-hati, musuh penjaga mungkin mengikutimu.'"
+
+DUKUN memberi Titi sebotol ramuan untuk keberuntungan.
+        """),
+            ("item", "Ramuan Keberuntungan Dukun"),
+            ("use_energy", 5),
+        ],
+        "revisit": [
+            ("clear",),
+            ("print", "DUKUN: \"Ingat ramalanku: tiga bagian peta, tiga tempat.\" Dukun memberi ramuan lagi."),
+            ("item", "Ramuan Keberuntungan Dukun"),
+            ("use_energy", 5),
+        ],
+        "choices": [
+            ("Kembali ke Pasar", "location_pasar_desa"),
+        ],
+    },
+
+    # ==================== MAKAM TUA ====================
+
+    "location_makam_tua": {
+        "enter": [
+            ("clear",),
+            ("location", "Makam Tua"),
+            *banner("⚰️  MAKAM TUA - Tempat Istirahat Pembuat Peta ⚰️"),
+            ("say", """
+Makam tua ini terletak di tengah hutan yang sepi. Banyak makam tua
+dengan tulisan yang sudah tidak terbaca.
+
+Titi melihat seorang penjaga makam yang sedang membersihkan area.
+Nama penjaga ini adalah Pak Tirto, seperti yang disebut ibu warung.
+
+PAK TIRTO: "Siapa yang datang ke tempat ini? Aku jarang melihat pengunjung."
+
+TITI: "Pak, saya mencari harta karun. Apakah kamu punya informasi?"
+
+PAK TIRTO: (berhenti sejenak)
+"Harta karun... ya, aku tahu ceritanya. Pembuat peta dimakamkan di sini.
+Dia adalah sahabat saya dulu sebelum meninggal.
+
+Dia meninggalkan sesuatu yang berharga untuk orang yang bisa memahami pesan tersembunyi.
+
+Tapi sebelum itu, bisa tolong aku bersihkan makam? Aku sudah tua dan lelah."
+        """),
+            ("use_energy", 20),
+        ],
+        "revisit": [
+            ("clear",),
+            ("location", "Makam Tua"),
+            ("print", "⚰️  MAKAM TUA"),
+            ("print", "Makam tua masih sepi. Pak Tirto menoleh dari pekerjaannya."),
+            ("use_energy", 20),
+        ],
+        "next": [
+            (("not", ("quest", "Bersihkan Makam")), "location_makam_tua:pertama"),
+            "location_makam_tua:lagi",
+        ],
+    },
+
+    "location_makam_tua:pertama": {
+        "choices": [
+            ("Membantu Pak Tirto membersihkan makam", "help_pak_tirto"),
+            ("Menolak dan pergi", "location_desa_panjatan"),
+        ],
+    },
+
+    "location_makam_tua:lagi": {
+        "enter": [
+            ("print", "\nPAK TIRTO: 'Terima kasih anak muda. Masih cari peta?'"),
+        ],
+        "choices": [
+            ("Tanya tentang peta", "help_pak_tirto"),
+            ("Pergi dari sini", "location_desa_panjatan"),
+        ],
+    },
+
+    "help_pak_tirto": {
+        "enter": [
+            ("clear",),
+            ("say", """
+Titi membantu Pak Tirto membersihkan makam dengan baik.
+Pak Tirto terlihat sangat senang dan berterima kasih.
+
+PAK TIRTO: "Terima kasih banyak anak muda. Kamu berbeda dari lelaki muda lainnya.
+Kamu peduli pada orang tua.
+
+Untuk itu, aku akan memberikan bagian peta yang dipercayakan kepadaku.
+Ini adalah bagian ke dua, yang menunjukkan hutan rahasia!"
+
+Pak Tirto memberikan:
+✓ Bagian Peta 2 (Hutan Rahasia)
+✓ Kunci Tua yang mungkin membuka sesuatu
+✓ Perlengkapan Menggali berkualitas baik
+        """),
+            ("if", ("not", ("has", "Bagian Peta 2")), [
+                ("item", "Bagian Peta 2 (Hutan Rahasia)"),
+                ("item", "Kunci Tua Pak Tirto"),
+                ("item", "Perlengkapan Menggali Profesional"),
+                ("quest", "Bersihkan Makam"),
+                ("money", 100),
+            ], []),
+            ("pause", 2),
+        ],
+        "next": "location_makam_tua",
+    },
+
+    # ==================== DANAU PANJATAN ====================
+
+    "location_danau_panjatan": {
+        "enter": [
+            ("clear",),
+            ("location", "Danau Panjatan"),
+            *banner("💧 DANAU PANJATAN - Keindahan dan Misteri 💧"),
+            ("say", """
+Danau Panjatan terletak di tengan lembah yang sunyi. Air danau jernih
+dan mencerminkan langit biru. Tapi ada yang aneh di sini...
+
+Titi melihat tulisan-tulisan aneh di batu besar di tepi danau.
+Seperti pesan rahasia dari zaman dulu.
+
+Terdapat juga sebuah patung setengah terendam yang mungkin kunci sesuatu.
+
+Tiba-tiba, seorang pemuda misterius muncul dari balik pohon!
+
+PEMUDA MISTERIUS: "Hei! Apa yang kamu cari di tempat ini?"
+        """),
+            ("use_energy", 15),
+        ],
+        "revisit": [
+            ("clear",),
+            ("location", "Danau Panjatan"),
+            ("print", "💧 DANAU PANJATAN"),
+            ("print", "Air danau tetap jernih. Tulisan aneh di batu besar masih menunggu dipecahkan."),
+            ("use_energy", 15),
+        ],
+        "next": [
+            (("not", ("quest", "Bertemu Pemuda Misterius")), "location_danau_panjatan:pertama"),
+            "location_danau_panjatan:lagi",
+        ],
+    },
+
+    "location_danau_panjatan:pertama": {
+        "choices": [
+            ("Bertanya siapa dia", "talk_pemuda_misterius"),
+            ("Langsung mencari peta", "search_peta_danau"),
+            ("Mengajak jadi teman", "befriend_pemuda"),
+            ("Pergi dari sini", "location_desa_panjatan"),
+        ],
+    },
+
+    "location_danau_panjatan:lagi": {
+        "choices": [
+            ("Cari peta di danau", "search_peta_danau"),
+            ("Berbincang lagi", "talk_pemuda_misterius"),
+            ("Pergi dari sini", "location_desa_panjatan"),
+        ],
+    },
+
+    "talk_pemuda_misterius": {
+        "enter": [
+            ("say", """
+TITI: "Siapa namamu? Apa yang kamu lakukan di sini?"
+
+PEMUDA: "Nama saya Reno. Aku adalah keturunan penjaga harta karun itu.
+Ayahku dulu menjaga harta, sebelum meninggal.
+
+Sebenarnya... aku juga mencari peta itu. Tapi tidak untuk mengambil harta.
+Aku ingin memastikan harta itu tidak disalahgunakan.
+
+PETA TERAKHIR mungkin sudah hilang diambil orang lain.
+Tapi, jika kamu butuh bantuan, aku siap membantu."
+
+TITI: "Apakah kamu tahu di mana peta itu?"
+
+RENO: "Patung di danau ini adalah kunci. Jika kamu bisa membukanya,
+peta ketiga ada di dalamnya."
+        """),
+            ("quest", "Bertemu Pemuda Misterius"),
+            ("pause", 2),
+        ],
+        "next": "location_danau_panjatan",
+    },
+
+    "befriend_pemuda": {
+        "enter": [
+            ("say", """
+TITI: "Hei, sepertinya kita punya tujuan yang sama. Mau jadi teman?"
+
+RENO: (tersenyum)
+"Aku suka orangmu. Okay, kita jadi tim sekarang!
+
+Untuk membuka patung ini, kita butuh kunci khusus.
+Aku punya sebagian, tapi separuhnya hilang.
+
+Mungkin kunci itu satu set. Jika kamu punya kunci dari tempat lain,
+bisa kita cocokan."
+        """),
+            ("item", "Separuh Kunci Reno"),
+            ("quest", "Berteman dengan Reno"),
+            ("pause", 2),
+        ],
+        "next": "location_danau_panjatan",
+    },
+
+    "search_peta_danau": {
+        "enter": [
+            ("clear",),
+            ("if", ("has", "Perlengkapan Menggali Profesional"), [
+                ("say", """
+Titi menggunakan perlengkapan menggali profesional dari Pak Tirto.
+
+Dengan hati-hati, Titi menggali area di sekitar patung.
+Setelah beberapa menit, sesuatu terasa keras!
+
+KRRRRR... patung terbuka!
+
+Di dalamnya tersimpan:
+✓ Bagian Peta 3 (Gua Rahasia)
+✓ Peta Lengkap yang menunjukkan lokasi harta karun
+✓ Buku Harian Pembuat Peta
+
+Akhirnya! Ketiga bagian peta sudah terkumpul!
+            """),
+                ("if", ("not", ("has", "Bagian Peta 3")), [
+                    ("item", "Bagian Peta 3 (Gua Rahasia)"),
+                    ("item", "PETA LENGKAP - Harta Karun!"),
+                    ("item", "Buku Harian Pembuat Peta"),
+                    ("money", 150),
+                ], []),
+                ("print", "\n🎉 PENCAPAIAN: Semua 3 bagian peta berhasil dikumpulkan!"),
+                ("pause", 3),
+            ], [
+                ("say", """
+Titi mencoba menggali dengan tangan, tapi sangat sulit.
+Tanpa alat yang tepat, Titi tidak bisa membuka patung.
+
+Titi perlu perlengkapan menggali yang lebih baik.
+            """),
+                ("pause", 2),
+            ]),
+        ],
+        "next": "location_danau_panjatan",
+    },
+
+    # ==================== PENGINAPAN ====================
+
+    "location_penginapan": {
+        "enter": [
+            ("clear",),
+            ("say", """
+Titi beristirahat di penginapan sederhana di desa.
+        
+Energi Titi pulih sepenuhnya setelah tidur.
+Kesehatan juga meningkat kembali.
+        """),
+            ("set_energy", 100),
+            ("set_health", 100),
+        ],
+        "next": [
+            (("has", "PETA LENGKAP - Harta Karun!"), "location_penginapan:mimpi"),
+            "location_penginapan:bangun",
+        ],
+    },
+
+    "location_penginapan:mimpi": {
+        "enter": [
+            ("print", "\nTiti bermimpi. Dalam mimpi, dia melihat lokasi harta karun..."),
+            ("pause", 2),
+            ("print", "Saatnya menemukan harta karun yang sesungguhnya!"),
+            ("pause", 2),
+        ],
+        "next": "show_final_location",
+    },
+
+    "location_penginapan:bangun": {
+        "enter": [
+            ("print", "\nSetelah istirahat, Titi siap melanjutkan petualangan."),
+            ("pause", 2),
+        ],
+        "next": "location_desa_panjatan",
+    },
+
+    # ==================== GUA RAHASIA ====================
+
+    "show_final_location": {
+        "enter": [
+            ("clear",),
+            ("location", "Gua Rahasia"),
+            *banner("⛏️  GUA RAHASIA - TUJUAN AKHIR ⛏️"),
+            ("say", """
+Dengan peta lengkap, Titi dapat menemukan lokasi gua rahasia.
+Gua ini tersembunyi di balik tebing yang curam.
+
+Setelah perjalanan panjang, Titi akhirnya sampai di mulut gua.
+
+Udara dingin menerpa. Di dalam gua, terlihat cahaya emas yang bersinar.
+
+TITI: "Ini dia... harta karun legendaris yang dicari-cari selama puluhan tahun!"
+
+Titi memasuki gua dengan perlahan...
+        """),
+            ("pause", 2),
+        ],
+        "next": "navigate_gua_rahasia",
+    },
+
+    "navigate_gua_rahasia": {
+        "enter": [
+            ("clear",),
+            ("say", """
+Di dalam gua, Titi menemukan berbagai tantangan:
+
+1. LORONG PERTAMA: Lantai yang tidak stabil
+   Titi harus berjalan dengan hati-hati.
+
+2. LORONG KEDUA: Ruangan gelap yang misterius
+   Titi butuh cahaya untuk melihat.
+
+3. LORONG KETIGA: Ruangan dengan banyak harta emas
+   Tapi... ada yang aneh di sini...
+        """),
+        ],
+        "next": "handle_lorong_pertama",
+    },
+
+    "handle_lorong_pertama": {
+        "enter": [
+            ("clear",),
+            ("say", """
+LORONG PERTAMA: Lantai Tidak Stabil
+
+Titi berjalan dengan hati-hati. Lantai batu mulai bergetar!
+
+Pilihan Titi:
+        """),
+        ],
+        "choices": [
+            ("Berlari cepat ke ujung lorong", [
+                ("say", """
+Titi berlari cepat, tapi lantai mulai runtuh!
+
+BRRRRAAAAKKKKKK!!!
+
+Titi terjatuh dan terluka.
+
+❌ Titi mengalami cedera. Kesehatan turun!
+            """),
+                ("health", -30),
+                ("pause", 2),
+            ], "handle_lorong_kedua"),
+            ("Berjalan perlahan dan hati-hati", [
+                ("say", """
+Titi berjalan dengan perlahan dan terukur.
+Lantai tetap stabil karena Titi tidak memberikan beban berat sekaligus.
+
+BERHASIL! Titi berhasil menyeberang dengan aman.
+            """),
+                ("pause", 2),
+            ], "handle_lorong_kedua"),
+            ("Menggunakan tali untuk menyeberang", [
+                ("say", """
+Titi menggunakan tali yang dibawanya untuk menyeberang.
+Sangat aman dan cepat!
+
+BERHASIL! Titi tiba di ujung lorong dengan selamat.
+            """),
+                ("health", 10),
+                ("pause", 2),
+            ], "handle_lorong_kedua"),
+        ],
+    },
+
+    "handle_lorong_kedua": {
+        "enter": [
+            ("clear",),
+            ("say", """
+LORONG KEDUA: Ruangan Gelap
+
+Titi memasuki ruangan yang sangat gelap.
+Tidak bisa melihat apapun.
+
+Tiba-tiba, terdengar suara berbisik aneh...
+
+"KIM KAMI TIDAK AKAN MEMBERIKAN HARTA INI KEPADA SIAPAPUN..."
+
+Pilihan Titi:
+        """),
+        ],
+        # Pilihan disaring berdasarkan inventory
+        "next": [
+            (("has", "Lampu Tangan"), "handle_lorong_kedua:lampu"),
+            "handle_lorong_kedua:gelap",
+        ],
+    },
+
+    "handle_lorong_kedua:lampu": {
+        # Dengan lampu tangan, pilihan apa pun berakhir dengan menyalakan lampu
+        "choices": [
+            ("Menggunakan Lampu Tangan jika punya", [
+                ("say", """
+Titi menyalakan lampu tangan!
+
+Cahaya menerangi ruangan. Titi bisa melihat jalan terang.
+Bisikan gaib pun menghilang.
+
+BERHASIL! Titi melewati ruangan gelap dengan cepat.
+            """),
+                ("pause", 2),
+            ], "handle_lorong_ketiga"),
+            ("Menggunakan Ramuan Keberuntungan", [
+                ("say", """
+Titi menyalakan lampu tangan!
+
+Cahaya menerangi ruangan. Titi bisa melihat jalan terang.
+Bisikan gaib pun menghilang.
+
+BERHASIL! Titi melewati ruangan gelap dengan cepat.
+            """),
+                ("pause", 2),
+            ], "handle_lorong_ketiga"),
+            ("Menunggu sampai mata terbiasa gelap", [
+                ("say", """
+Titi menyalakan lampu tangan!
+
+Cahaya menerangi ruangan. Titi bisa melihat jalan terang.
+Bisikan gaib pun menghilang.
+
+BERHASIL! Titi melewati ruangan gelap dengan cepat.
+            """),
+                ("pause", 2),
+            ], "handle_lorong_ketiga"),
+        ],
+    },
+
+    "handle_lorong_kedua:gelap": {
+        "choices": [
+            ("Menggunakan Ramuan Keberuntungan", [
+                ("say", """
+Titi minum ramuan keberuntungan dari dukun.
+
+Tiba-tiba, cahaya ajaib membimbing langkahnya!
+Ramuan dukun bekerja sempurna!
+
+BERHASIL! Titi melewati ruangan gelap dengan percaya diri.
+            """),
+                ("drop", "Ramuan Keberuntungan Dukun"),
+                ("pause", 2),
+            ], "handle_lorong_ketiga"),
+            ("Menunggu sampai mata terbiasa gelap", [
+                ("say", """
+Titi berdiri diam, menunggu matanya terbiasa dengan kegelapan.
+
+Setelah beberapa menit, mata Titi mulai membiasakan diri.
+Samar-samar Titi bisa melihat jalan di depan.
+
+Perlahan-lahan, Titi melangkah maju...
+
+(Lebih lambat, tapi berhasil!)
+            """),
+                ("use_energy", 20),
+                ("pause", 2),
+            ], "handle_lorong_ketiga"),
+        ],
+    },
+
+    "handle_lorong_ketiga": {
+        "enter": [
+            ("clear",),
+            *banner("🏆 LORONG KETIGA: KAMAR HARTA KARUN 🏆"),
+            ("say", """
+Titi keluar dari kegelapan dan masuk ke ruangan yang bercahaya emas!
+
+WOOOOOWWWW!!!
+
+Di depan mata Titi, ada tumpukan emas, permata, dan harta berharga lainnya!
+Cahaya emas menerangi seluruh ruangan.
+
+Tapi... ada PATUNG BESAR dengan wajah misterius di tengah harta karun.
+
+Patung itu seperti penjaga harta karun.
+
+Tiba-tiba, patung itu mulai bergerak!!!
+
+PATUNG PENJAGA: "SIAPA YANG BERANI MENGAMBIL HARTA MILIKKU?!"
+
+Titi merasa takut, tapi... suara itu terdengar familiar.
+        """),
+            ("use_energy", 10),
+            ("pause", 3),
+        ],
+        "next": "handle_final_challenge",
+    },
+
+    "handle_final_challenge": {
+        "choices": [
+            ("Lari dari gua", [
+                ("clear",),
+                ("say", """
+Titi berlari keluar dari gua secepat mungkin!
+
+BOOOM! Patung penjaga ambruk di belakangnya.
+Gua mulai runtuh!
+
+Titi berhasil keluar..., tapi TANGAN KOSONG!
+
+ENDING BURUK: Titi tidak mendapatkan harta karun.
+Harta karun tetap terkunci di bawah tanah.
+
+Titi kembali ke desa sebagai penjelajah yang gagal.
+            """),
+                ("end", "ENDING BURUK - Kabur"),
+            ], None),
+            ("Berhadapan dengan penjaga", [
+                ("clear",),
+                ("say", """
+TITI: "Aku tidak takut! Aku juga punya hak atas harta ini!"
+
+Titi melawan patung dengan perlengkapan.
+
+CRASH!!! BANG!!! POOOFFF!!!
+
+Patung runtuh menjadi debu...
+
+Tapi... biaya kerusakan akan sangat besar! Energi Titi habis!
+            """),
+                ("use_energy", 40),
+            ], [
+                (("energy_le", 0), "handle_final_challenge:tersungkur"),
+                "handle_harta_karun",
+            ]),
+            ("Berbicara baik-baik dengan penjaga", [
+                ("clear",),
+                ("say", """
+TITI: (Dengan tenang) "Halo... siapa sebenarnya kamu?"
+
+Patung itu berhenti bergerak. Cahaya emas berubah warna.
+
+SUARA GAIB: "Aku adalah roh penjaga harta ini selama 40 tahun.
+Menunggu seseorang yang cukup bijak untuk menemukannya.
+
+Tapi, harta ini memiliki tanggung jawab besar.
+Apakah kamu siap menanggungnya?"
+
+TITI: "Apa tanggung jawab itu?"
+
+SUARA GAIB: "Harta ini harus digunakan untuk kebaikan desa.
+Tidak boleh untuk kepentingan pribadi.
+Jika setuju, harta ini milikmu."
+            """),
+                ("pause", 2),
+            ], "handle_final_challenge:moral"),
+        ],
+    },
+
+    "handle_final_challenge:tersungkur": {
+        "enter": [
+            ("clear",),
+            ("say", "Titi tersungkur... semuanya menjadi gelap..."),
+            ("end", "ENDING BURUK - Kelelahan"),
+        ],
+    },
+
+    # Pilihan moral akhir
+    "handle_final_challenge:moral": {
+        "choices": [
+            ("Setuju gunakan untuk kebaikan desa", "handle_ending_baik"),
+            ("Ingin harta untuk diri sendiri", "handle_ending_tengah"),
+        ],
+    },
+
+    # ==================== ENDING ====================
+
+    "handle_harta_karun": {
+        "enter": [
+            ("say", """
+Meskipun lelah, Titi berhasil mengumpulkan sebagian harta karun.
+
+Titi membawa:
+- Sepuluh tas emas
+- Beberapa permata berharga
+- Perhiasan antik
+
+Total: Rp 10,000,000 (hanya sebagian kecil dari total)
+
+ENDING NETRAL: Titi menjadi kaya, tapi tidak kaya raya.
+Harta karun sebagian besar masih tersembunyi.
+        """),
+            ("money", 10000000),
+            ("end", "ENDING NETRAL - Setengah Harta"),
+        ],
+    },
+
+    "handle_ending_baik": {
+        "enter": [
+            ("clear",),
+            *banner("✨ ENDING TERBAIK - PAHLAWAN DESA ✨"),
+            ("say", """
+Roh penjaga tersenyum (walau tidak terlihat).
+
+SUARA GAIB: "Kamu adalah orang yang tepat. Semua harta ini milikmu!"
+
+Cahaya emas memenuhi seluruh gua.
+
+Titi dapat mengumpulkan sepenuhnya:
+✓ 500 tas berisi emas murni
+✓ 1000 permata langka  
+✓ Perhiasan bersejarah
+✓ Naskah kuno bernilai tinggi
+
+Total: Rp 500,000,000 !!!
+
+---
+
+MASA DEPAN DESA:
+
+Titi menggunakan harta untuk membangun:
+- Sekolah baru di desa
+- Rumah sakit untuk warga
+- Jalan yang lebih baik
+- Sistem irigasi untuk pertanian
+- Perpustakaan komunitas
+
+Desa Panjatan menjadi desa yang berkembang pesat!
+
+Pak Tirto, Nenek di Rumah Tua, dan semua penduduk desa sangat berterima kasih.
+Reno menjadi teman baik Titi dan mereka memulai sekolah petualangan.
+
+TITI MENJADI PAHLAWAN DESA!
+
+Cerita tentang Titi dan Harta Karun Panjatan tersebar ke seluruh daerah.
+Banyak orang yang datang untuk belajar tentang keberanian dan kebijaksanaan Titi.
+
+🎉 SELAMAT! TITI BERHASIL DENGAN SEMPURNA! 🎉
+        """),
+            ("set_money", 500000000),
+            ("end", "ENDING TERBAIK ⭐"),
+        ],
+    },
+
+    "handle_ending_tengah": {
+        "enter": [
+            ("clear",),
+            *banner("💰 ENDING BIASA - PENJELAJAH KAYA 💰"),
+            ("say", """
+Roh penjaga menghilang dalam kekecewaan.
+
+Tapi harta karun tetap terbuka untuk Titi!
+
+Titi dapat mengumpulkan:
+✓ 100 tas berisi emas murni
+✓ 200 permata berharga
+✓ Beberapa perhiasan
+
+Total: Rp 100,000,000
+
+---
+
+Titi menjadi kaya raya, tapi...
+
+Desa Panjatan tidak berkembang banyak.
+Titi pindah ke kota besar untuk hidup mewah.
+
+Sesekali Titi mengingat desa dan orang-orang baik di sana,
+tapi sudah jarang berkunjung.
+
+📊 HASIL AKHIR:
+- Titi kaya
+- Tapi kesepian
+- Hubungan dengan desa menjadi dingin
+- Ketenangan sejati tidak ditemukan
+
+END (Biasa saja...)
+        """),
+            ("set_money", 100000000),
+            ("end", "ENDING NETRAL 😐"),
+        ],
+    },
+}
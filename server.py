@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+Server asyncio untuk The Mystery Adventure Bot.
+
+Satu proses melayani banyak pemain sekaligus lewat protokol TCP berbasis
+baris: server mengirim teks cerita diakhiri prompt, pemain membalas dengan
+satu baris berisi pilihannya. Setiap sesi adalah generator permainan yang
+dijalankan oleh sebuah coroutine, jadi sesi yang sedang menunggu jawaban
+tidak memakai thread apa pun.
+
+    python server.py --port 8765 [--journal game.journal]
+    nc localhost 8765
+
+Dengan --journal, setiap pilihan pemain dicatat ke jurnal append-only
+(lihat journal.py) sehingga sesi bisa dibangun ulang setelah crash.
+
+Sesi yang terlalu lama tidak menjawab (atau tidak membaca output) dilepas
+oleh IdlePolicy: koneksinya ditutup sehingga bot dan buffernya dibebaskan.
+Semua batas waktu diperiksa oleh satu task, bukan satu timer per sesi.
+
+Dengan --pace, teks dikirim per potongan dengan jeda seperti efek mengetik;
+potongan berikutnya semua sesi dilepas oleh satu timer wheel (timerwheel.py).
+
+Dengan --hibernate FILE, hanya --resident sesi yang disimpan di memori;
+sesi lain disimpan ke FILE sampai pemainnya menjawab (lihat sessions.py).
+
+Dengan --assets PACK, graf dan teks cerita dibaca dari paket aset yang
+di-mmap (lihat assets.py) tanpa memuat scenes.py; teksnya dipakai bersama
+oleh semua proses yang membukanya.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Hashable, List, Optional
+
+from journal import Journal, JournaledBot
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from scenegraph import SceneGraph, default_graph
+from sessions import HibernationStore, SessionManager
+from terminal import AnsiTerminal
+from timerwheel import TimerWheel
+
+
+IDLE_MESSAGE = "\n\n⏰ Sesi ditutup karena terlalu lama tidak ada jawaban.\n"
+
+
+class IdlePolicy:
+    """Menentukan sesi menunggu mana yang dilepas.
+
+    Sesi dilepas jika sudah menunggu lebih dari `turn_timeout` detik, atau
+    jika jumlah sesi menunggu melebihi `max_idle` (yang paling lama menunggu
+    dilepas lebih dulu). None berarti tanpa batas.
+    """
+
+    def __init__(self, turn_timeout: Optional[float] = 300.0, max_idle: Optional[int] = None):
+        self.turn_timeout = turn_timeout
+        self.max_idle = max_idle
+
+    def evictable(self, waiting: "OrderedDict[object, float]", now: float) -> List[object]:
+        """Sesi yang dilepas; `waiting` berisi waktu mulai menunggu, urut dari yang terlama"""
+        excess = len(waiting) - self.max_idle if self.max_idle is not None else 0
+        evict = []
+        for session, since in waiting.items():
+            if excess > 0:
+                excess -= 1
+            elif self.turn_timeout is None or now - since < self.turn_timeout:
+                break
+            evict.append(session)
+        return evict
+
+
+class GameServer:
+    """Menampung banyak sesi permainan dalam satu event loop"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765,
+                 pace: float = 0.0, chunk: int = 64, journal: Optional[Journal] = None,
+                 idle: Optional[IdlePolicy] = None, tick: float = 1.0,
+                 store: Optional[HibernationStore] = None, max_resident: Optional[int] = None,
+                 graph: Optional[SceneGraph] = None):
+        self.host = host
+        self.port = port
+        self.journal = journal
+        self.graph = graph or default_graph()
+        # Dengan `store`, hanya `max_resident` sesi yang disimpan di memori
+        self.sessions = SessionManager(store, max_resident, self.new_bot)
+        self._next_key = 0
+        self.idle = idle or IdlePolicy()
+        # Selang pemeriksaan sesi menganggur (detik)
+        self.tick = tick
+        self.evicted = 0
+        # writer -> waktu mulai menunggu pemain, urut dari yang terlama
+        self._waiting: "OrderedDict[asyncio.StreamWriter, float]" = OrderedDict()
+        # Jeda per karakter untuk efek mengetik di sisi server (0 = diserahkan ke klien)
+        self.pace = pace
+        self.chunk = chunk
+        # Satu detak timer wheel = jeda satu potongan: setiap detak melepas
+        # potongan berikutnya semua sesi yang sedang mengetik
+        self.wheel = TimerWheel(chunk * pace if pace > 0 else 0.01)
+        self.active = 0
+        self.finished = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._reaper: Optional[asyncio.Task] = None
+
+    async def send(self, writer: asyncio.StreamWriter, text: str):
+        """Mengirim output satu giliran ke pemain"""
+        data = text.encode("utf-8")
+        if self.pace <= 0:
+            writer.write(data)
+        else:
+            done = asyncio.get_running_loop().create_future()
+            self._write_chunk(writer, data, 0, done)
+            await done
+        await writer.drain()
+
+    def _write_chunk(self, writer: asyncio.StreamWriter, data: bytes, offset: int,
+                     done: asyncio.Future):
+        """Menulis satu potongan lalu menjadwalkan potongan berikutnya di timer wheel"""
+        if done.done():
+            return
+        if offset >= len(data) or writer.is_closing():
+            done.set_result(None)
+            return
+        writer.write(data[offset:offset + self.chunk])
+        # Jeda setelah potongan terakhir tetap ada, seperti slow_print
+        self.wheel.call_later(self.chunk * self.pace, self._write_chunk,
+                              writer, data, offset + self.chunk, done)
+
+    def new_bot(self, key: int, renderer: TypewriterRenderer,
+                terminal: AnsiTerminal) -> MysteryAdventureBot:
+        if self.journal is None:
+            return MysteryAdventureBot(renderer, terminal, graph=self.graph)
+        return JournaledBot(self.journal, renderer, terminal, session_id=key, graph=self.graph)
+
+    def new_key(self) -> int:
+        """Kunci sesi baru; dengan jurnal sekaligus id sesi di jurnal"""
+        if self.journal is not None:
+            return self.journal.start_session()
+        self._next_key += 1
+        return self._next_key
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                            key: Optional[Hashable] = None):
+        """Menjalankan satu sesi permainan untuk satu koneksi.
+
+        Tanpa `key` sesi baru dibuat; dengan `key` sesi milik kunci itu
+        dilanjutkan jika masih ada (lihat shards.py).
+        """
+        self.active += 1
+        if key is None:
+            key = self.new_key()
+        waiting = self._waiting
+        finished = False
+        try:
+            if key in self.sessions:
+                output = self.sessions.resume(key)
+            else:
+                output = self.sessions.start(key)
+            while True:
+                # Waktu tunggu dihitung sejak output dikirim, jadi klien yang
+                # berhenti membaca juga dilepas
+                waiting[writer] = time.monotonic()
+                # Seluruh output satu giliran dikirim sekaligus dan tidak
+                # ditahan selama menunggu pemain
+                await self.send(writer, output)
+                output = None
+                if writer in waiting:
+                    # Giliran pemain baru dimulai setelah outputnya terkirim
+                    waiting.move_to_end(writer)
+                    waiting[writer] = time.monotonic()
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Baris lebih panjang dari batas StreamReader
+                    return
+                if not line or waiting.pop(writer, None) is None:
+                    return
+                output, finished = self.sessions.send(key, line.decode("utf-8", "replace").strip())
+                if finished:
+                    break
+            await self.send(writer, output)
+            self.finished += 1
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            waiting.pop(writer, None)
+            self.active -= 1
+            self.release(key, finished)
+            writer.close()
+
+    def release(self, key: Hashable, finished: bool):
+        """Dipanggil saat koneksi sebuah sesi selesai atau putus; sesinya dilepas"""
+        self.sessions.end(key)
+
+    def evict(self, writer: asyncio.StreamWriter):
+        """Melepas sesi yang menganggur; coroutine sesinya selesai karena EOF"""
+        del self._waiting[writer]
+        self.evicted += 1
+        if writer.transport.get_write_buffer_size():
+            # Klien berhenti membaca: output tertunda dibuang, bukan ditunggu
+            writer.transport.abort()
+        elif not writer.is_closing():
+            writer.write(IDLE_MESSAGE.encode("utf-8"))
+            writer.close()
+
+    async def reap_idle(self):
+        """Memanggil reap() setiap `tick` detik"""
+        while True:
+            await asyncio.sleep(self.tick)
+            self.reap(time.monotonic())
+
+    def reap(self, now: float):
+        """Melepas sesi menunggu yang dipilih IdlePolicy"""
+        for writer in self.idle.evictable(self._waiting, now):
+            self.evict(writer)
+
+    async def start(self, backlog: int = 4096) -> asyncio.AbstractServer:
+        self._server = await asyncio.start_server(
+            self.handle_client, self.host, self.port, backlog=backlog)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._reaper = asyncio.create_task(self.reap_idle())
+        return self._server
+
+    async def commit_journal(self):
+        """Group commit berkala supaya pilihan terakhir tidak tertahan saat server sepi"""
+        while True:
+            await asyncio.sleep(self.journal.max_delay)
+            self.journal.commit()
+
+    async def serve_forever(self):
+        server = await self.start()
+        committer = None
+        if self.journal is not None:
+            committer = asyncio.create_task(self.commit_journal())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if committer is not None:
+                committer.cancel()
+                self.journal.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server The Mystery Adventure Bot")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pace", type=float, default=0.0,
+                        help="jeda per karakter di sisi server (detik)")
+    parser.add_argument("--journal", metavar="FILE", help="catat pilihan pemain ke jurnal")
+    parser.add_argument("--turn-timeout", type=float, default=300.0,
+                        help="detik menunggu jawaban sebelum sesi ditutup (0 = tanpa batas)")
+    parser.add_argument("--max-idle", type=int, help="jumlah maksimum sesi yang menunggu jawaban")
+    parser.add_argument("--hibernate", metavar="FILE", help="file hibernasi sesi")
+    parser.add_argument("--resident", type=int, default=10000,
+                        help="jumlah maksimum sesi di memori jika --hibernate dipakai")
+    parser.add_argument("--assets", metavar="PACK",
+                        help="baca teks cerita dari paket aset (python assets.py PACK)")
+    args = parser.parse_args()
+
+    journal = Journal(args.journal) if args.journal else None
+    idle = IdlePolicy(args.turn_timeout or None, args.max_idle)
+    store = HibernationStore(args.hibernate) if args.hibernate else None
+    graph = None
+    if args.assets:
+        from assets import AssetPack
+        graph = AssetPack(args.assets).load_graph()
+    try:
+        asyncio.run(GameServer(args.host, args.port, args.pace, journal=journal, idle=idle,
+                               store=store, max_resident=args.resident,
+                               graph=graph).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if journal is not None:
+            journal.close()
+        if store is not None:
+            store.close()
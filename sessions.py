@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+Manajer sesi dengan hibernasi ke disk untuk The Mystery Adventure Bot.
+
+Saat melayani banyak pemain, kebanyakan sesi sedang menunggu jawaban.
+SessionManager hanya menyimpan `max_resident` sesi di memori; sesi yang
+paling lama tidak dipakai (LRU) disimpan sebagai snapshot savegame ke
+HibernationStore lalu dilepas. Saat pemainnya mengirim pilihan berikutnya,
+sesi dipulihkan dari snapshot dan dilanjutkan dari prompt yang sama
+(session(resume=True)), tanpa terlihat oleh pemain.
+
+HibernationStore adalah satu file berisi slot berukuran tetap, jadi setiap
+snapshot ditulis dan dibaca dengan satu pwrite/pread dan slot dari sesi yang
+selesai dipakai ulang.
+"""
+
+import os
+import struct
+from collections import OrderedDict, deque
+from time import perf_counter
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from sinks import BufferSink
+from terminal import AnsiTerminal
+
+# Membuat bot untuk sesi `key` yang menulis ke renderer/terminal yang diberikan
+BotFactory = Callable[[int, TypewriterRenderer, AnsiTerminal], MysteryAdventureBot]
+
+_LENGTH = struct.Struct("<H")
+
+
+def default_bot(key: int, renderer: TypewriterRenderer, terminal: AnsiTerminal) -> MysteryAdventureBot:
+    return MysteryAdventureBot(renderer, terminal)
+
+
+class HibernationStore:
+    """Snapshot sesi di satu file dengan slot berukuran tetap"""
+
+    def __init__(self, path: str, slot_size: int = 128):
+        self.path = path
+        self.slot_size = slot_size
+        # File selalu dibuat baru: snapshot hanya berlaku selama proses hidup
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        self._slots: Dict[int, int] = {}
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._slots
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._slots)
+
+    def put(self, key: int, data: bytes):
+        if len(data) > self.slot_size - _LENGTH.size:
+            raise ValueError(f"snapshot {len(data)} B melebihi slot {self.slot_size} B")
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._free.pop() if self._free else len(self._slots) + len(self._free)
+            self._slots[key] = slot
+        os.pwrite(self._fd, _LENGTH.pack(len(data)) + data, slot * self.slot_size)
+
+    def get(self, key: int) -> bytes:
+        record = os.pread(self._fd, self.slot_size, self._slots[key] * self.slot_size)
+        (size,) = _LENGTH.unpack_from(record)
+        return record[_LENGTH.size:_LENGTH.size + size]
+
+    def discard(self, key: int):
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self._free.append(slot)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            os.unlink(self.path)
+            self._fd = None
+
+
+class _Live:
+    """Sesi yang sedang ada di memori"""
+    __slots__ = ("bot", "session", "buffer")
+
+    def __init__(self, bot: MysteryAdventureBot, session, buffer: BufferSink):
+        self.bot = bot
+        self.session = session
+        self.buffer = buffer
+
+    def output(self) -> str:
+        return self.buffer.take()
+
+
+class SessionManager:
+    """Sesi permainan per kunci dengan paling banyak `max_resident` sesi di memori.
+
+    Tanpa `store`, sesi tidak pernah dihibernasi.
+    """
+
+    def __init__(self, store: Optional[HibernationStore] = None,
+                 max_resident: Optional[int] = None, bot_factory: BotFactory = default_bot):
+        self.store = store
+        self.max_resident = max_resident if store is not None else None
+        self.bot_factory = bot_factory
+        self._resident: "OrderedDict[int, _Live]" = OrderedDict()
+        self.hits = 0
+        self.restores = 0
+        self.hibernated = 0
+        # Waktu pemulihan dari disk terakhir (detik)
+        self.restore_times: Deque[float] = deque(maxlen=65536)
+
+    def __len__(self) -> int:
+        return len(self._resident) + (len(self.store) if self.store is not None else 0)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._resident or (self.store is not None and key in self.store)
+
+    def keys(self) -> List[int]:
+        """Kunci semua sesi, di memori maupun yang dihibernasi"""
+        keys = list(self._resident)
+        if self.store is not None:
+            keys.extend(self.store)
+        return keys
+
+    @property
+    def resident(self) -> int:
+        return len(self._resident)
+
+    def _new(self, key: int) -> _Live:
+        buffer = BufferSink()
+        terminal = AnsiTerminal(buffer, enabled=False)
+        bot = self.bot_factory(key, TypewriterRenderer(stream=terminal, instant=True), terminal)
+        return _Live(bot, None, buffer)
+
+    def start(self, key: int) -> str:
+        """Memulai sesi baru; mengembalikan output awal sampai prompt pertama"""
+        live = self._new(key)
+        live.session = live.bot.session()
+        prompt = next(live.session)
+        self._resident[key] = live
+        self._shrink()
+        return live.output() + prompt
+
+    def send(self, key: int, answer: str) -> Tuple[str, bool]:
+        """Mengirim jawaban pemain; mengembalikan (output, permainan selesai)"""
+        live = self._resident.pop(key, None)
+        if live is None:
+            live = self._restore(key)
+        else:
+            self.hits += 1
+        try:
+            prompt = live.session.send(answer)
+        except StopIteration:
+            live.bot.show_end_screen()
+            if self.store is not None:
+                self.store.discard(key)
+            return live.output(), True
+        self._resident[key] = live
+        self._shrink()
+        return live.output() + prompt, False
+
+    def resume(self, key: int) -> str:
+        """Melanjutkan sesi yang sudah ada (misalnya pemain tersambung lagi);
+        mengembalikan menu pilihan saat ini dan promptnya"""
+        live, prompt = self._resume(key, self.export(key))
+        self._resident[key] = live
+        self._shrink()
+        return live.output() + prompt
+
+    def export(self, key: int) -> bytes:
+        """Snapshot sesi, lalu sesinya dilepas dari manajer ini (misalnya untuk dipindah)"""
+        live = self._resident.pop(key, None)
+        if live is not None:
+            live.session.close()
+            return live.bot.save()
+        if self.store is None or key not in self.store:
+            raise KeyError(key)
+        data = self.store.get(key)
+        self.store.discard(key)
+        return data
+
+    def adopt(self, key: int, data: bytes):
+        """Menerima snapshot dari export(); dengan store langsung dihibernasi"""
+        if self.store is not None:
+            self.store.put(key, data)
+            return
+        live, _ = self._resume(key, data)
+        live.output()
+        self._resident[key] = live
+
+    def end(self, key: int):
+        """Melepas sesi (misalnya karena koneksinya putus)"""
+        live = self._resident.pop(key, None)
+        if live is not None:
+            live.session.close()
+        if self.store is not None:
+            self.store.discard(key)
+
+    def _shrink(self):
+        if self.max_resident is None:
+            return
+        while len(self._resident) > self.max_resident:
+            key, live = self._resident.popitem(last=False)
+            self.store.put(key, live.bot.save())
+            live.session.close()
+            self.hibernated += 1
+
+    def _restore(self, key: int) -> _Live:
+        if self.store is None or key not in self.store:
+            raise KeyError(key)
+        start = perf_counter()
+        live, _ = self._resume(key, self.store.get(key))
+        self.store.discard(key)
+        # Menu yang digambar ulang saat resume sudah pernah dilihat pemain
+        live.output()
+        self.restore_times.append(perf_counter() - start)
+        self.restores += 1
+        return live
+
+    def _resume(self, key: int, data: bytes) -> Tuple[_Live, str]:
+        """Sesi dari snapshot, berhenti di prompt pilihan yang sama"""
+        live = self._new(key)
+        live.bot.restore(data)
+        live.session = live.bot.session(resume=True)
+        return live, next(live.session)
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+Mode multi-proses untuk server The Mystery Adventure Bot.
+
+Satu proses CPython hanya memakai satu core. ShardFront menerima koneksi
+TCP, membaca baris pertama (id pemain) dan meneruskan socket koneksi itu
+ke salah satu worker lewat SCM_RIGHTS. Setelah itu front tidak ikut
+campur lagi: worker (ShardWorker, sebuah GameServer) melayani koneksi itu
+langsung, jadi setiap giliran hanya memakai CPU worker.
+
+Worker dipilih dengan consistent hashing (HashRing) atas id pemain,
+sehingga pemain yang sama selalu ke worker yang sama. Sesi yang koneksinya
+putus tetap disimpan worker dan dilanjutkan saat pemainnya tersambung lagi,
+paling lama `retention` detik; setelah itu sesinya diakhiri dan dibebaskan.
+Saat worker ditambah hanya sekitar 1/N id pindah pemilik; sesi milik
+id itu dikirim (sebagai snapshot savegame) ke pemilik barunya.
+
+Dengan --assets PACK, setiap worker memakai graf dari paket aset
+(assets.py): worker dibuat dengan spawn, jadi setiap worker membuka
+paketnya sendiri dan tidak pernah memuat scenes.py, sementara teks
+ceritanya dipakai bersama lewat page cache.
+
+    python shards.py --port 8765 --workers 4 [--assets story.pack]
+    nc localhost 8765        (baris pertama: id pemain)
+"""
+
+import argparse
+import asyncio
+import bisect
+import hashlib
+import multiprocessing
+import os
+import socket
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional
+
+from server import GameServer, IdlePolicy
+from sessions import HibernationStore
+
+# Jenis pesan di socket kontrol front <-> worker (SOCK_SEQPACKET, satu pesan per recv)
+CONNECTION = b"C"   # front -> worker: id pemain, "\n", byte yang sudah terbaca; fd koneksi
+RING = b"R"         # front -> worker: daftar worker yang baru, dipisah ","
+SNAPSHOT = b"S"     # dua arah: id pemain, "\0", snapshot savegame
+
+MAX_PLAYER_ID = 128
+_MESSAGE_SIZE = 65536
+
+INVALID_ID_MESSAGE = "Id pemain tidak valid.\n"
+
+
+def _player_id(line: bytes) -> Optional[str]:
+    """Id pemain dari baris pertama koneksi; None jika kosong, terlalu
+    panjang, bukan UTF-8 atau berisi byte nol (pemisah pesan SNAPSHOT)"""
+    try:
+        player = line.decode("utf-8").strip()
+    except UnicodeDecodeError:
+        return None
+    if not player or "\0" in player or len(player.encode("utf-8")) > MAX_PLAYER_ID:
+        return None
+    return player
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hashing id -> node dengan `replicas` titik virtual per node"""
+
+    def __init__(self, nodes: Iterable[Hashable] = (), replicas: int = 160):
+        self.replicas = replicas
+        self.nodes: List[Hashable] = []
+        self._points: List[int] = []
+        self._owners: List[Hashable] = []
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: Hashable):
+        self.nodes.append(node)
+        for replica in range(self.replicas):
+            point = _hash(f"{node}#{replica}")
+            i = bisect.bisect(self._points, point)
+            self._points.insert(i, point)
+            self._owners.insert(i, node)
+
+    def remove(self, node: Hashable):
+        self.nodes.remove(node)
+        keep = [i for i, owner in enumerate(self._owners) if owner != node]
+        self._points = [self._points[i] for i in keep]
+        self._owners = [self._owners[i] for i in keep]
+
+    def node(self, key: str) -> Hashable:
+        """Node pemilik `key`"""
+        i = bisect.bisect(self._points, _hash(key))
+        return self._owners[i if i < len(self._points) else 0]
+
+
+class ShardWorker(GameServer):
+    """GameServer di proses worker yang menerima koneksi dari ShardFront"""
+
+    def __init__(self, index: int, control: socket.socket, nodes: List[int],
+                 replicas: int = 160, retention: Optional[float] = 3600.0, **kwargs):
+        super().__init__(**kwargs)
+        self.index = index
+        self.control = control
+        self.ring = HashRing(nodes, replicas)
+        # Detik sesi tanpa koneksi disimpan sebelum diakhiri (None = selamanya)
+        self.retention = retention
+        self.migrated = 0
+        self.expired = 0
+        # Kunci sesi yang sedang tersambung
+        self._connected = set()
+        # Kunci sesi tanpa koneksi -> waktu koneksinya putus, urut dari yang terlama
+        self._detached: "OrderedDict[str, float]" = OrderedDict()
+        self._stopped: Optional[asyncio.Future] = None
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self._stopped = loop.create_future()
+        self.control.setblocking(False)
+        loop.add_reader(self.control.fileno(), self.on_control)
+        self._reaper = asyncio.create_task(self.reap_idle())
+        try:
+            await self._stopped
+        finally:
+            loop.remove_reader(self.control.fileno())
+            self._reaper.cancel()
+
+    def on_control(self):
+        try:
+            message, fds, _, _ = socket.recv_fds(self.control, _MESSAGE_SIZE, 1)
+        except BlockingIOError:
+            return
+        if not message:
+            # Front berhenti
+            for fd in fds:
+                os.close(fd)
+            if not self._stopped.done():
+                self._stopped.set_result(None)
+            return
+        kind, payload = message[:1], message[1:]
+        if kind == CONNECTION and fds:
+            player, _, pending = payload.partition(b"\n")
+            connection = socket.socket(fileno=fds[0])
+            asyncio.create_task(self.serve(connection, player.decode("utf-8"), pending))
+        elif kind == RING:
+            self.ring = HashRing((int(node) for node in payload.split(b",")), self.ring.replicas)
+            for key in self.sessions.keys():
+                if key not in self._connected:
+                    self.release(key, False)
+        elif kind == SNAPSHOT:
+            player, _, data = payload.partition(b"\0")
+            player = player.decode("utf-8")
+            # Pemain yang sudah tersambung lebih dulu ke worker ini memulai sesi baru
+            if player not in self._connected:
+                self.sessions.adopt(player, data)
+                self._detached[player] = time.monotonic()
+
+    async def serve(self, connection: socket.socket, player: str, pending: bytes):
+        reader, writer = await asyncio.open_connection(sock=connection)
+        if pending:
+            reader.feed_data(pending)
+        if player in self._connected:
+            # Pemain yang sama tersambung dua kali: sesinya milik koneksi pertama
+            writer.write("Sesi pemain ini sedang dipakai koneksi lain.\n".encode("utf-8"))
+            writer.close()
+            return
+        self._connected.add(player)
+        self._detached.pop(player, None)
+        try:
+            await self.handle_client(reader, writer, key=player)
+        finally:
+            self._connected.discard(player)
+
+    def release(self, key: str, finished: bool):
+        """Sesi yang belum selesai disimpan; jika id-nya sudah pindah worker, dikirim ke front"""
+        if finished or key not in self.sessions:
+            self._detached.pop(key, None)
+            return
+        if self.ring.node(key) != self.index:
+            self._detached.pop(key, None)
+            data = self.sessions.export(key)
+            self.control.sendmsg([SNAPSHOT + key.encode("utf-8") + b"\0" + data])
+            self.migrated += 1
+        else:
+            # Waktu putus pertama yang dihitung, walau ring berubah sesudahnya
+            self._detached.setdefault(key, time.monotonic())
+
+    def reap(self, now: float):
+        """Selain sesi menunggu, sesi yang terlalu lama tanpa koneksi diakhiri"""
+        super().reap(now)
+        if self.retention is None:
+            return
+        detached = self._detached
+        while detached:
+            key, since = next(iter(detached.items()))
+            if now - since < self.retention:
+                break
+            del detached[key]
+            self.sessions.end(key)
+            self.expired += 1
+
+
+def _worker_main(index: int, control: socket.socket, nodes: List[int], replicas: int,
+                 hibernate: Optional[str], max_resident: Optional[int],
+                 turn_timeout: Optional[float], retention: Optional[float],
+                 assets: Optional[str]):
+    graph = None
+    if assets is not None:
+        from assets import AssetPack
+        graph = AssetPack(assets).load_graph()
+    store = HibernationStore(hibernate) if hibernate else None
+    worker = ShardWorker(index, control, nodes, replicas, retention, store=store,
+                         max_resident=max_resident, idle=IdlePolicy(turn_timeout),
+                         graph=graph)
+    try:
+        asyncio.run(worker.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if store is not None:
+            store.close()
+
+
+class _WorkerHandle:
+    __slots__ = ("index", "process", "control")
+
+    def __init__(self, index: int, process, control: socket.socket):
+        self.index = index
+        self.process = process
+        self.control = control
+
+
+class ShardFront:
+    """Proses depan: membagi koneksi ke worker menurut id pemain"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, workers: int = 2,
+                 replicas: int = 160, max_resident: Optional[int] = None,
+                 hibernate_dir: Optional[str] = None, turn_timeout: Optional[float] = 300.0,
+                 retention: Optional[float] = 3600.0, assets: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.replicas = replicas
+        self.max_resident = max_resident
+        self.hibernate_dir = hibernate_dir
+        self.turn_timeout = turn_timeout
+        self.retention = retention
+        # Paket aset yang dibuka setiap worker (None = graf dari scenes.py)
+        self.assets = assets
+        self.ring = HashRing(replicas=replicas)
+        self.workers: Dict[int, _WorkerHandle] = {}
+        self.routed = 0
+        self._initial = workers
+        self._listener: Optional[socket.socket] = None
+        self._acceptor: Optional[asyncio.Task] = None
+        # spawn: worker tidak mewarisi event loop front
+        self._context = multiprocessing.get_context("spawn")
+
+    def _spawn(self, index: int, nodes: List[int]) -> _WorkerHandle:
+        front_end, worker_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        hibernate = None
+        if self.hibernate_dir is not None:
+            hibernate = os.path.join(self.hibernate_dir, f"worker{index}.slots")
+        process = self._context.Process(
+            target=_worker_main, daemon=True,
+            args=(index, worker_end, nodes, self.replicas, hibernate,
+                  self.max_resident, self.turn_timeout, self.retention, self.assets))
+        process.start()
+        worker_end.close()
+        front_end.setblocking(False)
+        asyncio.get_running_loop().add_reader(front_end.fileno(), self._on_worker, front_end)
+        return _WorkerHandle(index, process, front_end)
+
+    def _send(self, worker: _WorkerHandle, message: bytes, fds: List[int] = ()):
+        # Pesan kontrol kecil; buffer socket hanya penuh jika worker macet
+        worker.control.setblocking(True)
+        try:
+            socket.send_fds(worker.control, [message], list(fds))
+        finally:
+            worker.control.setblocking(False)
+
+    def _on_worker(self, control: socket.socket):
+        try:
+            message = control.recv(_MESSAGE_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            message = b""
+        if not message:
+            # Worker berhenti
+            asyncio.get_running_loop().remove_reader(control.fileno())
+        elif message[:1] == SNAPSHOT:
+            player = message[1:].partition(b"\0")[0].decode("utf-8")
+            self._send(self.workers[self.ring.node(player)], message)
+
+    async def start(self):
+        nodes = list(range(self._initial))
+        for index in nodes:
+            self.workers[index] = self._spawn(index, nodes)
+            self.ring.add(index)
+        self._listener = socket.create_server((self.host, self.port), backlog=4096)
+        self._listener.setblocking(False)
+        self.port = self._listener.getsockname()[1]
+        self._acceptor = asyncio.create_task(self.accept())
+
+    def add_worker(self) -> int:
+        """Menambah satu worker; sesi milik id yang pindah dikirim ke worker baru"""
+        index = max(self.workers, default=-1) + 1
+        nodes = sorted(self.workers) + [index]
+        self.workers[index] = self._spawn(index, nodes)
+        self.ring.add(index)
+        ring = RING + ",".join(map(str, nodes)).encode()
+        for worker in self.workers.values():
+            if worker.index != index:
+                self._send(worker, ring)
+        return index
+
+    async def accept(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            connection, _ = await loop.sock_accept(self._listener)
+            asyncio.create_task(self.route(connection))
+
+    async def route(self, connection: socket.socket):
+        """Membaca id pemain lalu menyerahkan koneksi ke worker pemiliknya"""
+        loop = asyncio.get_running_loop()
+        try:
+            data = b""
+            while b"\n" not in data and len(data) <= MAX_PLAYER_ID:
+                chunk = await asyncio.wait_for(loop.sock_recv(connection, 256), self.turn_timeout)
+                if not chunk:
+                    return
+                data += chunk
+            line, _, pending = data.partition(b"\n")
+            player = _player_id(line)
+            if player is None:
+                await loop.sock_sendall(connection, INVALID_ID_MESSAGE.encode("utf-8"))
+                return
+            worker = self.workers[self.ring.node(player)]
+            self._send(worker, CONNECTION + player.encode("utf-8") + b"\n" + pending,
+                       [connection.fileno()])
+            self.routed += 1
+        except (OSError, asyncio.TimeoutError):
+            pass
+        finally:
+            # Worker sudah memegang salinan fd-nya sendiri
+            connection.close()
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._acceptor
+        finally:
+            self.close()
+
+    def close(self):
+        if self._acceptor is not None:
+            self._acceptor.cancel()
+        if self._listener is not None:
+            self._listener.close()
+        for worker in self.workers.values():
+            asyncio.get_running_loop().remove_reader(worker.control.fileno())
+            worker.control.close()
+        for worker in self.workers.values():
+            worker.process.join(5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Server multi-proses The Mystery Adventure Bot")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--turn-timeout", type=float, default=300.0,
+                        help="detik menunggu jawaban sebelum koneksi ditutup (0 = tanpa batas)")
+    parser.add_argument("--resident", type=int, default=10000,
+                        help="jumlah maksimum sesi di memori per worker; sisanya dihibernasi")
+    parser.add_argument("--retention", type=float, default=3600.0,
+                        help="detik sesi tanpa koneksi disimpan sebelum diakhiri (0 = selamanya)")
+    parser.add_argument("--assets", metavar="PACK",
+                        help="baca graf dan teks cerita dari paket aset (python assets.py PACK)")
+    args = parser.parse_args()
+    if args.assets:
+        # Paket diperiksa sekali di sini supaya kesalahan tidak muncul di setiap worker
+        from assets import AssetPack
+        AssetPack(args.assets).close()
+
+    with tempfile.TemporaryDirectory(prefix="mab-shards-") as directory:
+        front = ShardFront(args.host, args.port, args.workers, max_resident=args.resident,
+                           hibernate_dir=directory, turn_timeout=args.turn_timeout or None,
+                           retention=args.retention or None, assets=args.assets)
+        try:
+            asyncio.run(front.serve_forever())
+        except KeyboardInterrupt:
+            pass
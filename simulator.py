@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+Simulator Monte Carlo untuk The Mystery Adventure Bot.
+
+Memainkan banyak playthrough acak (atau mengikuti policy tertentu) dengan
+mesin permainan tanpa output, dibagi ke beberapa proses. Setiap proses
+mengembalikan hasilnya sebagai array NumPy (ending, uang akhir, jumlah
+giliran, item yang diambil) dan hasil semua proses digabung lalu diringkas
+dengan operasi array, bukan dict per playthrough.
+
+Harga di toko dan biaya energi bisa diubah tanpa menyentuh scenes.py untuk
+menyeimbangkan ekonomi permainan:
+
+    python simulator.py --runs 1000000
+    python simulator.py --price "Lampu Tangan=60" --energy-scale 1.5
+    python simulator.py --runs 200000 --scaling
+"""
+
+import argparse
+import os
+import random
+import time
+from array import array
+from multiprocessing import Pool
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # Hanya simulator yang memakai NumPy; bagian lain permainan tidak membutuhkannya
+    raise ImportError("simulator.py membutuhkan NumPy: pip install numpy") from None
+
+from headless import SilentBot
+from scenegraph import Scene, SceneGraph
+from scenes import SCENES, START_SCENE
+from state import ITEMS, GameState
+
+# Batas giliran satu playthrough; pemain acak bisa berputar-putar selamanya
+MAX_TURNS = 300
+# Kode ending untuk playthrough yang belum selesai saat MAX_TURNS tercapai
+UNFINISHED = "(tidak selesai)"
+
+# Policy memilih nomor pilihan (mulai dari 1) untuk scene saat ini
+Policy = Callable[[random.Random, Scene, "SimBot"], int]
+
+
+def random_policy(rng: random.Random, scene: Scene, bot: "SimBot") -> int:
+    """Memilih salah satu pilihan secara acak dengan peluang yang sama"""
+    return rng.randrange(len(scene.choices)) + 1
+
+
+def curious_policy(rng: random.Random, scene: Scene, bot: "SimBot") -> int:
+    """Memilih pilihan yang menuju scene paling jarang dikunjungi.
+
+    Meniru pemain yang ingin melihat tempat baru; jika seri, dipilih acak.
+    """
+    visits = bot.visits
+    best, fewest = [], None
+    for number, choice in enumerate(scene.choices, 1):
+        target = choice.next[-1][1]
+        count = visits[target] if target is not None else 0
+        if fewest is None or count < fewest:
+            best, fewest = [number], count
+        elif count == fewest:
+            best.append(number)
+    return rng.choice(best)
+
+
+POLICIES: Dict[str, Policy] = {
+    "random": random_policy,
+    "curious": curious_policy,
+}
+
+
+class Tuning(NamedTuple):
+    """Perubahan ekonomi yang diterapkan ke tabel scene sebelum dikompilasi"""
+    prices: Tuple[Tuple[str, int], ...] = ()   # (nama item, harga baru)
+    energy_scale: float = 1.0                  # pengali biaya use_energy
+
+
+def tuned_table(tuning: Tuning) -> dict:
+    """Salinan tabel scene dengan harga dan biaya energi dari `tuning`"""
+    prices = dict(tuning.prices)
+
+    def ops(items):
+        return [convert(op) for op in items]
+
+    def convert(op):
+        if op[0] == "use_energy":
+            return ("use_energy", round(op[1] * tuning.energy_scale))
+        if op[0] == "if":
+            guard, then_ops, else_ops = op[1], ops(op[2]), ops(op[3])
+            bought = [item[1] for item in then_ops if item[0] == "item" and item[1] in prices]
+            if guard[0] == "money_ge" and bought:
+                price = prices[bought[0]]
+                guard = ("money_ge", price)
+                then_ops = [("money", -price) if item[0] == "money" else item
+                            for item in then_ops]
+            return ("if", guard, then_ops, else_ops)
+        return op
+
+    table = {}
+    for scene_id, spec in SCENES.items():
+        spec = dict(spec)
+        spec["enter"] = ops(spec.get("enter", ()))
+        if "revisit" in spec:
+            spec["revisit"] = ops(spec["revisit"])
+        spec["choices"] = [(choice[0], ops(choice[1]), choice[2]) if len(choice) == 3 else choice
+                           for choice in spec.get("choices", ())]
+        table[scene_id] = spec
+    return table
+
+
+class SimBot(SilentBot):
+    """Bot tanpa output yang menghitung item yang diambil dan kunjungan scene"""
+
+    def __init__(self, graph: SceneGraph):
+        super().__init__(graph)
+        self.reset()
+
+    def reset(self):
+        self.state = GameState()
+        self.pickups = array("I", bytes(4 * len(ITEMS)))
+        self.visits = array("I", bytes(4 * len(self.graph)))
+
+    def play_scene(self, index: int):
+        self.visits[index] += 1
+        return (yield from super().play_scene(index))
+
+    def _op_item(self, item_id: int):
+        super()._op_item(item_id)
+        self.pickups[item_id] += 1
+
+
+class Batch(NamedTuple):
+    """Hasil sekumpulan playthrough, satu baris per playthrough"""
+    endings: np.ndarray    # int16, indeks ke daftar ending
+    money: np.ndarray      # int64
+    turns: np.ndarray      # int32
+    pickups: np.ndarray    # uint32, [playthrough, item]
+
+
+def _simulate(job: Tuple[int, int, str, Tuning]) -> Batch:
+    """Memainkan `runs` playthrough dengan seed `seed` (dijalankan di proses pekerja)"""
+    runs, seed, policy_name, tuning = job
+    graph = SceneGraph.compile(tuned_table(tuning), START_SCENE)
+    endings = {name: index for index, name in enumerate(graph.endings() + (UNFINISHED,))}
+    policy = POLICIES[policy_name]
+    rng = random.Random(seed)
+    bot = SimBot(graph)
+    scenes = graph.scenes
+
+    ending_codes = np.empty(runs, dtype=np.int16)
+    money = np.empty(runs, dtype=np.int64)
+    turns = np.empty(runs, dtype=np.int32)
+    pickups = np.zeros((runs, len(ITEMS)), dtype=np.uint32)
+    for run in range(runs):
+        bot.reset()
+        session = bot.session()
+        turn = 0
+        try:
+            next(session)
+            while turn < MAX_TURNS:
+                turn += 1
+                session.send(str(policy(rng, scenes[bot.state.scene], bot)))
+        except StopIteration:
+            pass
+        session.close()
+        ending_codes[run] = endings[bot.ending_type if bot.game_over else UNFINISHED]
+        money[run] = bot.money
+        turns[run] = turn
+        pickups[run] = np.frombuffer(bot.pickups, dtype=np.uint32)
+    return Batch(ending_codes, money, turns, pickups)
+
+
+def simulate(runs: int, workers: int = 0, policy: str = "random", seed: int = 0,
+             tuning: Tuning = Tuning(), chunk: int = 5000) -> Batch:
+    """Memainkan `runs` playthrough di `workers` proses (0 = semua core)"""
+    workers = workers or os.cpu_count() or 1
+    jobs = [(min(chunk, runs - start), seed * 1_000_003 + index, policy, tuning)
+            for index, start in enumerate(range(0, runs, chunk))]
+    if workers == 1:
+        batches = [_simulate(job) for job in jobs]
+    else:
+        with Pool(workers) as pool:
+            batches = pool.map(_simulate, jobs, chunksize=1)
+    return Batch(*(np.concatenate(column) for column in zip(*batches)))
+
+
+def _percentiles(values: np.ndarray) -> str:
+    p5, p50, p95 = np.percentile(values, [5, 50, 95])
+    return (f"rata-rata {values.mean():,.1f}  p5 {p5:,.0f}  p50 {p50:,.0f}  "
+            f"p95 {p95:,.0f}  maks {values.max():,}")
+
+
+def report(batch: Batch, endings: Tuple[str, ...]):
+    """Mencetak distribusi ending, uang, giliran dan item"""
+    runs = len(batch.endings)
+    counts = np.bincount(batch.endings, minlength=len(endings))
+    print("\n🏁 ENDING:")
+    for name, count in zip(endings, counts):
+        print(f"   {name:<32} {count:>10,}  {count / runs:7.2%}")
+
+    print("\n💰 UANG AKHIR:")
+    print(f"   semua      : {_percentiles(batch.money)}")
+    for code in np.flatnonzero(counts):
+        print(f"   {endings[code][:32]:<32}")
+        print(f"      {_percentiles(batch.money[batch.endings == code])}")
+
+    print("\n⏱️ GILIRAN PER PLAYTHROUGH:")
+    print(f"   {_percentiles(batch.turns)}")
+
+    print("\n📦 ITEM DIAMBIL:")
+    total = batch.pickups.sum(axis=1)
+    print(f"   per playthrough: {_percentiles(total)}")
+    taken = (batch.pickups > 0).mean(axis=0)
+    mean = batch.pickups.mean(axis=0)
+    for item_id in np.argsort(-taken):
+        if taken[item_id]:
+            print(f"   {ITEMS.name(item_id)[:36]:<36} diambil di {taken[item_id]:7.2%} "
+                  f"playthrough, rata-rata {mean[item_id]:.2f}x")
+
+
+def _worker_counts(limit: Optional[int]) -> List[int]:
+    counts, n = [], 1
+    limit = limit or os.cpu_count() or 1
+    while n < limit:
+        counts.append(n)
+        n *= 2
+    return counts + [limit]
+
+
+def _parse_price(text: str) -> Tuple[str, int]:
+    name, _, price = text.rpartition("=")
+    if not name or not price.isdigit():
+        raise argparse.ArgumentTypeError(f"format harga: 'Nama Item=123', bukan {text!r}")
+    return name, int(price)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulator Monte Carlo")
+    parser.add_argument("--runs", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=0, help="jumlah proses (0 = semua core)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--price", type=_parse_price, action="append", default=[],
+                        metavar="ITEM=HARGA", help="harga baru sebuah barang di toko")
+    parser.add_argument("--energy-scale", type=float, default=1.0,
+                        help="pengali biaya use_energy")
+    parser.add_argument("--scaling", action="store_true",
+                        help="ukur throughput dan efisiensi untuk 1, 2, 4, ... proses")
+    args = parser.parse_args()
+
+    tuning = Tuning(tuple(args.price), args.energy_scale)
+    endings = SceneGraph.compile(tuned_table(tuning), START_SCENE).endings() + (UNFINISHED,)
+
+    if args.scaling:
+        print(f"{'proses':>6} {'playthrough/s':>14} {'efisiensi':>10}")
+        base = None
+        for workers in _worker_counts(args.workers):
+            started = time.perf_counter()
+            simulate(args.runs, workers, args.policy, args.seed, tuning)
+            rate = args.runs / (time.perf_counter() - started)
+            base = base or rate
+            print(f"{workers:>6} {rate:>14,.0f} {rate / (base * workers):>10.0%}")
+    else:
+        started = time.perf_counter()
+        batch = simulate(args.runs, args.workers, args.policy, args.seed, tuning)
+        elapsed = time.perf_counter() - started
+        print(f"{args.runs:,} playthrough dalam {elapsed:.1f} detik "
+              f"({args.runs / elapsed:,.0f} playthrough/s, "
+              f"{args.workers or os.cpu_count()} proses)")
+        report(batch, endings)
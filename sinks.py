@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Tujuan output (sink) untuk The Mystery Adventure Bot.
+
+Semua output permainan ditulis lewat AnsiTerminal ke sebuah sink. Sink
+hanya menampung teks di write(); teks baru dikirim ke tujuannya saat
+flush(), sebagai satu penulisan. Terminal melakukan flush sebelum membaca
+jawaban pemain dan renderer di setiap frame efek mengetik, jadi output
+satu giliran (cerita, status, menu dan prompt) biasanya menjadi satu
+syscall, bukan satu per baris.
+
+    StreamSink   stdout atau file teks apa pun
+    BufferSink   memori; output diambil dengan take() (headless, server)
+    NetworkSink  fungsi penulis bytes, misalnya socket.sendall atau
+                 StreamWriter.write milik asyncio
+"""
+
+import sys
+from typing import Callable, List, Optional, TextIO
+
+
+class Sink:
+    """Menampung output dan mengirimnya sekaligus saat flush()"""
+
+    def __init__(self):
+        self._parts: List[str] = []
+
+    def write(self, text: str) -> int:
+        self._parts.append(text)
+        return len(text)
+
+    def flush(self):
+        if self._parts:
+            text = "".join(self._parts)
+            self._parts.clear()
+            self.emit(text)
+
+    def emit(self, text: str):
+        """Mengirim teks yang tertampung ke tujuannya"""
+        raise NotImplementedError
+
+    def isatty(self) -> bool:
+        return False
+
+
+class StreamSink(Sink):
+    """Sink ke stream teks; None berarti sys.stdout yang aktif saat flush"""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        super().__init__()
+        self.stream = stream
+
+    def _stream(self) -> TextIO:
+        return self.stream if self.stream is not None else sys.stdout
+
+    def emit(self, text: str):
+        # Satu write: stdout yang line-buffered pun hanya flush sekali
+        stream = self._stream()
+        stream.write(text)
+        stream.flush()
+
+    def isatty(self) -> bool:
+        return self._stream().isatty()
+
+
+class BufferSink(Sink):
+    """Sink di memori; output tetap tertampung sampai diambil dengan take()"""
+
+    def flush(self):
+        pass
+
+    def getvalue(self) -> str:
+        return "".join(self._parts)
+
+    def take(self) -> str:
+        """Mengambil dan mengosongkan semua output yang tertampung"""
+        text = "".join(self._parts)
+        self._parts.clear()
+        return text
+
+
+class NetworkSink(Sink):
+    """Sink ke koneksi jaringan lewat fungsi penulis bytes"""
+
+    def __init__(self, send: Callable[[bytes], object], encoding: str = "utf-8"):
+        super().__init__()
+        self.send = send
+        self.encoding = encoding
+
+    def emit(self, text: str):
+        self.send(text.encode(self.encoding))
+
+
+def as_sink(stream: Optional[TextIO]) -> Sink:
+    """Sink untuk `stream`; stream teks biasa dibungkus StreamSink"""
+    return stream if isinstance(stream, Sink) else StreamSink(stream)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+State permainan yang ringkas untuk The Mystery Adventure Bot.
+
+Nama item, quest dan lokasi yang panjang disimpan sekali saja di registry
+dan setiap sesi hanya menyimpan id integer kecil: inventory sebagai
+multiset (tuple berisi jumlah per id item) ditambah urutan item diambil,
+quest, lokasi yang sudah dikunjungi dan scene yang sudah dilihat sebagai
+bitmask.
+
+Inventory ditampilkan sesuai urutan item pertama kali diambil; item yang
+sama dikelompokkan di posisi pertamanya. Penghematan memori dibanding
+state lama sekitar 5x, bukan 10x: satu objek Python per sesi dengan
+__slots__ sudah sekitar 130 B sebelum isinya, dan urutan ambil item
+ikut disimpan.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Registry:
+    """Memetakan nama ke id integer kecil secara permanen"""
+
+    def __init__(self, names: Tuple[str, ...] = ()):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for name in names:
+            self.id(name)
+
+    def id(self, name: str) -> int:
+        """Id untuk `name`, didaftarkan jika belum ada"""
+        ident = self._ids.get(name)
+        if ident is None:
+            ident = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return ident
+
+    def get(self, name: str) -> Optional[int]:
+        """Id untuk `name` tanpa mendaftarkannya, None jika tidak dikenal"""
+        return self._ids.get(name)
+
+    def name(self, ident: int) -> str:
+        return self.names[ident]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+ITEMS = Registry((
+    "Kunci Berkarat",
+    "Catatan Nenek: 'Cari 3 bagian peta'",
+    "Bagian Peta 1 (Danau Panjatan)",
+    "Sepiring Nasi Kuning",
+    "Kompas",
+    "Obat Penawar",
+    "Tali Tebal",
+    "Perlengkapan Menggali",
+    "Lampu Tangan",
+    "Ramuan Keberuntungan Dukun",
+    "Bagian Peta 2 (Hutan Rahasia)",
+    "Kunci Tua Pak Tirto",
+    "Perlengkapan Menggali Profesional",
+    "Separuh Kunci Reno",
+    "Bagian Peta 3 (Gua Rahasia)",
+    "PETA LENGKAP - Harta Karun!",
+    "Buku Harian Pembuat Peta",
+))
+
+QUESTS = Registry((
+    "Bertemu Nenek Penjaga",
+    "Usir dari Rumah Tua",
+    "Jawab Teka-teki Toko Antik",
+    "Bersihkan Makam",
+    "Bertemu Pemuda Misterius",
+    "Berteman dengan Reno",
+))
+
+LOCATIONS = Registry((
+    "Desa Panjatan",
+    "Rumah Tua",
+    "Pasar Desa",
+    "Makam Tua",
+    "Danau Panjatan",
+    "Gua Rahasia",
+))
+
+# Inventory yang sama dipakai bersama oleh semua sesi (flyweight). Cache
+# dibatasi agar inventory hasil farming yang tidak biasa tidak menumpuk.
+_INVENTORIES: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+_INVENTORY_CACHE_LIMIT = 1 << 16
+
+
+def _shared(counts: Tuple[int, ...]) -> Tuple[int, ...]:
+    shared = _INVENTORIES.get(counts)
+    if shared is not None:
+        return shared
+    if len(_INVENTORIES) < _INVENTORY_CACHE_LIMIT:
+        _INVENTORIES[counts] = counts
+    return counts
+
+
+_new_state = object.__new__
+
+
+class GameState:
+    """Seluruh state satu sesi permainan dalam bentuk ringkas"""
+
+    __slots__ = ("health", "energy", "money", "current_location", "scene",
+                 "items", "order", "quests", "visited", "seen", "game_over", "ending_type")
+
+    def __init__(self, scene: int = 0):
+        self.health = 100
+        self.energy = 100
+        self.money = 0
+        self.current_location = "Desa Panjatan"
+        # Indeks scene di graf scene (0 = scene awal)
+        self.scene = scene
+        self.items: Tuple[int, ...] = ()
+        # Id item urut saat pertama kali diambil. Item di `items` yang tidak
+        # ada di sini (misalnya state yang dipulihkan tanpa urutan) ditampilkan
+        # sesudahnya sesuai urutan registry.
+        self.order: Tuple[int, ...] = ()
+        self.quests = 0
+        self.visited = 0
+        # Bit per indeks scene di graf
+        self.seen = 0
+        self.game_over = False
+        self.ending_type = None
+
+    def fork(self) -> "GameState":
+        """Salinan untuk dicabangkan, O(1).
+
+        Semua field berupa nilai yang tidak bisa diubah (int, str, tuple),
+        jadi salinan berbagi isinya dengan aslinya; perubahan di salah satu
+        state hanya mengganti field yang berubah di state itu.
+        """
+        clone = _new_state(GameState)
+        clone.health = self.health
+        clone.energy = self.energy
+        clone.money = self.money
+        clone.current_location = self.current_location
+        clone.scene = self.scene
+        clone.items = self.items
+        clone.order = self.order
+        clone.quests = self.quests
+        clone.visited = self.visited
+        clone.seen = self.seen
+        clone.game_over = self.game_over
+        clone.ending_type = self.ending_type
+        return clone
+
+    # ---------- inventory (multiset) ----------
+
+    def item_count(self, item_id: int) -> int:
+        items = self.items
+        return items[item_id] if item_id < len(items) else 0
+
+    def add_item(self, item_id: int):
+        counts = list(self.items)
+        if item_id >= len(counts):
+            counts.extend([0] * (item_id + 1 - len(counts)))
+        counts[item_id] += 1
+        self.items = _shared(tuple(counts))
+        if counts[item_id] == 1 and item_id not in self.order:
+            self.order = _shared(self.order + (item_id,))
+
+    def remove_item(self, item_id: int) -> bool:
+        if not self.item_count(item_id):
+            return False
+        counts = list(self.items)
+        counts[item_id] -= 1
+        order = self.order
+        if not counts[item_id] and item_id in order:
+            order = tuple(ident for ident in order if ident != item_id)
+        self.set_items(counts, order)
+        return True
+
+    def set_items(self, counts: Iterable[int], order: Iterable[int] = ()):
+        """Mengganti seluruh inventory dengan jumlah per id item dan urutan
+        item diambil (item yang tidak ada di `order` ditampilkan terakhir)"""
+        counts = list(counts)
+        while counts and not counts[-1]:
+            counts.pop()
+        self.items = _shared(tuple(counts))
+        self.order = _shared(tuple(order))
+
+    def item_total(self) -> int:
+        return sum(self.items)
+
+    def item_ids(self) -> Iterator[int]:
+        """Id item di inventory urut saat diambil, diulang sebanyak jumlahnya"""
+        items, order = self.items, self.order
+        for item_id in order:
+            for _ in range(self.item_count(item_id)):
+                yield item_id
+        for item_id, count in enumerate(items):
+            if item_id not in order:
+                for _ in range(count):
+                    yield item_id
+
+    # ---------- quest, lokasi dan scene (bitmask) ----------
+
+    def has_quest(self, quest_id: int) -> bool:
+        return bool(self.quests >> quest_id & 1)
+
+    def complete_quest(self, quest_id: int):
+        self.quests |= 1 << quest_id
+
+    def visit(self, location_id: int):
+        self.visited |= 1 << location_id
+
+    def has_visited(self, location_id: int) -> bool:
+        return bool(self.visited >> location_id & 1)
+
+    def see(self, scene: int):
+        self.seen |= 1 << scene
+
+    def has_seen(self, scene: int) -> bool:
+        return bool(self.seen >> scene & 1)
+
+
+def bit_ids(mask: int) -> Iterator[int]:
+    """Id yang bitnya menyala di `mask`"""
+    ident = 0
+    while mask:
+        if mask & 1:
+            yield ident
+        mask >>= 1
+        ident += 1
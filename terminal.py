@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Backend terminal berbasis escape sequence ANSI.
+
+Layar dibersihkan dan kursor dipindahkan dengan escape sequence, tanpa
+menjalankan subprocess `clear`/`cls`. Terminal juga mencatat posisi baris
+dari semua teks yang ditulis lewat dirinya, sehingga region seperti kotak
+status dan menu pilihan bisa digambar ulang di tempat, hanya pada baris
+yang berubah.
+
+Output ditampung oleh sink (lihat sinks.py) dan dikirim saat flush(), yaitu
+sebelum membaca jawaban pemain, sehingga satu giliran menjadi satu penulisan.
+"""
+
+import os
+import shutil
+import sys
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+from sinks import Sink, as_sink
+from textcache import display_width, terminal_locale
+
+CSI = "\x1b["
+CLEAR_SCREEN = CSI + "H" + CSI + "2J"
+CLEAR_LINE = CSI + "2K"
+CLEAR_BELOW = CSI + "J"
+SAVE_CURSOR = "\x1b7"
+RESTORE_CURSOR = "\x1b8"
+
+
+class AnsiTerminal:
+    """Terminal yang membersihkan layar dan menggambar region dengan ANSI"""
+
+    def __init__(self,
+                 stream: Optional[TextIO] = None,
+                 enabled: Optional[bool] = None,
+                 read_line: Callable[[], str] = input):
+        # Sink, atau stream teks yang dibungkus StreamSink (None = sys.stdout)
+        self.sink: Sink = as_sink(stream)
+        # Sumber jawaban pemain, bisa diganti untuk permainan tanpa keyboard
+        self.read_line = read_line
+        # Escape sequence hanya dipakai jika output benar-benar ke terminal
+        self.enabled = self.sink.isatty() if enabled is None else enabled
+        if self.enabled and os.name == 'nt':
+            os.system('')  # mengaktifkan mode VT di konsol Windows, sekali saja
+        self.columns, self.lines = shutil.get_terminal_size() if self.enabled else (80, 24)
+        # Menentukan lebar karakter ambiguous (lihat textcache)
+        self.locale = terminal_locale() if self.enabled else "C"
+        self._row = 0
+        self._col = 0
+        # Nama region -> (baris awal, baris teks, lebar tampilan tiap baris)
+        self._regions: Dict[str, Tuple[int, List[str], List[int]]] = {}
+
+    def _advance(self, text: str):
+        """Memperbarui posisi kursor setelah `text` tampil di layar"""
+        *lines, last = text.split("\n")
+        for line in lines:
+            self._col += display_width(line, self.locale)
+            self._row += max(1, -(-self._col // self.columns))
+            self._col = 0
+        self._col += display_width(last, self.locale)
+
+    def _cursor_row(self) -> int:
+        return self._row + self._col // self.columns
+
+    # ---------- antarmuka stream ----------
+
+    def write(self, text: str) -> int:
+        self.sink.write(text)
+        if self.enabled:
+            self._advance(text)
+        return len(text)
+
+    def flush(self):
+        """Mengirim semua output yang tertampung ke sink"""
+        self.sink.flush()
+
+    def isatty(self) -> bool:
+        return self.enabled
+
+    def input(self, prompt: str = "") -> str:
+        """Membaca satu baris dari pemain"""
+        self.write(prompt)
+        self.flush()
+        line = self.read_line()
+        if self.enabled and self.read_line is input and sys.stdin.isatty():
+            # Ketikan pemain dan ENTER ditampilkan oleh terminal itu sendiri
+            self._advance(line + "\n")
+        return line
+
+    # ---------- layar dan region ----------
+
+    def clear(self):
+        """Membersihkan layar dan memindahkan kursor ke pojok kiri atas"""
+        if self.enabled:
+            self.columns, self.lines = shutil.get_terminal_size()
+            self.sink.write(CLEAR_SCREEN)
+        self._row = self._col = 0
+        self._regions.clear()
+
+    def draw_region(self, name: str, lines: List[str]):
+        """Menggambar region baru di posisi kursor"""
+        if self._col:
+            self.write("\n")
+        self.sink.write("\n".join(lines) + "\n")
+        # Lebar setiap baris diukur sekali di sini, tidak di setiap update_region
+        widths = [display_width(line, self.locale) for line in lines] if self.enabled else []
+        self._regions[name] = (self._row, list(lines), widths)
+        columns = self.columns
+        for width in widths:
+            self._row += max(1, -(-width // columns))
+
+    def _visible_offset(self, name: str) -> Optional[int]:
+        """Jarak baris dari awal region ke kursor, None jika tidak terlihat"""
+        if not self.enabled or name not in self._regions:
+            return None
+        row, lines, widths = self._regions[name]
+        offset = self._cursor_row() - row
+        if offset >= self.lines or max(widths, default=0) >= self.columns:
+            return None
+        return offset
+
+    def update_region(self, name: str, lines: List[str]) -> bool:
+        """Menggambar ulang region di tempat, hanya baris yang berubah.
+
+        Mengembalikan False jika region sudah tidak terlihat atau ukurannya
+        berubah, sehingga pemanggil perlu menggambarnya dari awal.
+        """
+        offset = self._visible_offset(name)
+        if offset is None:
+            return False
+        row, old, widths = self._regions[name]
+        if len(lines) != len(old):
+            return False
+        # Baris dibandingkan utuh; hanya baris yang berubah yang diukur lebarnya
+        changed = [i for i, (new, prev) in enumerate(zip(lines, old)) if new != prev]
+        if not changed:
+            return True
+        widths = list(widths)
+        for i in changed:
+            widths[i] = display_width(lines[i], self.locale)
+            if widths[i] >= self.columns:
+                return False
+        out = [SAVE_CURSOR]
+        for i in changed:
+            out.append(f"{CSI}{offset - i}A\r{CLEAR_LINE}{lines[i]}{RESTORE_CURSOR}")
+        self.sink.write("".join(out))
+        self._regions[name] = (row, list(lines), widths)
+        return True
+
+    def truncate_after(self, name: str) -> bool:
+        """Menghapus semua teks di bawah region dan menaruh kursor di sana"""
+        offset = self._visible_offset(name)
+        if offset is None:
+            return False
+        row, lines, _ = self._regions[name]
+        up = offset - len(lines)
+        self.sink.write((f"{CSI}{up}A" if up > 0 else "") + "\r" + CLEAR_BELOW)
+        self._row, self._col = row + len(lines), 0
+        return True
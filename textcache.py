@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Cache teks cerita yang sudah diformat untuk The Mystery Adventure Bot.
+
+Teks cerita di scenes.py ditulis apa adanya: ada spasi sisa indentasi
+triple-quoted, baris yang lebih panjang dari terminal, dan emoji yang
+tampil dua kolom. Sebelum ditulis, setiap teks dibersihkan dan dibungkus
+sesuai lebar tampilan sebenarnya. Hasilnya disimpan di RenderCache dengan
+kunci (scene, lebar terminal, locale), sehingga kunjungan ulang ke scene
+yang sama (misalnya location_desa_panjatan) tidak memformat apa pun lagi.
+
+Locale ikut menjadi kunci karena terminal dengan locale Asia Timur
+menampilkan karakter "ambiguous" (misalnya garis kotak ┌─┐) dua kolom.
+"""
+
+import locale as _locale
+import os
+import textwrap
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+# Bahasa yang terminalnya menampilkan karakter ambiguous dua kolom
+_WIDE_AMBIGUOUS = ("zh", "ja", "ko")
+# Variation selector-16: karakter sebelumnya ditampilkan sebagai emoji (lebar)
+_EMOJI_PRESENTATION = "\ufe0f"
+_ZERO_WIDTH = {"\u200b", "\u200c", "\u200d", "\ufe0e", _EMOJI_PRESENTATION}
+
+
+def terminal_locale() -> str:
+    """Locale karakter terminal, misalnya "id_ID" atau "C" """
+    name = _locale.getlocale(_locale.LC_CTYPE)[0]
+    if not name:
+        name = (os.environ.get("LC_ALL") or os.environ.get("LC_CTYPE")
+                or os.environ.get("LANG") or "C").split(".")[0]
+    return name
+
+
+def display_width(text: str, locale: str = "C") -> int:
+    """Jumlah kolom terminal yang dipakai `text` (satu baris)"""
+    if text.isascii():
+        return len(text)
+    wide = ("WF", "WFA")[locale[:2] in _WIDE_AMBIGUOUS]
+    width = last = 0
+    for ch in text:
+        if ch in _ZERO_WIDTH or unicodedata.combining(ch):
+            if ch == _EMOJI_PRESENTATION and last == 1:
+                width += 1
+                last = 2
+            continue
+        last = 2 if unicodedata.east_asian_width(ch) in wide else 1
+        width += last
+    return width
+
+
+def pad(text: str, width: int, locale: str = "C") -> str:
+    """Seperti str.ljust, tetapi menurut lebar tampilan"""
+    if text.isascii():
+        return text.ljust(width)
+    return text + " " * (width - display_width(text, locale))
+
+
+def _wrap_line(line: str, width: int, locale: str) -> List[str]:
+    if display_width(line, locale) <= width:
+        return [line]
+    indent = line[:len(line) - len(line.lstrip(" "))]
+    lines, current = [], ""
+    for word in line.split():
+        candidate = f"{current} {word}" if current else indent + word
+        if current and display_width(candidate, locale) > width:
+            lines.append(current)
+            candidate = indent + word
+        current = candidate
+    lines.append(current)
+    return lines
+
+
+def format_block(text: str, width: int, locale: str = "C") -> str:
+    """Teks cerita tanpa indentasi dan spasi sisa, dibungkus di lebar `width`.
+
+    Sisa baris yang dibungkus disambung ke baris berikutnya jika baris itu
+    lanjutan kalimat (diawali huruf kecil), supaya paragraf yang dipotong
+    manual di scenes.py tidak meninggalkan satu kata di barisnya sendiri.
+    """
+    out, carry = [], ""
+    for line in textwrap.dedent(text).split("\n"):
+        line = line.rstrip()
+        if carry:
+            if line[:1].islower():
+                line = f"{carry} {line}"
+            else:
+                out.append(carry)
+            carry = ""
+        wrapped = _wrap_line(line, width, locale)
+        if len(wrapped) > 1 and not line[:1].isspace():
+            carry = wrapped.pop()
+        out.extend(wrapped)
+    if carry:
+        out.append(carry)
+    return "\n".join(out)
+
+
+class RenderCache:
+    """LRU (scene, lebar, locale) -> {teks asli: teks siap tulis}
+
+    Satu cache dipakai bersama oleh semua sesi dalam proses. Kunci scene
+    berupa id scene, jadi graf hasil kompilasi ulang (misalnya di simulator)
+    tetap memakai entri yang sama.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int, str], Dict[str, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def scene(self, scene: str, width: int, locale: str) -> Dict[str, str]:
+        """Teks terformat milik satu scene; entri yang paling lama tidak dipakai dibuang"""
+        key = (scene, width, locale)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._entries[key] = {}
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return entry
+
+    def text(self, scene: str, width: int, locale: str, text: str) -> str:
+        if type(text) is not str:
+            # Teks dari paket aset (assets.PackedText): jika paketnya sudah
+            # memuat versi siap tulis, teks diambil dari mmap tanpa disalin ke cache
+            formatted = text.formatted(width, locale)
+            if formatted is not None:
+                return formatted
+        blocks = self.scene(scene, width, locale)
+        formatted = blocks.get(text)
+        if formatted is None:
+            formatted = blocks[text] = format_block(str(text), width, locale)
+        return formatted
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+# Cache bersama untuk semua sesi
+RENDER_CACHE = RenderCache()
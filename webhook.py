@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+"""
+Adapter webhook HTTP untuk The Mystery Adventure Bot.
+
+Platform chat mengirim setiap pesan pemain sebagai POST JSON:
+
+    POST /webhook  {"player": "id pemain", "choice": "2"}
+
+dan menerima teks giliran berikutnya (cerita, menu dan prompt):
+
+    {"text": "...", "finished": false}
+
+Tanpa "choice", atau untuk pemain yang belum punya permainan, permainan
+baru dimulai (atau menu pilihan saat ini ditampilkan lagi).
+
+Handler tidak menyimpan objek apa pun per pemain di antara request: state
+ringkas pemain (snapshot savegame) dibaca dari PlayerStore, satu giliran
+dimainkan oleh satu bot bersama yang state-nya diganti di setiap request,
+lalu snapshot barunya ditulis kembali. PlayerStore adalah satu database SQLite dalam
+mode WAL yang dibuka sekali; tulisan dikelompokkan dalam satu transaksi
+dan di-commit setiap `max_pending` tulisan atau `max_delay` detik.
+Koneksi HTTP keep-alive dipakai ulang untuk banyak request.
+
+    python webhook.py --port 8080 --db players.db
+    curl -d '{"player": "42"}' localhost:8080/webhook
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from main import MysteryAdventureBot
+from renderer import TypewriterRenderer
+from savegame import SaveError
+from scenegraph import SceneGraph
+from sinks import BufferSink
+from state import GameState
+from terminal import AnsiTerminal
+
+log = logging.getLogger(__name__)
+
+# Batas ukuran body request dan panjang id pemain
+MAX_BODY = 4096
+MAX_PLAYER_ID = 128
+
+# State pengganti di antara request, supaya bot tidak memegang state pemain terakhir
+_NO_PLAYER = GameState()
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 501: "Not Implemented"}
+
+
+class PlayerStore:
+    """Snapshot savegame per pemain di SQLite (WAL) dengan commit berkelompok.
+
+    Semua baca dan tulis memakai satu koneksi, sehingga tulisan yang belum
+    di-commit sudah terlihat oleh request berikutnya. Dengan synchronous=NORMAL
+    commit tidak menunggu fsync: setelah crash proses tidak ada yang hilang,
+    setelah listrik mati giliran terakhir bisa hilang.
+    """
+
+    def __init__(self, path: str, max_pending: int = 256, max_delay: float = 0.05):
+        self.path = path
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        # isolation_level=None: transaksi dibuka dan di-commit sendiri
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS players "
+                         "(id TEXT PRIMARY KEY, state BLOB NOT NULL) WITHOUT ROWID")
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+    def get(self, player: str) -> Optional[bytes]:
+        row = self._db.execute("SELECT state FROM players WHERE id = ?", (player,)).fetchone()
+        return row[0] if row is not None else None
+
+    def put(self, player: str, data: bytes):
+        self._write("INSERT OR REPLACE INTO players (id, state) VALUES (?, ?)", (player, data))
+
+    def delete(self, player: str):
+        self._write("DELETE FROM players WHERE id = ?", (player,))
+
+    def _write(self, sql: str, params: tuple):
+        if not self._db.in_transaction:
+            self._db.execute("BEGIN")
+        self._db.execute(sql, params)
+        self._pending += 1
+        if (self._pending >= self.max_pending
+                or time.monotonic() - self._last_commit >= self.max_delay):
+            self.commit()
+
+    def commit(self):
+        """Meng-commit semua tulisan yang tertunda"""
+        self._last_commit = time.monotonic()
+        if self._db.in_transaction:
+            self._db.execute("COMMIT")
+        self._pending = 0
+
+    def close(self):
+        if self._db is not None:
+            self.commit()
+            self._db.close()
+            self._db = None
+
+
+class TurnHandler:
+    """Memainkan tepat satu giliran seorang pemain dari state di PlayerStore.
+
+    Satu bot dipakai untuk semua pemain: state-nya diganti di setiap giliran
+    dan tidak ada yang tersisa dari pemain sebelumnya selain snapshot di store.
+    """
+
+    def __init__(self, store: PlayerStore, graph: Optional[SceneGraph] = None):
+        self.store = store
+        self._buffer = BufferSink()
+        terminal = AnsiTerminal(self._buffer, enabled=False)
+        self._bot = MysteryAdventureBot(TypewriterRenderer(stream=terminal, instant=True),
+                                        terminal, graph=graph)
+
+    def turn(self, player: str, answer: Optional[str]) -> Tuple[str, bool]:
+        """Mengirim jawaban pemain; mengembalikan (teks giliran berikutnya, permainan selesai)"""
+        bot, buffer = self._bot, self._buffer
+        data = self.store.get(player)
+        if data is not None:
+            try:
+                bot.restore(data)
+            except SaveError:
+                # Snapshot dari versi cerita lain: mulai dari awal
+                data = None
+        if data is None:
+            bot.state = GameState()
+        session = bot.session(resume=data is not None)
+        try:
+            prompt = next(session)
+            if data is not None and answer is not None:
+                # Menu yang digambar ulang saat resume sudah pernah dilihat pemain
+                buffer.take()
+                try:
+                    prompt = session.send(answer)
+                except StopIteration:
+                    bot.show_end_screen()
+                    self.store.delete(player)
+                    return buffer.take(), True
+            snapshot = bot.save()
+            if snapshot != data:
+                self.store.put(player, snapshot)
+            return buffer.take() + prompt, False
+        finally:
+            session.close()
+            bot.state = _NO_PLAYER
+            # Sisa output giliran yang gagal tidak boleh ikut ke pemain berikutnya
+            buffer.take()
+
+
+class WebhookServer:
+    """Server HTTP/1.1 minimal (keep-alive, Content-Length) untuk TurnHandler"""
+
+    def __init__(self, store: PlayerStore, host: str = "127.0.0.1", port: int = 8080,
+                 path: str = "/webhook", graph: Optional[SceneGraph] = None):
+        self.store = store
+        self.handler = TurnHandler(store, graph)
+        self.host = host
+        self.port = port
+        self.path = path
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._committer: Optional[asyncio.Task] = None
+
+    def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Status HTTP dan body JSON untuk satu request"""
+        if path != self.path:
+            return 404, {"error": "tidak ditemukan"}
+        if method != "POST":
+            return 405, {"error": "hanya POST"}
+        try:
+            message = json.loads(body)
+            player = message["player"]
+            choice = message.get("choice")
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return 400, {"error": "body harus JSON {\"player\": ..., \"choice\": ...}"}
+        # bool adalah subclass int, tetapi true/false bukan id pemain
+        if (isinstance(player, bool) or not isinstance(player, (str, int))
+                or not 0 < len(str(player)) <= MAX_PLAYER_ID):
+            return 400, {"error": "id pemain tidak valid"}
+        self.requests += 1
+        try:
+            text, finished = self.handler.turn(str(player),
+                                               None if choice is None else str(choice))
+        except Exception:
+            # Snapshot pemain di store tidak berubah, jadi request berikutnya
+            # mengulang giliran dari state terakhir yang berhasil disimpan
+            log.exception("giliran pemain %r gagal", player)
+            return 500, {"error": "kesalahan server"}
+        return 200, {"text": text, "finished": finished}
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter):
+        """Melayani request berurutan di satu koneksi sampai ditutup"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError as error:
+                    if error.partial.strip():
+                        raise
+                    return
+                request_line, *lines = head.decode("latin-1").split("\r\n")
+                method, path, version = request_line.split()
+                headers = {}
+                for line in lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = (version == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                length = int(headers.get("content-length", 0))
+                if "transfer-encoding" in headers:
+                    status, payload, keep_alive = 501, {"error": "pakai Content-Length"}, False
+                elif not 0 <= length <= MAX_BODY:
+                    status, payload, keep_alive = 413, {"error": "body terlalu besar"}, False
+                else:
+                    status, payload = self.dispatch(method, path.split("?")[0],
+                                                    await reader.readexactly(length))
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    .encode("latin-1") + body)
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # ValueError: request line atau header rusak, baris terlalu panjang
+            pass
+        finally:
+            writer.close()
+
+    async def commit_store(self):
+        """Commit berkala supaya tulisan terakhir tidak tertahan saat server sepi"""
+        while True:
+            await asyncio.sleep(self.store.max_delay)
+            self.store.commit()
+
+    async def start(self, backlog: int = 1024) -> asyncio.AbstractServer:
+        self._server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port, backlog=backlog)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._committer = asyncio.create_task(self.commit_store())
+        return self._server
+
+    async def serve_forever(self):
+        server = await self.start()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self._committer.cancel()
+            self.store.commit()
+
+
+class WebhookClient:
+    """Klien pengganti platform chat: satu koneksi keep-alive ke webhook"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080, path: str = "/webhook"):
+        self.host = host
+        self.port = port
+        self.path = path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def connect(self):
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def send(self, player: str, choice: Optional[str] = None) -> Dict[str, Any]:
+        """Mengirim satu pesan pemain dan mengembalikan body JSON balasannya"""
+        if self._writer is None:
+            await self.connect()
+        message = {"player": player} if choice is None else {"player": player, "choice": choice}
+        body = json.dumps(message).encode("utf-8")
+        self._writer.write(
+            f"POST {self.path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+            .encode("latin-1") + body)
+        head = (await self._reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        status_line, *lines = head.split("\r\n")
+        status = int(status_line.split()[1])
+        length = 0
+        for line in lines:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        reply = json.loads(await self._reader.readexactly(length))
+        if status != 200:
+            raise RuntimeError(f"webhook {status}: {reply.get('error')}")
+        return reply
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Webhook HTTP The Mystery Adventure Bot")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--path", default="/webhook")
+    parser.add_argument("--db", default="players.db", help="database SQLite state pemain")
+    args = parser.parse_args()
+
+    store = PlayerStore(args.db)
+    try:
+        asyncio.run(WebhookServer(store, args.host, args.port, args.path).serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()